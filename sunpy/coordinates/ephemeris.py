@@ -15,20 +15,27 @@ from astropy.coordinates.representation import CartesianRepresentation, Spherica
 from astropy._erfa.core import ErfaWarning
 
 from sunpy.time import parse_time
+from sunpy.time.time import _lru_cache_on_time
 
 from .frames import HeliographicStonyhurst as HGS
 from .transformations import _SUN_DETILT_MATRIX
 
 __all__ = ['get_body_heliographic_stonyhurst', 'get_earth',
            'get_sun_B0', 'get_sun_L0', 'get_sun_P', 'get_sunearth_distance',
-           'get_sun_orientation']
+           'get_sun_orientation', 'preload_ephemeris_cache']
 
+# The number of recent times the ephemeris functions cache results for
+EPHEMERIS_CACHE_SIZE = 4096
 
+
+@_lru_cache_on_time(maxsize=EPHEMERIS_CACHE_SIZE)
 def get_body_heliographic_stonyhurst(body, time='now'):
     """
     Return a `~sunpy.coordinates.frames.HeliographicStonyhurst` frame for the location of a
     solar-system body at a specified time.
 
+    The location at recent scalar times is cached.
+
     Parameters
     ----------
     body : `str`
@@ -49,11 +56,15 @@ def get_body_heliographic_stonyhurst(body, time='now'):
     return body_hgs
 
 
+@_lru_cache_on_time(maxsize=EPHEMERIS_CACHE_SIZE)
 def get_earth(time='now'):
     """
     Return a `~astropy.coordinates.SkyCoord` for the location of the Earth at a specified time in
     the `~sunpy.coordinates.frames.HeliographicStonyhurst` frame.  The longitude will be 0 by definition.
 
+    The location at recent scalar times is cached, so `get_sun_B0`, `get_sun_L0` and
+    `get_sunearth_distance` at the same time share one calculation.
+
     Parameters
     ----------
     time : various
@@ -72,6 +83,34 @@ def get_earth(time='now'):
     return earth
 
 
+def preload_ephemeris_cache(times):
+    """
+    Fill the caches of `get_earth`, `get_sun_L0` and `get_sun_P` for many times with one
+    vectorised calculation each.
+
+    Later calls of these functions (and of `get_sun_B0` and `get_sunearth_distance`) at any
+    one of the times then don't repeat the calculation.  Only the most recent
+    ``EPHEMERIS_CACHE_SIZE`` times are kept.
+
+    Parameters
+    ----------
+    times : `~astropy.time.Time` or list
+        The times, as `~astropy.time.Time` or in a parse_time-compatible format.  The cached
+        values are found for times with the same value, scale and format.
+
+    Examples
+    --------
+    Cache the Earth-based observer used when map headers lack observer keywords for all the
+    maps of a sequence
+
+    >>> from sunpy.coordinates.ephemeris import preload_ephemeris_cache
+    >>> preload_ephemeris_cache([m.date for m in mapsequence])  # doctest: +SKIP
+    """
+    times = parse_time(times)
+    for func in (get_earth, get_sun_L0, get_sun_P):
+        func.cache_preload(times)
+
+
 def get_sun_B0(time='now'):
     """
     Return the B0 angle for the Sun at a specified time, which is the heliographic latitude of the
@@ -104,6 +143,7 @@ with warnings.catch_warnings():
         .represent_as(SphericalRepresentation).lon.to('deg')
 
 
+@_lru_cache_on_time(maxsize=EPHEMERIS_CACHE_SIZE)
 def get_sun_L0(time='now'):
     """
     Return the L0 angle for the Sun at a specified time, which is the Carrington longitude of the
@@ -139,6 +179,7 @@ def get_sun_L0(time='now'):
     return Longitude(lon_obstime - _lon_first_rotation - sidereal_lon)
 
 
+@_lru_cache_on_time(maxsize=EPHEMERIS_CACHE_SIZE)
 def get_sun_P(time='now'):
     """
     Return the position (P) angle for the Sun at a specified time, which is the angle between
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import datetime
 
-import astropy.units as u
 from astropy.time import Time
 from astropy.coordinates import TimeAttribute, CoordinateAttribute
 
@@ -112,17 +111,13 @@ class ObserverCoordinateAttribute(CoordinateAttribute):
         """
 
         # Import here to prevent circular import
-        from .frames import HeliographicStonyhurst
-        from .ephemeris import get_body_heliographic_stonyhurst
-
-        obscoord = get_body_heliographic_stonyhurst(out, obstime)
+        from .ephemeris import get_earth, get_body_heliographic_stonyhurst
 
+        # Both are cached for recent times
         if out == "earth":
-            rep = obscoord.spherical
-            rep.lon[()] = 0*u.deg
-            obscoord = obscoord.realize_frame(rep)
+            return get_earth(obstime).frame
 
-        return obscoord
+        return get_body_heliographic_stonyhurst(out, obstime)
 
     def __get__(self, instance, frame_cls=None):
         # If instance is None then we can't get obstime so it doesn't matter.
@@ -93,3 +93,30 @@ def test_get_sun_orientation():
     # Check the Southern Hemisphere
     angle = get_sun_orientation(EarthLocation(lat=-40*u.deg, lon=-75*u.deg), '2017-02-18 13:00')
     assert_quantity_allclose(angle, -110.8*u.deg, atol=0.1*u.deg)
+
+
+def test_cached_ephemeris():
+    get_sun_L0.cache_clear()
+    l0 = get_sun_L0(Time('2013-01-01'))
+    # A copy of the cached value is returned
+    l0[...] = 0*u.deg
+    assert get_sun_L0(Time('2013-01-01')) != 0*u.deg
+    assert get_sun_L0.cache_info().hits == 1
+    # Times with a location are not cached
+    location = EarthLocation(lat=0*u.deg, lon=0*u.deg, height=0*u.m)
+    get_sun_L0(Time('2013-01-01', location=location))
+    assert get_sun_L0.cache_info().currsize == 1
+
+
+def test_preload_ephemeris_cache():
+    times = Time(['2013-01-01', '2013-06-01', '2013-12-01'])
+    expected = [(get_earth(t), get_sun_L0(t), get_sun_P(t)) for t in times]
+    for func in (get_earth, get_sun_L0, get_sun_P):
+        func.cache_clear()
+    preload_ephemeris_cache(times)
+    for t, (earth, L0, P) in zip(times, expected):
+        assert_quantity_allclose(get_earth(t).lat, earth.lat)
+        assert_quantity_allclose(get_earth(t).radius, earth.radius)
+        assert_quantity_allclose(get_sun_L0(t), L0)
+        assert_quantity_allclose(get_sun_P(t), P)
+    assert get_earth.cache_info().misses == 0
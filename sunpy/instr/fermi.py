@@ -134,40 +134,30 @@ def get_detector_sun_angles_for_date(date, file):
 
     date = parse_time(date)
     tran = TimeRange(date, date + TimeDelta(1*u.day))
-    scx, scz, times = get_scx_scz_in_timerange(tran, file)
+    scx, scz, times = _get_scx_scz_arrays_in_timerange(tran, file)
 
     # retrieve the detector angle information in spacecraft coordinates
     detectors = nai_detector_angles()
 
-    detector_to_sun_angles = []
-    # get the detector vs Sun angles for each t and store in a list of
-    # dictionaries.
-    for i in range(len(scx)):
-        detector_radecs = nai_detector_radecs(detectors, scx[i], scz[i],
-                                              times[i])
-
-        # this gets the sun position with RA in hours in decimal format
-        # (e.g. 4.3). DEC is already in degrees
-        sunpos_ra_not_in_deg = [sun.sun.apparent_rightascension(times[i]),
-                                sun.sun.apparent_declination(times[i])]
-        # now Sun position with RA in degrees
-        sun_pos = [sunpos_ra_not_in_deg[0].to('deg'), sunpos_ra_not_in_deg[1]]
-        # now get the angle between each detector and the Sun
-        detector_to_sun_angles.append(
-            get_detector_separation_angles(detector_radecs, sun_pos))
-
-    # slice the list of dictionaries to get the angles for each detector in a
-    # list form
+    # get the detector pointings in RA/DEC for all the times at once
+    detector_radecs = nai_detector_radecs(detectors, scx, scz, times)
+
+    # this gets the sun positions with RA in hours in decimal format
+    # (e.g. 4.3). DEC is already in degrees
+    sunpos_ra_not_in_deg = [sun.sun.apparent_rightascension(times),
+                            sun.sun.apparent_declination(times)]
+    # now Sun positions with RA in degrees
+    sun_pos = [sunpos_ra_not_in_deg[0].to('deg'), sunpos_ra_not_in_deg[1]]
+    # now get the angles between each detector and the Sun
+    detector_to_sun_angles = get_detector_separation_angles(detector_radecs,
+                                                            sun_pos)
+
     angles = OrderedDict()
     key_list = ['n0', 'n1', 'n2', 'n3', 'n4', 'n5', 'n6', 'n7', 'n8', 'n9',
-                'n10', 'n11', 'time']
-    for i in range(13):
-        if not key_list[i] == 'time':
-            angles[key_list[i]] = [item[key_list[i]].value
-                                   for item in detector_to_sun_angles] * u.deg
-        else:
-            angles[key_list[i]] = [item[key_list[i]]
-                                   for item in detector_to_sun_angles]
+                'n10', 'n11']
+    for key in key_list:
+        angles[key] = detector_to_sun_angles[key].to(u.deg)
+    angles['time'] = list(times)
 
     return angles
 
@@ -220,17 +210,16 @@ def get_scx_scz_at_time(time, file):
 
     time = parse_time(time)
     hdulist = fits.open(file)
-    timesinutc = []
-    for tim in hdulist[1].data['START']:
-        timesinutc.append(met_to_utc(tim))
-    ind = np.searchsorted(timesinutc, time)
+    # the pointing times are in increasing order, so search in MET
+    met = hdulist[1].data['START']
+    ind = np.searchsorted(met, utc_to_met(time).value)
 
-    scx_radec = (Longitude(hdulist[1].data['RA_SCX'][ind] * u.deg),
-                 Latitude(hdulist[1].data['DEC_SCX'][ind] * u.deg))
-    scz_radec = (Longitude(hdulist[1].data['RA_SCZ'][ind] * u.deg),
-                 Latitude(hdulist[1].data['DEC_SCZ'][ind] * u.deg))
+    scx_radec = (Longitude(float(hdulist[1].data['RA_SCX'][ind]) * u.deg),
+                 Latitude(float(hdulist[1].data['DEC_SCX'][ind]) * u.deg))
+    scz_radec = (Longitude(float(hdulist[1].data['RA_SCZ'][ind]) * u.deg),
+                 Latitude(float(hdulist[1].data['DEC_SCZ'][ind]) * u.deg))
 
-    return scx_radec, scz_radec, timesinutc[ind]
+    return scx_radec, scz_radec, met_to_utc(met[ind])
 
 
 def get_scx_scz_in_timerange(timerange, file):
@@ -248,22 +237,31 @@ def get_scx_scz_in_timerange(timerange, file):
         download_weekly_pointing_file function).
     """
 
-    hdulist = fits.open(file)
-    timesinutc = []
-    for tim in hdulist[1].data['START']:
-        timesinutc.append(met_to_utc(tim))
+    scx, scz, times = _get_scx_scz_arrays_in_timerange(timerange, file)
+    scx_radec = list(zip(*scx))
+    scz_radec = list(zip(*scz))
+    return scx_radec, scz_radec, list(times)
 
-    startind = np.searchsorted(timesinutc, timerange.start)
-    endind = np.searchsorted(timesinutc, timerange.end)
 
-    scx_radec = []
-    scz_radec = []
-    for i in range(startind, endind):
-        scx_radec.append((Longitude(hdulist[1].data['RA_SCX'][i] * u.deg),
-                          Latitude(hdulist[1].data['DEC_SCX'][i] * u.deg)))
-        scz_radec.append((Longitude(hdulist[1].data['RA_SCZ'][i] * u.deg),
-                          Latitude(hdulist[1].data['DEC_SCZ'][i] * u.deg)))
-    return scx_radec, scz_radec, timesinutc[startind:endind]
+def _get_scx_scz_arrays_in_timerange(timerange, file):
+    """
+    Like `get_scx_scz_in_timerange` but returns the RA/DEC of the spacecraft
+    axes as tuples of `~astropy.coordinates.Longitude` and
+    `~astropy.coordinates.Latitude` arrays and the times as an
+    `~astropy.time.Time` array.
+    """
+    hdulist = fits.open(file)
+    # the pointing times are in increasing order, so search in MET
+    met = hdulist[1].data['START']
+    startind = np.searchsorted(met, utc_to_met(timerange.start).value)
+    endind = np.searchsorted(met, utc_to_met(timerange.end).value)
+
+    data = hdulist[1].data[startind:endind]
+    scx_radec = (Longitude(data['RA_SCX'].astype(float) * u.deg),
+                 Latitude(data['DEC_SCX'].astype(float) * u.deg))
+    scz_radec = (Longitude(data['RA_SCZ'].astype(float) * u.deg),
+                 Latitude(data['DEC_SCZ'].astype(float) * u.deg))
+    return scx_radec, scz_radec, met_to_utc(data['START'])
 
 
 def nai_detector_angles():
@@ -307,7 +305,8 @@ def nai_detector_radecs(detectors, scx, scz, time):
         to the spacecraft axes. Obtained from the nai_detector_angles function.
     scx : array-like
         Two-element tuple containing the RA/DEC information of the Fermi
-        spacecraft X-axis
+        spacecraft X-axis. The RA and DEC can be arrays to find the detector
+        pointings at many times at once.
     scz : array-like
         Two-element tuple containing the RA/DEC information of the Fermi
         spacecraft Z-axis
@@ -319,7 +318,7 @@ def nai_detector_radecs(detectors, scx, scz, time):
     -------
     `dict`
         A dictionary containing the RA/DEC for each Fermi/GBM NaI detector at
-        the given input time.
+        the given input time(s).
     """
 
     scx_vector = (np.array(
@@ -343,7 +342,7 @@ def nai_detector_radecs(detectors, scx, scz, time):
         vx_primed = rotate_vector(scx_vector, scz_vector, np.deg2rad(phi))
 
         # now find spacecraft y-axis using cross product
-        vy_primed = np.cross(scz_vector, vx_primed)
+        vy_primed = np.cross(scz_vector, vx_primed, axis=0)
 
         # do the second part of the rotation around vy
         vz_primed = rotate_vector(scz_vector, vy_primed, np.deg2rad(theta))
@@ -367,9 +366,10 @@ def rotate_vector(vector, axis, theta):
     Parameters
     ----------
     vector : `numpy.ndarray`
-          a three-element vector to be rotated
+          a three-element vector to be rotated, or a (3, N) array of vectors
     axis : `numpy.ndarray`
-          the the-element vector to rotate around
+          the the-element vector to rotate around, or a (3, N) array of
+          axes for each vector
     theta : `float`
           the angle (in radians) by which to rotate vector around axis
 
@@ -378,7 +378,7 @@ def rotate_vector(vector, axis, theta):
     http://en.wikipedia.org/wiki/Euler-Rodrigues_parameters#Rotation_angle_and_rotation_axis
     """
 
-    axis = axis / np.sqrt(np.dot(axis, axis))
+    axis = axis / np.sqrt(np.sum(axis * axis, axis=0))
     a = np.cos(theta / 2)
     b, c, d = -axis * np.sin(theta / 2)
 
@@ -389,7 +389,7 @@ def rotate_vector(vector, axis, theta):
          [2 * (b * d + a * c), 2 * (c * d - a * b), a * a + d * d - b * b - c *
           c]])
 
-    return np.dot(rot_matrix, vector)
+    return np.einsum('ij...,j...->i...', rot_matrix, vector)
 
 
 def get_detector_separation_angles(detector_radecs, sunpos):
@@ -91,6 +91,10 @@ FILE_EM_COR = "goes_chianti_em_cor.csv"
 FILE_EM_PHO = "goes_chianti_em_pho.csv"
 FILE_RAD_COR = "chianti7p1_rad_loss.txt"
 
+# In-process cache of the CHIANTI model tables and their spline fits, keyed
+# by file path.
+_chianti_tables = {}
+
 
 def get_goes_event_list(timerange, goes_class_filter=None):
     """
@@ -162,9 +166,10 @@ def calculate_temperature_em(goests, abundances="coronal",
 
     Parameters
     ----------
-    goeslc : `~sunpy.timeseries.XRSTimeSeries`
+    goeslc : `~sunpy.timeseries.XRSTimeSeries` or `list`
         LightCurve object containing GOES flux data which MUST
-        be in units of W/m^2.
+        be in units of W/m^2.  A list of timeseries is processed in one
+        batch, interpolating the model tables once per satellite.
 
     abundances : (optional) string equalling 'coronal' or 'photospheric'
         States whether photospheric or coronal abundances should be
@@ -185,9 +190,10 @@ def calculate_temperature_em(goests, abundances="coronal",
 
     Returns
     -------
-    ts_new : `~sunpy.timeseries.XRSTimeSeries`
+    ts_new : `~sunpy.timeseries.XRSTimeSeries` or `list`
         Contains same metadata and data as input timeseries with the
-        following two additional data columns:
+        following two additional data columns, or a list of these if a
+        list of timeseries was given:
 
         | ts_new.data.temperature - Array of temperatures [MK]
         | ts_new.data.em - Array of volume emission measures [cm**-3]
@@ -249,26 +255,43 @@ def calculate_temperature_em(goests, abundances="coronal",
 
     """
     # Check that input argument is of correct type
-    if not isinstance(goests, timeseries.XRSTimeSeries):
-        raise TypeError("goests must be a XRSTimeSeries object")
+    goests_list = _as_xrs_list(goests)
     if not download_dir:
         download_dir = get_and_create_download_dir()
 
-    # Find temperature and emission measure with _goes_chianti_tem
-    temp, em = _goes_chianti_tem(
-        goests.quantity("xrsb"),
-        goests.quantity("xrsa"),
-        satellite=goests.meta.metas[0]["TELESCOP"].split()[1],
-        date=goests.data.index[0],
+    # Find temperature and emission measure with _goes_chianti_tem_batch
+    temps, ems = _goes_chianti_tem_batch(
+        [(ts.quantity("xrsb"), ts.quantity("xrsa"),
+          ts.meta.metas[0]["TELESCOP"].split()[1], ts.data.index[0])
+         for ts in goests_list],
         abundances=abundances, download=download, download_dir=download_dir)
 
-    ts_new = timeseries.XRSTimeSeries(meta=copy.deepcopy(goests.meta),
-                                      data=copy.deepcopy(goests.data),
-                                      units=copy.deepcopy(goests.units))
-    ts_new = ts_new.add_column("temperature", temp)
-    ts_new = ts_new.add_column("em", em)
+    ts_news = []
+    for ts, temp, em in zip(goests_list, temps, ems):
+        ts_new = timeseries.XRSTimeSeries(meta=copy.deepcopy(ts.meta),
+                                          data=copy.deepcopy(ts.data),
+                                          units=copy.deepcopy(ts.units))
+        ts_new = ts_new.add_column("temperature", temp)
+        ts_new = ts_new.add_column("em", em)
+        ts_news.append(ts_new)
 
-    return ts_new
+    if isinstance(goests, timeseries.XRSTimeSeries):
+        return ts_news[0]
+    return ts_news
+
+
+def _as_xrs_list(goests):
+    """
+    Returns a list of the `~sunpy.timeseries.XRSTimeSeries` given either one
+    of them or a non-empty list of them, raising a `TypeError` otherwise.
+    """
+    if isinstance(goests, timeseries.XRSTimeSeries):
+        return [goests]
+    if (not isinstance(goests, (list, tuple)) or not goests or
+            not all(isinstance(ts, timeseries.XRSTimeSeries) for ts in goests)):
+        raise TypeError("goests must be a XRSTimeSeries object or a "
+                        "non-empty list of XRSTimeSeries objects.")
+    return list(goests)
 
 
 @u.quantity_input
@@ -372,6 +395,79 @@ def _goes_chianti_tem(longflux: u.W/u.m/u.m, shortflux: u.W/u.m/u.m, satellite=8
     """
     if not download_dir:
         download_dir = get_and_create_download_dir()
+    longflux_corrected, fluxratio = _goes_prepare_fluxes(longflux, shortflux,
+                                                         satellite, date)
+    satellite = int(satellite)
+
+    # FIND TEMPERATURE AND EMISSION MEASURE FROM FUNCTIONS BELOW
+    temp = _goes_get_chianti_temp(fluxratio, satellite=satellite,
+                                  abundances=abundances, download=download,
+                                  download_dir=download_dir)
+    em = _goes_get_chianti_em(longflux_corrected, temp, satellite=satellite,
+                              abundances=abundances, download=download,
+                              download_dir=download_dir)
+    return temp, em
+
+
+def _goes_chianti_tem_batch(fluxes, abundances="coronal", download=False,
+                            download_dir=None):
+    """
+    Calculates temperature and emission measure for many sets of GOES fluxes.
+
+    The fluxes of each satellite are joined so the CHIANTI model tables are
+    interpolated once per satellite rather than once per set of fluxes.
+
+    Parameters
+    ----------
+    fluxes : `list` of `tuple`
+        ``(longflux, shortflux, satellite, date)`` for each set of fluxes,
+        as passed to `~sunpy.instr.goes._goes_chianti_tem`.
+
+    abundances, download, download_dir :
+        See `~sunpy.instr.goes._goes_chianti_tem`.
+
+    Returns
+    -------
+    temps, ems : `list` of `~astropy.units.Quantity`
+        The temperature [MK] and emission measure [cm**-3] of each set of
+        fluxes.
+    """
+    if not download_dir:
+        download_dir = get_and_create_download_dir()
+    prepared = []
+    groups = {}
+    for i, (longflux, shortflux, satellite, date) in enumerate(fluxes):
+        prepared.append(_goes_prepare_fluxes(longflux, shortflux, satellite, date))
+        groups.setdefault(int(satellite), []).append(i)
+
+    temps = [None] * len(prepared)
+    ems = [None] * len(prepared)
+    for satellite, indices in groups.items():
+        longflux = u.Quantity(np.concatenate([prepared[i][0].value for i in indices]),
+                              unit=u.W/u.m/u.m)
+        fluxratio = u.Quantity(np.concatenate([prepared[i][1].value for i in indices]))
+        temp = _goes_get_chianti_temp(fluxratio, satellite=satellite,
+                                      abundances=abundances, download=download,
+                                      download_dir=download_dir)
+        em = _goes_get_chianti_em(longflux, temp, satellite=satellite,
+                                  abundances=abundances, download=download,
+                                  download_dir=download_dir)
+        start = 0
+        for i in indices:
+            stop = start + len(prepared[i][0])
+            temps[i] = temp[start:stop]
+            ems[i] = em[start:stop]
+            start = stop
+    return temps, ems
+
+
+@u.quantity_input
+def _goes_prepare_fluxes(longflux: u.W/u.m/u.m, shortflux: u.W/u.m/u.m, satellite, date):
+    """
+    Corrects GOES fluxes as described in the Notes of
+    `~sunpy.instr.goes._goes_chianti_tem`, returning the corrected long
+    channel flux and the short to long channel flux ratio.
+    """
     # ENSURE INPUTS ARE OF CORRECT TYPE AND VALID VALUES
     longflux = longflux.to(u.W/u.m/u.m)
     shortflux = shortflux.to(u.W/u.m/u.m)
@@ -407,15 +503,7 @@ def _goes_chianti_tem(longflux: u.W/u.m/u.m, shortflux: u.W/u.m/u.m, satellite=8
         longflux_corrected < u.Quantity(3e-8, unit="W/m**2"))
     fluxratio = shortflux_corrected / longflux_corrected
     fluxratio.value[index] = u.Quantity(0.003, unit="W/m**2")
-
-    # FIND TEMPERATURE AND EMISSION MEASURE FROM FUNCTIONS BELOW
-    temp = _goes_get_chianti_temp(fluxratio, satellite=satellite,
-                                  abundances=abundances, download=download,
-                                  download_dir=download_dir)
-    em = _goes_get_chianti_em(longflux_corrected, temp, satellite=satellite,
-                              abundances=abundances, download=download,
-                              download_dir=download_dir)
-    return temp, em
+    return longflux_corrected, fluxratio
 
 
 @u.quantity_input
@@ -531,23 +619,14 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
         raise ValueError("abundances must be a string equalling "
                          "'coronal' or 'photospheric'.")
 
-    # Initialize lists to hold model data of flux ratio - temperature
-    # relationship read in from csv file
-    modeltemp = []  # modelled temperature is in log_10 space in units of MK
-    modelratio = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = "ratioGOES{0}".format(satellite)
-    # Read data representing appropriate temperature--flux ratio
+    # Get the model data representing appropriate temperature--flux ratio
     # relationship depending on satellite number and assumed abundances.
-    with open(os.path.join(get_and_create_download_dir(), data_file), "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelratio.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelratio = np.asarray(modelratio)
+    # Modelled temperature is in log_10 space in units of MK.
+    modelratio, modeltemp, spline = _get_chianti_spline(
+        os.path.join(download_dir, data_file), label, "log10temp_MK")
 
     # Ensure input values of flux ratio are within limits of model table
     if np.min(fluxratio) < np.min(modelratio) or \
@@ -559,7 +638,6 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
 
     # Perform spline fit to model data to get temperatures for input
     # values of flux ratio
-    spline = interpolate.splrep(modelratio, modeltemp, s=0)
     temp = 10.**interpolate.splev(fluxratio.value, spline, der=0)
     temp = u.Quantity(temp, unit='MK')
 
@@ -694,24 +772,15 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
         raise ValueError("longflux and temp must have same number of "
                          "elements.")
 
-    # Initialize lists to hold model data of temperature - long channel
-    # flux relationship read in from csv file.
-    modeltemp = []   # modelled temperature is in log_10 space in units of MK
-    modelflux = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = "longfluxGOES{0}".format(satellite)
 
-    # Read data representing appropriate temperature--long flux
+    # Get the model data representing appropriate temperature--long flux
     # relationship depending on satellite number and assumed abundances.
-    with open(os.path.join(get_and_create_download_dir(), data_file), "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelflux.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelflux = np.asarray(modelflux)
+    # Modelled temperature is in log_10 space in units of MK.
+    modeltemp, modelflux, spline = _get_chianti_spline(
+        os.path.join(download_dir, data_file), "log10temp_MK", label)
 
     # Ensure input values of flux ratio are within limits of model table
     if np.min(log10_temp) < np.min(modeltemp) or \
@@ -722,7 +791,6 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
                                                 np.max(10**modeltemp)))
 
     # Perform spline fit to model data
-    spline = interpolate.splrep(modeltemp, modelflux, s=0)
     denom = interpolate.splev(log10_temp, spline, der=0)
     em = longflux.value/denom * 1e55
     em = u.Quantity(em, unit='cm**(-3)')
@@ -752,12 +820,13 @@ def calculate_radiative_loss_rate(goests, force_download=False,
 
     Parameters
     ----------
-    goests : `~sunpy.timeseries.XRSTimeSeries`
+    goests : `~sunpy.timeseries.XRSTimeSeries` or `list`
         TimeSeries object containing GOES data.  The units of these
         data MUST be W/m^2 (flux), MK (temperature) and cm^-3
         (emission measure).  If LightCurve object does not contain
         temperature and emission measure values, they are calculated from
-        the flux values using calculate_temperature_em().
+        the flux values using calculate_temperature_em().  A list of
+        timeseries is processed in one batch.
 
     force_download : (optional) `bool`
         If True, the GOES radiative loss data file is downloaded even if
@@ -772,9 +841,10 @@ def calculate_radiative_loss_rate(goests, force_download=False,
 
     Returns
     -------
-    ts_new : `~sunpy.timeseries.XRSTimeSeries`
+    ts_new : `~sunpy.timeseries.XRSTimeSeries` or `list`
         Contains same metadata and data as input LightCurve with the
-        following additional data columns:
+        following additional data columns, or a list of these if a list of
+        timeseries was given:
 
         | ts_new.data.temperature - Array of temperature values [MK]
         | ts_new.data.em - Array of volume emission measure values [cm**-3]
@@ -828,34 +898,47 @@ def calculate_radiative_loss_rate(goests, force_download=False,
     if not download_dir:
         download_dir = get_and_create_download_dir()
     # Check that input argument is of correct type
-    if not isinstance(goests, timeseries.XRSTimeSeries):
-        raise TypeError("goests must be a XRSTimeSeries object.")
+    goests_list = _as_xrs_list(goests)
 
     # extract temperature and emission measure from GOESLightCurve
     # object and change type to that required by _calc_rad_loss().
     # If LightCurve object does not contain temperature and
     # emission measure, calculate using calculate_temperature_em()
-    if 'temperature' in goests.columns and 'em' in goests.columns:
-        # Use copy.deepcopy for replicating meta and data so that input
-        # lightcurve is not altered.
-        ts_new = timeseries.XRSTimeSeries(meta=copy.deepcopy(goests.meta),
-                                          data=copy.deepcopy(goests.data),
-                                          units=copy.deepcopy(goests.units))
-    else:
-        ts_new = calculate_temperature_em(goests)
-    temp = u.Quantity(np.asarray(ts_new.data.temperature, dtype=np.float64),
-                      unit=u.MK)
-    em = u.Quantity(np.asarray(ts_new.data.em, dtype=np.float64),
-                    unit=u.cm**(-3))
+    ts_news = [None] * len(goests_list)
+    no_tem = []
+    for i, ts in enumerate(goests_list):
+        if 'temperature' in ts.columns and 'em' in ts.columns:
+            # Use copy.deepcopy for replicating meta and data so that input
+            # lightcurve is not altered.
+            ts_news[i] = timeseries.XRSTimeSeries(meta=copy.deepcopy(ts.meta),
+                                                  data=copy.deepcopy(ts.data),
+                                                  units=copy.deepcopy(ts.units))
+        else:
+            no_tem.append(i)
+    if no_tem:
+        for i, ts_new in zip(no_tem, calculate_temperature_em(
+                [goests_list[i] for i in no_tem])):
+            ts_news[i] = ts_new
+    temp = u.Quantity(np.concatenate([np.asarray(ts_new.data.temperature, dtype=np.float64)
+                                      for ts_new in ts_news]), unit=u.MK)
+    em = u.Quantity(np.concatenate([np.asarray(ts_new.data.em, dtype=np.float64)
+                                    for ts_new in ts_news]), unit=u.cm**(-3))
 
     # Find radiative loss rate with _calc_rad_loss()
     rad_loss_out = _calc_rad_loss(temp, em, force_download=force_download,
                                   download_dir=download_dir)
 
     # Enter results into new version of GOES LightCurve Object
-    ts_new = ts_new.add_column("rad_loss_rate", rad_loss_out['rad_loss_rate'].to("W"))
+    rad_loss_rate = rad_loss_out['rad_loss_rate'].to("W")
+    start = 0
+    for i, ts_new in enumerate(ts_news):
+        stop = start + len(ts_new.data)
+        ts_news[i] = ts_new.add_column("rad_loss_rate", rad_loss_rate[start:stop])
+        start = stop
 
-    return ts_new
+    if isinstance(goests, timeseries.XRSTimeSeries):
+        return ts_news[0]
+    return ts_news
 
 
 @u.quantity_input
@@ -953,22 +1036,9 @@ def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
     check_download_file(FILE_RAD_COR, GOES_REMOTE_PATH, download_dir,
                         replace=force_download)
 
-    # Initialize lists to hold model data of temperature - rad loss rate
-    # relationship read in from csv file
-    modeltemp = []    # modelled temperature is in log_10 space in units of MK
-    model_loss_rate = []
-
-    # Read data from csv file into lists, being sure to skip commented
-    # lines beginning with "#"
-    with open(os.path.join(get_and_create_download_dir(), FILE_RAD_COR),
-              "r") as csvfile:
-        startline = csvfile.readlines()[7:]
-        csvreader = csv.reader(startline, delimiter=" ")
-        for row in csvreader:
-            modeltemp.append(float(row[0]))
-            model_loss_rate.append(float(row[1]))
-    modeltemp = np.asarray(modeltemp)
-    model_loss_rate = np.asarray(model_loss_rate)
+    # Get the model data of temperature - rad loss rate relationship
+    modeltemp, model_loss_rate, spline = _get_chianti_spline(
+        os.path.join(download_dir, FILE_RAD_COR), 0, 1)
     # Ensure input values of flux ratio are within limits of model table
     if temp.value.min() < modeltemp.min() or \
     temp.value.max() > modeltemp.max():
@@ -977,7 +1047,6 @@ def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
                                                 np.max(modeltemp/1e6)))
     # Perform spline fit to model data to get temperatures for input
     # values of flux ratio
-    spline = interpolate.splrep(modeltemp, model_loss_rate, s=0)
     rad_loss = em.value * interpolate.splev(temp.value, spline, der=0)
     rad_loss = u.Quantity(rad_loss, unit='erg/s')
     rad_loss = rad_loss.to(u.J/u.s)
@@ -1361,3 +1430,48 @@ def _assert_chrono_order(obstime):
     if not all(val > TimeDelta(0*u.day) for val in chrono_check):
         raise ValueError(
             "Elements of obstime must be in chronological order.")
+
+
+def _read_chianti_table(filepath):
+    """
+    Reads the columns of a CHIANTI model table as lists of strings.
+
+    The csv files of the temperature and emission measure models are keyed
+    by their column names, while the columns of the radiative loss table are
+    keyed by their position.
+    """
+    with open(filepath, "r") as csvfile:
+        if os.path.basename(filepath) == FILE_RAD_COR:
+            # Skip the header lines
+            rows = [dict(enumerate(row)) for row in
+                    csv.reader(csvfile.readlines()[7:], delimiter=" ")]
+        else:
+            startline = dropwhile(lambda l: l.startswith("#"), csvfile)
+            rows = list(csv.DictReader(startline, delimiter=";"))
+    columns = {}
+    for row in rows:
+        for key, value in row.items():
+            columns.setdefault(key, []).append(value)
+    return columns
+
+
+def _get_chianti_spline(filepath, x, y):
+    """
+    Returns the model values of columns ``x`` and ``y`` of a CHIANTI table
+    and the spline fit of ``y`` against ``x``.
+
+    The tables and splines are cached in memory and only read and fit again
+    if the file has changed.
+    """
+    stat = os.stat(filepath)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _chianti_tables.get(filepath)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _read_chianti_table(filepath), {})
+        _chianti_tables[filepath] = cached
+    _, columns, splines = cached
+    if (x, y) not in splines:
+        modelx = np.asarray(columns[x], dtype=float)
+        modely = np.asarray(columns[y], dtype=float)
+        splines[(x, y)] = (modelx, modely, interpolate.splrep(modelx, modely, s=0))
+    return splines[(x, y)]
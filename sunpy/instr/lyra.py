@@ -13,11 +13,16 @@ from astropy.io import fits
 from astropy.time import Time
 
 from sunpy.time import parse_time
+from sunpy.time.time import _time_to_datetime64
 from sunpy.util.net import check_download_file
 from sunpy.util.config import get_and_create_download_dir
 
 LYTAF_REMOTE_PATH = "http://proba2.oma.be/lyra/data/lytaf/"
 
+# The tables read from each LYTAF database, keyed by path, with the
+# modification time and size of the file they were read from.
+_lytaf_tables = {}
+
 
 __all__ = ['remove_lytaf_events_from_timeseries',
            'get_lytaf_events',
@@ -114,7 +119,9 @@ def remove_lytaf_events_from_timeseries(ts, artifacts=None,
         force_use_local_lytaf=force_use_local_lytaf)
     # Create new copy copy of timeseries and replace data with
     # artifact-free time series.
-    ts_new = copy.deepcopy(ts)
+    ts_new = copy.copy(ts)
+    ts_new.meta = copy.deepcopy(ts.meta)
+    ts_new.units = copy.deepcopy(ts.units)
     ts_new.data = pandas.DataFrame(
         index=time, data=dict((col, channels[i])
                               for i, col in enumerate(data_columns)))
@@ -143,7 +150,7 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
 
     Parameters
     ----------
-    time : `numpy.ndarray` of `astropy.time.Time`
+    time : `numpy.ndarray` of `astropy.time.Time` or `pandas.DatetimeIndex`
         Gives the times of the timeseries.
 
     channels : `list` of `numpy.array` convertible to float64.
@@ -190,8 +197,9 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
 
     Returns
     -------
-    clean_time : `numpy.ndarray` of `astropy.time.Time`
-        time array with artifact periods removed.
+    clean_time : `numpy.ndarray` of `astropy.time.Time` or `pandas.DatetimeIndex`
+        time array with artifact periods removed, a `pandas.DatetimeIndex` if
+        time is one.
 
     clean_channels : `list` ndarrays/array-likes convertible to float64
         list of irradiance arrays with artifact periods removed.
@@ -252,8 +260,6 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
             print(all_lytaf_event_types)
             raise ValueError("{0} is not a valid artifact type. See above.".format(artifact))
     # Define outputs
-    clean_time = parse_time(time)
-    clean_channels = copy.deepcopy(channels)
     artifacts_not_found = []
     # Get LYTAF file for given time range
     lytaf = get_lytaf_events(time[0], time[-1], lytaf_path=lytaf_path,
@@ -278,19 +284,21 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
     if not len(artifact_indices):
         warn("None of user supplied artifacts were found.")
         artifacts_not_found = artifacts
+        clean_time = time if isinstance(time, pandas.DatetimeIndex) else parse_time(time)
+        clean_channels = copy.deepcopy(channels)
     else:
-        # Remove periods corresponding to artifacts from flux and time
-        # arrays.
-        bad_indices = np.empty(0, dtype="int64")
-        all_indices = np.arange(len(time))
-        for index in artifact_indices:
-            bad_period = np.logical_and(time >= lytaf["begin_time"][index].datetime,
-                                        time <= lytaf["end_time"][index].datetime)
-            bad_indices = np.append(bad_indices, all_indices[bad_period])
-        clean_time = np.delete(clean_time, bad_indices)
+        # Remove periods corresponding to artifacts, including their end
+        # times, from flux and time arrays.
+        good = ~_interval_mask(_to_datetime64(time),
+                               _to_datetime64(lytaf["begin_time"][artifact_indices]),
+                               _to_datetime64(lytaf["end_time"][artifact_indices]),
+                               include_end=True)
+        if isinstance(time, pandas.DatetimeIndex):
+            clean_time = time[good]
+        else:
+            clean_time = parse_time(time)[good]
         if channels:
-            for i, f in enumerate(clean_channels):
-                clean_channels[i] = np.delete(f, bad_indices)
+            clean_channels = [np.asanyarray(f)[good] for f in channels]
     # If return_artifacts kwarg is True, return a list containing
     # information on what artifacts found, removed, etc.  See docstring.
     if return_artifacts:
@@ -438,84 +446,51 @@ def get_lytaf_events(start_time, end_time, lytaf_path=None,
     start_time_uts = (start_time - Time('1970-1-1')).sec
     end_time_uts = (end_time - Time('1970-1-1')).sec
 
-    # Define numpy record array which will hold the information from
-    # the annotation file.
-    lytaf = np.empty((0,), dtype=[("insertion_time", object),
-                                  ("begin_time", object),
-                                  ("reference_time", object),
-                                  ("end_time", object),
-                                  ("event_type", object),
-                                  ("event_definition", object)])
-    # Access annotation files
+    # Find the events from each annotation file within the time range.
+    events = []
+    event_types = []
     for suffix in combine_files:
         # Check database files are present
         dbname = "annotation_{0}.db".format(suffix)
         check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path)
-        # Open SQLITE3 annotation files
-        connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-        # Create cursor to manipulate data in annotation file
-        cursor = connection.cursor()
+        dbpath = os.path.join(lytaf_path, dbname)
+        db_events, db_event_types = _read_lytaf_database(dbpath)
         # Check if lytaf file spans the start and end times defined by
         # user.  If not, download newest version.
-        # First get start time of first event and end time of last
-        # event in lytaf.
-        cursor.execute("select begin_time from event order by begin_time asc "
-                       "limit 1;")
-        db_first_begin_time = cursor.fetchone()[0]
-        db_first_begin_time = datetime.datetime.fromtimestamp(db_first_begin_time)
-        cursor.execute("select end_time from event order by end_time desc "
-                       "limit 1;")
-        db_last_end_time = cursor.fetchone()[0]
-        db_last_end_time = datetime.datetime.fromtimestamp(db_last_end_time)
-        # If lytaf does not include entire input time range...
         if not force_use_local_lytaf:
+            # Get start time of first event and end time of last event in
+            # lytaf.
+            db_first_begin_time = datetime.datetime.fromtimestamp(db_events["begin_time"].min())
+            db_last_end_time = datetime.datetime.fromtimestamp(db_events["end_time"].max())
+            # If lytaf does not include entire input time range...
             if end_time > db_last_end_time or start_time < db_first_begin_time:
-                # ...close lytaf file...
-                cursor.close()
-                connection.close()
-                # ...Download latest lytaf file...
+                # ...download latest lytaf file and read that instead.
                 check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path,
                                     replace=True)
-                # ...and open new version of lytaf database.
-                connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-                cursor = connection.cursor()
-        # Select and extract the data from event table within file within
-        # given time range
-        cursor.execute("select insertion_time, begin_time, reference_time, "
-                       "end_time, eventType_id from event where end_time >= "
-                       "{0} and begin_time <= "
-                       "{1}".format(start_time_uts, end_time_uts))
-        event_rows = cursor.fetchall()
-        # Select and extract the event types from eventType table
-        cursor.row_factory = sqlite3.Row
-        cursor.execute("select * from eventType")
-        eventType_rows = cursor.fetchall()
-        eventType_id = []
-        eventType_type = []
-        eventType_definition = []
-        for eventType_row in eventType_rows:
-            eventType_id.append(eventType_row["id"])
-            eventType_type.append(eventType_row["type"])
-            eventType_definition.append(eventType_row["definition"])
-        # Enter desired information into the lytaf numpy record array
-        for event_row in event_rows:
-            id_index = eventType_id.index(event_row[4])
-            lytaf = np.append(lytaf,
-                              np.array((Time(datetime.datetime.utcfromtimestamp(event_row[0]),
-                                        format='datetime'),
-                                        Time(datetime.datetime.utcfromtimestamp(event_row[1]),
-                                        format='datetime'),
-                                        Time(datetime.datetime.utcfromtimestamp(event_row[2]),
-                                        format='datetime'),
-                                        Time(datetime.datetime.utcfromtimestamp(event_row[3]),
-                                        format='datetime'),
-                                        eventType_type[id_index],
-                                        eventType_definition[id_index]), dtype=lytaf.dtype))
-        # Close file
-        cursor.close()
-        connection.close()
-    # Sort lytaf in ascending order of begin time
-    np.recarray.sort(lytaf, order="begin_time")
+                db_events, db_event_types = _read_lytaf_database(dbpath)
+        # Select the events within given time range
+        in_range = np.logical_and(db_events["end_time"] >= start_time_uts,
+                                  db_events["begin_time"] <= end_time_uts)
+        events.append(db_events[in_range])
+        event_types += [db_event_types[event_id]
+                        for event_id in db_events["event_type_id"][in_range]]
+    events = np.concatenate(events)
+
+    # Define numpy record array which will hold the information from
+    # the annotation file, in ascending order of begin time.
+    lytaf = np.empty((len(events),), dtype=[("insertion_time", object),
+                                            ("begin_time", object),
+                                            ("reference_time", object),
+                                            ("end_time", object),
+                                            ("event_type", object),
+                                            ("event_definition", object)])
+    order = np.argsort(events["begin_time"], kind="mergesort")
+    for column in ("insertion_time", "begin_time", "reference_time", "end_time"):
+        for i, timestamp in enumerate(events[column][order]):
+            lytaf[column][i] = Time(datetime.datetime.utcfromtimestamp(timestamp),
+                                    format='datetime')
+    for i, index in enumerate(order):
+        lytaf["event_type"][i], lytaf["event_definition"][i] = event_types[index]
 
     # If csvfile kwarg is set, write out lytaf to csv file
     if csvfile:
@@ -568,22 +543,16 @@ def get_lytaf_event_types(lytaf_path=None, print_event_types=True):
         dbname = "annotation_{0}.db".format(suffix)
         # Check database file exists, else download it.
         check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path)
-        # Open SQLITE3 LYTAF files
-        connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-        # Create cursor to manipulate data in annotation file
-        cursor = connection.cursor()
-        cursor.execute("select type from eventType;")
-        event_types = cursor.fetchall()
-        all_event_types.append(event_types)
+        # Read the event types from the LYTAF file
+        _, event_types = _read_lytaf_database(os.path.join(lytaf_path, dbname))
+        event_types = [event_type for event_type, _ in event_types.values()]
+        all_event_types += event_types
         if print_event_types:
             print("----------------\n{0} database\n----------------"
                   .format(suffix))
             for event_type in event_types:
-                print(str(event_type[0]))
+                print(str(event_type))
             print(" ")
-    # Unpack event types in all_event_types into single list
-    all_event_types = [event_type[0] for event_types in all_event_types
-                       for event_type in event_types]
     return all_event_types
 
 
@@ -614,27 +583,21 @@ def split_series_using_lytaf(timearray, data, lytaf):
     ------
     output : `list` of dictionaries
         Each dictionary contains a sub-series corresponding to an interval of
-        'good data'.
+        'good data'. The times are an `astropy.time.Time` array, or a list of
+        `astropy.time.Time` if timearray is a list.
     """
-    n = len(timearray)
-    mask = np.ones(n)
-    el = len(lytaf)
-
-    # make the input time array a list of Time objects
-    time_array = [parse_time(tim) for tim in timearray]
-
-    # scan through each entry retrieved from the LYTAF database
-    for j in range(0, el):
-        # want to mark all times with events as bad in the mask, i.e. = 0
-        start_dt = lytaf['begin_time'][j]
-        end_dt = lytaf['end_time'][j]
-
-        # find the start and end indices for each event
-        start_ind = np.searchsorted(time_array, start_dt)
-        end_ind = np.searchsorted(time_array, end_dt)
+    # make the input time array Time objects, kept as a list if given as one
+    if isinstance(timearray, list):
+        time_array = [parse_time(tim) for tim in timearray]
+    else:
+        time_array = _parse_times(timearray)
 
-        # append the mask to mark event as 'bad'
-        mask[start_ind:end_ind] = 0
+    # mark all times with events as bad in the mask, i.e. = 0
+    mask = np.ones(len(time_array))
+    if len(lytaf):
+        mask[_interval_mask(_to_datetime64(time_array),
+                            _to_datetime64(lytaf['begin_time']),
+                            _to_datetime64(lytaf['end_time']))] = 0
 
     diffmask = np.diff(mask)
     tmp_discontinuity = np.where(diffmask != 0.)
@@ -677,6 +640,114 @@ def split_series_using_lytaf(timearray, data, lytaf):
     return split_series
 
 
+def _read_lytaf_database(dbpath):
+    """
+    Read the events and event types from a LYTAF database.
+
+    The tables are cached, and read again only if the file changes.
+
+    Returns
+    -------
+    events : `numpy.ndarray`
+        The insertion, begin, reference and end UNIX times and event type id
+        of every event.
+    event_types : `dict`
+        The (type, definition) of each event type id.
+    """
+    stat = os.stat(dbpath)
+    file_state = (stat.st_mtime_ns, stat.st_size)
+    cached = _lytaf_tables.get(dbpath)
+    if cached is not None and cached[0] == file_state:
+        return cached[1]
+
+    connection = sqlite3.connect(dbpath)
+    try:
+        cursor = connection.cursor()
+        cursor.execute("select insertion_time, begin_time, reference_time, "
+                       "end_time, eventType_id from event")
+        events = np.array(cursor.fetchall(),
+                          dtype=[("insertion_time", float), ("begin_time", float),
+                                 ("reference_time", float), ("end_time", float),
+                                 ("event_type_id", int)])
+        cursor.execute("select id, type, definition from eventType")
+        event_types = {}
+        for event_type_id, event_type, definition in cursor.fetchall():
+            event_types.setdefault(event_type_id, (event_type, definition))
+        cursor.close()
+    finally:
+        connection.close()
+
+    _lytaf_tables[dbpath] = (file_state, (events, event_types))
+    return events, event_types
+
+
+def _parse_times(times):
+    """
+    Parse an array or list of times into an `astropy.time.Time` array.
+    """
+    try:
+        return parse_time(times)
+    except ValueError:
+        # Times in formats only parse_time understands
+        return Time([parse_time(time) for time in times])
+
+
+def _to_datetime64(times):
+    """
+    Convert an array of times to ``datetime64[ns]`` UTC times.
+    """
+    if isinstance(times, (pandas.Index, pandas.Series)):
+        return np.asarray(times, dtype='datetime64[ns]')
+    if isinstance(times, np.ndarray) and times.dtype.kind == 'M':
+        return times.astype('datetime64[ns]')
+    if not isinstance(times, Time):
+        times = _parse_times(times)
+    return _time_to_datetime64(times)
+
+
+def _interval_mask(times, begins, ends, include_end=False):
+    """
+    Find the times within any of the intervals from begins to ends.
+
+    The edges of all the intervals are found with one `numpy.searchsorted`
+    on the sorted times, and the intervals are painted onto the mask with a
+    cumulative sum of +1 at each start and -1 at each end, so overlapping
+    intervals are handled.
+
+    Parameters
+    ----------
+    times : `numpy.ndarray`
+        The times, need not be sorted.
+    begins, ends : `numpy.ndarray`
+        The begin and end time of each interval.
+    include_end : `bool`
+        If set, times equal to the end of an interval are within it.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        A boolean mask of the times within an interval.
+    """
+    order = None
+    if np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind='mergesort')
+        times = times[order]
+
+    starts = np.searchsorted(times, begins, side='left')
+    stops = np.searchsorted(times, ends, side='right' if include_end else 'left')
+    nonempty = stops > starts
+    edges = np.zeros(len(times) + 1, dtype=np.int64)
+    np.add.at(edges, starts[nonempty], 1)
+    np.add.at(edges, stops[nonempty], -1)
+    mask = np.cumsum(edges[:-1]) > 0
+
+    if order is not None:
+        unsorted_mask = np.empty_like(mask)
+        unsorted_mask[order] = mask
+        mask = unsorted_mask
+    return mask
+
+
 def _lytaf_event2string(integers):
     if type(integers) == int:
         integers = [integers]
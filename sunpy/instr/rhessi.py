@@ -6,8 +6,10 @@
 
 """
 
+import os
 import re
 import csv
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -31,6 +33,15 @@ grid_pitch = (4.52467, 7.85160, 13.5751, 23.5542, 40.7241, 70.5309, 122.164,
 grid_orientation = (3.53547, 2.75007, 3.53569, 2.74962, 3.92596, 2.35647,
                     0.786083, 0.00140674, 1.57147)
 
+# The true count rates of the 256 compressed count rates in an observing
+# summary file, which are 16 steps of 2**i counts for i in 0 to 15
+_countrate_exponent, _countrate_step = np.divmod(np.arange(256), 16)
+_countrate_lookup = _countrate_step * 2**_countrate_exponent + 16 * (2**_countrate_exponent - 1)
+_countrate_lookup.flags.writeable = False
+
+# The number of events back projected at once, which bounds the memory used.
+BACKPROJECT_CHUNK_SIZE = 2**14
+
 lc_linecolors = ('black', 'pink', 'green', 'blue', 'brown', 'red',
                  'navy', 'orange', 'green')
 
@@ -133,10 +144,9 @@ def parse_observing_summary_hdulist(hdulist):
     compressed_countrate = np.array(hdulist[6].data.field('countrate'))
 
     countrate = uncompress_countrate(compressed_countrate)
-    dim = np.array(countrate[:, 0]).size
+    dim = countrate.shape[0]
 
-    time_array = parse_time(reference_time_ut) + \
-        TimeDelta(time_interval_sec * np.arange(dim) * u.second)
+    time_array = reference_time_ut + TimeDelta(time_interval_sec * np.arange(dim) * u.second)
 
     #  TODO generate the labels for the dict automatically from labels
     data = {'time': time_array, 'data': countrate, 'labels': labels}
@@ -163,16 +173,7 @@ def uncompress_countrate(compressed_countrate):
         raise ValueError(
             'Exepected uncompressed counts {} to in range 0-255'.format(compressed_countrate))
 
-    # TODO Must be a better way than creating entire lookup table on each call
-    ll = np.arange(0, 16, 1)
-    lkup = np.zeros(256, dtype='int')
-    _sum = 0
-    for i in range(0, 16):
-        lkup[16 * i:16 * (i + 1)] = ll * 2 ** i + _sum
-        if i < 15:
-            _sum = lkup[16 * (i + 1) - 1] + 2 ** i
-
-    return lkup[compressed_countrate]
+    return _countrate_lookup[compressed_countrate]
 
 
 def hsi_linecolors():
@@ -203,8 +204,9 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
 
     Parameters
     ----------
-    calibrated_event_list : str
-        filename of a RHESSI calibrated event list
+    calibrated_event_list : str, `os.PathLike` or list
+        filename of a RHESSI calibrated event list, or the file as read by
+        `sunpy.io.read_file`
     detector : int
         the detector number
     pixel_size : 2-tuple
@@ -225,7 +227,10 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
     # info_parameters = fits[2]
     # detector_efficiency = info_parameters.data.field('cbe_det_eff$$REL')
 
-    afits = sunpy.io.read_file(calibrated_event_list)
+    if isinstance(calibrated_event_list, (str, os.PathLike)):
+        afits = sunpy.io.read_file(os.fspath(calibrated_event_list))
+    else:
+        afits = calibrated_event_list
 
     fits_detector_index = detector + 2
     detector_index = detector - 1
@@ -238,24 +243,37 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
     grid_transmission = afits[fits_detector_index].data.field('gridtran')
     count = afits[fits_detector_index].data.field('count')
 
-    tempa = (np.arange(image_dim[0] * image_dim[1]) % image_dim[0]) - (image_dim[0]-1)/2.
+    # The x and y offsets of each pixel are both one of image_dim[0] values.
+    tempa = np.arange(image_dim[0] * image_dim[1]) % image_dim[0]
     tempb = tempa.reshape(image_dim[0], image_dim[1]).transpose().reshape(image_dim[0]*image_dim[1])
-
-    pixel = np.array(list(zip(tempa, tempb)))*pixel_size[0]
-    phase_pixel = (2 * np.pi/harm_ang_pitch) *\
-                  (np.outer(pixel[:, 0], np.cos(this_roll_angle - grid_angle)) -
-                   np.outer(pixel[:, 1], np.sin(this_roll_angle - grid_angle))) + phase_map_center
-    phase_modulation = np.cos(phase_pixel)
+    offsets = (np.arange(image_dim[0]) - (image_dim[0]-1)/2.) * pixel_size[0]
+
+    # The transmission of each event through the grids at each pixel is
+    # gridtran * (1 + modamp * cos(kx * x + ky * y + phase_map_ctr)), so the
+    # modulated part of the image is the real part of the product of a matrix
+    # of exp(i kx x) over x and events with one of exp(i ky y) over events
+    # and y. This is accumulated in chunks of events in single precision.
+    angle = np.asarray(this_roll_angle, dtype=float) - grid_angle
+    wavenumber = 2 * np.pi/harm_ang_pitch
     gridmod = modamp * grid_transmission
-    probability_of_transmission = gridmod * phase_modulation + grid_transmission
-    bproj_image = np.inner(probability_of_transmission, count).reshape(image_dim)
+    grid = np.zeros((image_dim[0], image_dim[0]))
+    for start in range(0, len(count), BACKPROJECT_CHUNK_SIZE):
+        chunk = slice(start, start + BACKPROJECT_CHUNK_SIZE)
+        x_phase = np.exp(1j * np.outer(offsets, wavenumber * np.cos(angle[chunk])))
+        y_phase = np.exp(-1j * np.outer(offsets, wavenumber * np.sin(angle[chunk])))
+        weight = count[chunk] * gridmod[chunk] * np.exp(1j * phase_map_center[chunk])
+        grid += np.dot((x_phase * weight).astype(np.complex64),
+                       y_phase.T.astype(np.complex64)).real
+    grid += np.dot(count, grid_transmission)
+
+    bproj_image = grid[tempa, tempb].reshape(image_dim)
 
     return bproj_image
 
 
 @u.quantity_input
 def backprojection(calibrated_event_list, pixel_size: u.arcsec=(1., 1.) * u.arcsec,
-                   image_dim: u.pix=(64, 64) * u.pix):
+                   image_dim: u.pix=(64, 64) * u.pix, parallel=False):
     """
     Given a stacked calibrated event list fits file create a back
     projection image.
@@ -270,6 +288,9 @@ def backprojection(calibrated_event_list, pixel_size: u.arcsec=(1., 1.) * u.arcs
         the size of the pixels in arcseconds. Default is (1,1).
     image_dim : `~astropy.units.Quantity` instance
         the size of the output image in number of pixels
+    parallel : `bool` or `int`, optional, default:False
+        If True back project the detectors in parallel threads, or the
+        maximum number of threads to use.
 
     Returns
     -------
@@ -302,10 +323,20 @@ def backprojection(calibrated_event_list, pixel_size: u.arcsec=(1., 1.) * u.arcs
     # find out what detectors were used
     det_index_mask = afits[1].data.field('det_index_mask')[0]
     detector_list = (np.arange(9)+1) * np.array(det_index_mask)
-    for detector in detector_list:
-        if detector > 0:
-            image = image + _backproject(calibrated_event_list, detector=detector,
-                                         pixel_size=pixel_size.value, image_dim=image_dim)
+    detector_list = [detector for detector in detector_list if detector > 0]
+
+    def backproject(detector):
+        return _backproject(afits, detector=detector, pixel_size=pixel_size.value,
+                            image_dim=image_dim)
+
+    if parallel:
+        max_workers = len(detector_list) if parallel is True else parallel
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            detector_images = list(executor.map(backproject, detector_list))
+    else:
+        detector_images = map(backproject, detector_list)
+    for detector_image in detector_images:
+        image = image + detector_image
 
     dict_header = {
         "DATE-OBS": time_range.center.strftime("%Y-%m-%d %H:%M:%S"),
@@ -1,12 +1,53 @@
+import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_allclose
 
 import astropy.units as u
+from astropy.io import fits
 
 from sunpy.instr import fermi
 from sunpy.time import parse_time
 
 
+@pytest.fixture
+def pointing_file(tmpdir):
+    # A made up pointing file with a sample every 10 minutes
+    met = fermi.utc_to_met(parse_time('2012-02-14 23:00')).value + 600. * np.arange(150)
+    rng = np.random.RandomState(0)
+    columns = [fits.Column('START', 'D', array=met),
+               fits.Column('RA_SCX', 'E', array=rng.uniform(0, 360, len(met))),
+               fits.Column('DEC_SCX', 'E', array=rng.uniform(-90, 90, len(met))),
+               fits.Column('RA_SCZ', 'E', array=rng.uniform(0, 360, len(met))),
+               fits.Column('DEC_SCZ', 'E', array=rng.uniform(-90, 90, len(met)))]
+    path = str(tmpdir.join('pointing.fits'))
+    fits.HDUList([fits.PrimaryHDU(),
+                  fits.BinTableHDU.from_columns(columns)]).writeto(path)
+    return path
+
+
+def test_detector_angles_for_date_matches_time(pointing_file):
+    det = fermi.get_detector_sun_angles_for_date('2012-02-15', pointing_file)
+    assert len(det) == 13
+    # Samples from 2012-02-15 00:00 up to but not including 2012-02-16 00:00
+    assert len(det['time']) == 144
+    assert det['time'][0] == parse_time('2012-02-15 00:00')
+    for i in [0, 50, 143]:
+        det_time = fermi.get_detector_sun_angles_for_time(det['time'][i], pointing_file)
+        for n in det:
+            if n != 'time':
+                assert_allclose(det[n][i].to_value(u.deg), det_time[n].to_value(u.deg),
+                                atol=1e-10)
+
+
+def test_rotate_vector_many():
+    rng = np.random.RandomState(1)
+    vectors = rng.normal(size=(3, 5))
+    axes = rng.normal(size=(3, 5))
+    rotated = fermi.rotate_vector(vectors, axes, 0.3)
+    for i in range(5):
+        assert_allclose(rotated[:, i], fermi.rotate_vector(vectors[:, i], axes[:, i], 0.3))
+
+
 @pytest.mark.remote_data
 def test_download_weekly_pointing_file():
     # set a test date
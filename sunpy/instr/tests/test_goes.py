@@ -1,3 +1,4 @@
+import os
 import copy
 import pytest
 
@@ -350,6 +351,68 @@ def test_calc_rad_loss_obstime():
                              rad_loss_expected["rad_loss_cumul"], rtol=0.0001)
 
 
+@pytest.fixture
+def chianti_dir(tmpdir):
+    # Write made up model tables so the CHIANTI interpolation can be tested
+    # without downloading the real ones.
+    log10temp = np.linspace(-1.5, 2.5, 41)
+    for filename in [goes.FILE_TEMP_COR, goes.FILE_TEMP_PHO,
+                     goes.FILE_EM_COR, goes.FILE_EM_PHO]:
+        lines = ["# Made up table", "log10temp_MK;ratioGOES15;longfluxGOES15"]
+        lines += ["{0};{1};{2}".format(t, 10**(t/2 - 2), 10**(t/3 - 1))
+                  for t in log10temp]
+        tmpdir.join(filename).write("\n".join(lines) + "\n")
+    lines = ["# header"] * 7
+    lines += ["{0} {1}".format(10**(t + 6), 1e-22 * (1 + t**2)) for t in log10temp]
+    tmpdir.join(goes.FILE_RAD_COR).write("\n".join(lines) + "\n")
+    return str(tmpdir)
+
+
+def test_chianti_tables_cached(chianti_dir):
+    fluxratio = Quantity([0.01, 0.1])
+    temp = goes._goes_get_chianti_temp(fluxratio, satellite=15,
+                                       download_dir=chianti_dir)
+    assert_quantity_allclose(temp, 10**(2 * (np.log10(fluxratio.value) + 2)) * u.MK,
+                             rtol=1e-3)
+    path = os.path.join(chianti_dir, goes.FILE_TEMP_COR)
+    splines = goes._chianti_tables[path][2]
+    spline = splines[("ratioGOES15", "log10temp_MK")]
+    goes._goes_get_chianti_temp(fluxratio, satellite=15, download_dir=chianti_dir)
+    assert splines[("ratioGOES15", "log10temp_MK")] is spline
+    # A changed file is read again
+    os.utime(path, ns=(0, 0))
+    goes._goes_get_chianti_temp(fluxratio, satellite=15, download_dir=chianti_dir)
+    assert goes._chianti_tables[path][2] is not splines
+
+    rad_loss = goes._calc_rad_loss(Quantity([1, 10], unit="MK"),
+                                   Quantity([1e48, 1e48], unit="1/cm**3"),
+                                   download_dir=chianti_dir)
+    assert_quantity_allclose(rad_loss["rad_loss_rate"],
+                             [1e19, 2e19] * u.J/u.s, rtol=1e-3)
+
+
+def test_calculate_temperature_em_batch(chianti_dir):
+    goeslc = timeseries.TimeSeries(get_test_filepath("go1520110607.fits"))
+    goeslc_half = goeslc.truncate(0, len(goeslc.data) // 2)
+    single = [goes.calculate_temperature_em(ts, download_dir=chianti_dir)
+              for ts in (goeslc, goeslc_half)]
+    batch = goes.calculate_temperature_em([goeslc, goeslc_half],
+                                          download_dir=chianti_dir)
+    assert len(batch) == 2
+    for ts_single, ts_batch in zip(single, batch):
+        assert_frame_equal(ts_single.data, ts_batch.data)
+    with pytest.raises(TypeError):
+        goes.calculate_temperature_em([goeslc, []])
+    # The batch path checks the flux units like _goes_chianti_tem does
+    flux = Quantity([1e-6, 1e-6], unit="W/m**2")
+    with pytest.raises(u.UnitsError):
+        goes._goes_chianti_tem_batch([(flux, flux.value * u.W, 15, "2011-06-07")],
+                                     download_dir=chianti_dir)
+    with pytest.raises(TypeError):
+        goes._goes_chianti_tem_batch([(flux.value, flux, 15, "2011-06-07")],
+                                     download_dir=chianti_dir)
+
+
 @pytest.mark.remote_data
 def test_calculate_xray_luminosity():
     # Check correct exceptions are raised to incorrect inputs
@@ -1,3 +1,4 @@
+import shutil
 import tempfile
 import os.path
 import pytest
@@ -244,6 +245,21 @@ def test_remove_lytaf_events_2():
     assert np.all(time_test == time_expected)
 
 
+def test_remove_lytaf_events_datetimeindex():
+    """Test _remove_lytaf_events() keeps a DatetimeIndex as one."""
+    time_index = pandas.DatetimeIndex(TIME.datetime)
+    time_test, channels_test = lyra._remove_lytaf_events(
+        time_index, channels=CHANNELS, artifacts=["LAR"],
+        lytaf_path=TEST_DATA_PATH, force_use_local_lytaf=True)
+    time_expected, channels_expected = lyra._remove_lytaf_events(
+        TIME, channels=CHANNELS, artifacts=["LAR"],
+        lytaf_path=TEST_DATA_PATH, force_use_local_lytaf=True)
+    assert isinstance(time_test, pandas.DatetimeIndex)
+    assert len(time_test) < len(TIME)
+    assert (time_test == pandas.DatetimeIndex(time_expected.datetime)).all()
+    np.testing.assert_array_equal(channels_test[0], channels_expected[0])
+
+
 def test_remove_lytaf_events_3():
     """Test if correct errors are raised by _remove_lytaf_events()."""
     with pytest.raises(TypeError):
@@ -338,6 +354,38 @@ def test_get_lytaf_events():
                                            force_use_local_lytaf=True)
 
 
+def test_get_lytaf_events_cached(tmpdir):
+    """Test the LYTAF databases are read again only if they change."""
+    for suffix in ["lyra", "manual", "ppt", "science"]:
+        dbname = "annotation_{0}.db".format(suffix)
+        shutil.copy(os.path.join(TEST_DATA_PATH, dbname), str(tmpdir))
+    lytaf_path = str(tmpdir)
+    dbpath = os.path.join(lytaf_path, "annotation_lyra.db")
+    lytaf = lyra.get_lytaf_events("2008-01-01", "2014-01-01", lytaf_path=lytaf_path,
+                                  force_use_local_lytaf=True)
+    tables = lyra._lytaf_tables[dbpath][1]
+    np.testing.assert_array_equal(
+        lyra.get_lytaf_events("2008-01-01", "2014-01-01", lytaf_path=lytaf_path,
+                              force_use_local_lytaf=True), lytaf)
+    assert lyra._lytaf_tables[dbpath][1] is tables
+    os.utime(dbpath, ns=(0, 0))
+    lyra.get_lytaf_events("2008-01-01", "2014-01-01", lytaf_path=lytaf_path,
+                          force_use_local_lytaf=True)
+    assert lyra._lytaf_tables[dbpath][1] is not tables
+
+
+def test_interval_mask():
+    """Test _interval_mask() with unsorted times and overlapping intervals."""
+    times = np.array([5, 0, 1, 2, 3, 4, 6, 7, 8, 9]).astype('datetime64[s]')
+    begins = np.array([1, 2, 8, 7]).astype('datetime64[s]')
+    ends = np.array([3, 4, 8, 6]).astype('datetime64[s]')
+    expected = np.array([False, False, True, True, True, False, False, False, False, False])
+    np.testing.assert_array_equal(lyra._interval_mask(times, begins, ends), expected)
+    expected[[5, 8]] = True
+    np.testing.assert_array_equal(lyra._interval_mask(times, begins, ends, include_end=True),
+                                  expected)
+
+
 def test_get_lytaf_event_types():
     """Test that LYTAF event types are printed."""
     lyra.get_lytaf_event_types(lytaf_path=TEST_DATA_PATH)
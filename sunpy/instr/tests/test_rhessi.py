@@ -3,6 +3,7 @@
 Unit tests for `sunpy.instr.rhessi`
 """
 import sys
+import pathlib
 import textwrap
 
 from unittest import mock
@@ -11,6 +12,7 @@ import pytest
 
 import sunpy.io
 import sunpy.map
+import sunpy.timeseries
 from sunpy.data.test import get_test_filepath
 import sunpy.instr.rhessi as rhessi
 from sunpy.time import parse_time, is_time_equal
@@ -35,6 +37,39 @@ def test_backprojection():
     assert is_time_equal(amap.date, parse_time((2002, 2, 20, 11, 6, 21)))
 
 
+def test_backprojection_parallel():
+    test_filename = get_test_filepath('hsi_calib_ev_20020220_1106_20020220_1106_25_40.fits')
+    amap = rhessi.backprojection(test_filename)
+    pmap = rhessi.backprojection(test_filename, parallel=2)
+    assert np.array_equal(amap.data, pmap.data)
+
+
+@pytest.mark.parametrize('image_dim', [(16, 16), (12, 20)])
+def test_backproject_chunks(monkeypatch, image_dim):
+    """
+    Test that the back projection in chunks of events is the sum over the
+    events and pixels of the grid transmission.
+    """
+    test_filename = get_test_filepath('hsi_calib_ev_20020220_1106_20020220_1106_25_40.fits')
+    data = sunpy.io.read_file(test_filename)[3].data
+    grid_angle = np.pi/2. - rhessi.grid_orientation[0]
+    tempa = (np.arange(image_dim[0] * image_dim[1]) % image_dim[0]) - (image_dim[0]-1)/2.
+    tempb = tempa.reshape(image_dim).transpose().reshape(-1)
+    angle = data.field('roll_angle') - grid_angle
+    phase = (2 * np.pi/rhessi.grid_pitch[0] * (np.outer(tempa, np.cos(angle)) -
+                                                np.outer(tempb, np.sin(angle))) +
+             data.field('phase_map_ctr'))
+    transmission = data.field('gridtran') * (1 + data.field('modamp') * np.cos(phase))
+    expected = np.inner(transmission, data.field('count')).reshape(image_dim)
+
+    monkeypatch.setattr(rhessi, 'BACKPROJECT_CHUNK_SIZE', 100)
+    image = rhessi._backproject(test_filename, detector=1, image_dim=image_dim)
+    assert np.allclose(image, expected, rtol=1e-5)
+    # Paths are read like filenames
+    image = rhessi._backproject(pathlib.Path(test_filename), detector=1, image_dim=image_dim)
+    assert np.allclose(image, expected, rtol=1e-5)
+
+
 def test_parse_obssum_dbase_file():
     fname = get_test_filepath("hsi_obssumm_filedb_201104.txt")
     obssum = rhessi.parse_observing_summary_dbase_file(fname)
@@ -115,6 +150,26 @@ def test_uncompress_countrate():
     assert counts[1] == 4080
 
 
+def test_uncompress_countrate_all():
+    """
+    Test that every 16 compressed count rates step the count rate by the next
+    power of two.
+    """
+    counts = rhessi.uncompress_countrate(np.arange(256))
+    assert np.all(np.diff(counts) == 2 ** (np.arange(255) // 16))
+
+
+def test_parse_obssum_hdulist_times():
+    hdulist = sunpy.io.read_file(get_test_filepath('hsi_obssumm_20110404_042.fits.gz'))
+    _header, data = rhessi.parse_observing_summary_hdulist(hdulist)
+    ts = sunpy.timeseries.TimeSeries(get_test_filepath('hsi_obssumm_20110404_042.fits.gz'),
+                                     source='RHESSI')
+
+    assert data['data'].shape == (21600, 9)
+    assert np.all(ts.data.index == data['time'].datetime)
+    assert np.all(np.diff(ts.data.index.values) == np.timedelta64(4, 's'))
+
+
 # Test `rhessi.parse_obssumm_dbase_file(...)`
 
 
@@ -1,8 +1,6 @@
 """A Python MapSequence Object"""
 #pylint: disable=W0401,W0614,W0201,W0212,W0404
 
-from copy import deepcopy
-
 import numpy as np
 import matplotlib.animation
 import numpy.ma as ma
@@ -10,7 +8,7 @@ import numpy.ma as ma
 import astropy.units as u
 
 from sunpy.map import GenericMap
-from sunpy.visualization.animator.mapsequenceanimator import MapSequenceAnimator
+from sunpy.visualization.animator.mapsequenceanimator import MapSequenceAnimator, _MapFrameCache
 from sunpy.visualization import wcsaxes_compat
 from sunpy.visualization import axis_labels_from_ctype
 from sunpy.util import expand_list
@@ -177,28 +175,28 @@ class MapSequence(object):
             axes.set_ylabel(axis_labels_from_ctype(self[i].coordinate_system[1],
                                                    self[i].spatial_units[1]))
 
-        if resample:
-            if self.all_maps_same_shape():
-                resample = u.Quantity(self.maps[0].dimensions) * np.array(resample)
-                ani_data = [amap.resample(resample) for amap in self.maps]
-            else:
-                raise ValueError('Maps in mapsequence do not all have the same shape.')
-        else:
-            ani_data = self.maps
+        if resample and not self.all_maps_same_shape():
+            raise ValueError('Maps in mapsequence do not all have the same shape.')
+
+        # The frames are resampled when first drawn, and ahead of drawing in
+        # a background thread.
+        frames = _MapFrameCache(self.maps, resample=resample)
+        ani_data = self.maps
 
         im = ani_data[0].plot(axes=axes, **kwargs)
+        if resample:
+            data, norm = frames[0]
+            im.set_data(data)
+            im.set_norm(norm)
 
         def updatefig(i, im, annotate, ani_data, removes):
             while removes:
                 removes.pop(0).remove()
 
-            im.set_array(ani_data[i].data)
+            data, norm = frames[i]
+            frames.prefetch(i)
+            im.set_data(data)
             im.set_cmap(ani_data[i].plot_settings['cmap'])
-
-            norm = deepcopy(ani_data[i].plot_settings['norm'])
-            # The following explicit call is for bugged versions of Astropy's
-            # ImageNormalize
-            norm.autoscale_None(ani_data[i].data)
             im.set_norm(norm)
 
             if wcsaxes_compat.is_wcsaxes(axes):
@@ -293,18 +291,7 @@ class MapSequence(object):
         >>> mplani = ani.get_animation()   # doctest: +SKIP
         """
 
-        if resample:
-            if self.all_maps_same_shape():
-                plot_sequence = MapSequence()
-                resample = u.Quantity(self.maps[0].dimensions) * np.array(resample)
-                for amap in self.maps:
-                    plot_sequence.maps.append(amap.resample(resample))
-            else:
-                raise ValueError('Maps in mapsequence do not all have the same shape.')
-        else:
-            plot_sequence = self
-
-        return MapSequenceAnimator(plot_sequence, **kwargs)
+        return MapSequenceAnimator(self, resample=resample, **kwargs)
 
     def all_maps_same_shape(self):
         """
@@ -1,4 +1,244 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from operator import attrgetter
+from collections.abc import MutableSequence
+
+import numpy as np
+
+__all__ = ['BaseClient', 'BaseQueryResponse']
+
+
+def _record_array(records):
+    """
+    A one dimensional object array of ``records``.
+    """
+    if isinstance(records, np.ndarray) and records.dtype == object and records.ndim == 1:
+        return records
+    records = list(records)
+    array = np.empty(len(records), dtype=object)
+    # Assigning element by element keeps records which are sequences whole
+    for i, record in enumerate(records):
+        array[i] = record
+    return array
+
+
+@lru_cache()
+def _attribute_or_none(attribute):
+    """
+    A getter of the (dotted) ``attribute`` of a record, which gives `None` if
+    the record does not have it.
+    """
+    getter = attrgetter(attribute)
+
+    def get(record):
+        try:
+            return getter(record)
+        except AttributeError:
+            return None
+
+    return get
+
+
+def _record_column(records, attribute):
+    """
+    The (dotted) ``attribute`` of every record as an object array, `None`
+    where a record does not have it.
+    """
+    if not len(records):
+        return np.empty(0, dtype=object)
+    return np.frompyfunc(_attribute_or_none(attribute), 1, 1)(records)
+
+
+class BaseQueryResponse(MutableSequence):
+    """
+    A sequence of the records returned by a client search, with a columnar
+    `~astropy.table.Table` of them.
+
+    The records are held in the first column of a two dimensional numpy
+    object array. The other columns hold the record attributes listed in
+    ``_record_attributes``, which are taken from the records when they are
+    added so the table can be built column by column. The array grows
+    geometrically, so appending records one at a time is cheap.
+
+    The table is built once, by `_make_table`, and then reused. Indexing with
+    a slice, an integer array or a boolean mask returns a new response of the
+    same type. For slices the records and the table of the new response are
+    views of the existing ones, for index arrays they are taken from them,
+    so that nothing is built again. Changing the records of a response which
+    shares them with another copies them first.
+
+    It has the methods of a `list`, but is not one; use ``list(response)``
+    where a list is needed.
+    """
+    #: The names and (dotted) record attributes of the columns taken from the
+    #: records when they are added.
+    _record_attributes = ()
+
+    def __init__(self, lst=(), table=None):
+        self._rows = self._make_rows(lst)
+        self._size = len(self._rows)
+        # Whether the rows are a view shared with another response
+        self._shared = False
+        self._table = table
+
+    def _make_rows(self, records):
+        records = _record_array(records)
+        rows = np.empty((len(records), 1 + len(self._record_attributes)), dtype=object)
+        rows[:, 0] = records
+        for i, (name, attribute) in enumerate(self._record_attributes):
+            rows[:, 1 + i] = _record_column(records, attribute)
+        return rows
+
+    @property
+    def _records(self):
+        return self._rows[:self._size, 0]
+
+    def _column(self, name):
+        """
+        The values of the record attribute column ``name``.
+        """
+        names = [column for column, _ in self._record_attributes]
+        return self._rows[:self._size, 1 + names.index(name)]
+
+    def _make_table(self):
+        """
+        Build the table of the records, this should be done column by column.
+        """
+        raise NotImplementedError
+
+    def _cached_table(self):
+        if self._table is None:
+            self._table = self._make_table()
+        return self._table
+
+    def _changed(self, rows=None):
+        """
+        Replace the rows, or make sure they can be changed in place if none
+        are given, and drop the table.
+        """
+        if rows is not None:
+            self._rows = rows
+            self._size = len(rows)
+        elif self._shared:
+            self._rows = self._rows[:self._size].copy()
+        self._shared = False
+        self._table = None
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __eq__(self, other):
+        if isinstance(other, (BaseQueryResponse, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        new = self[:]
+        new.extend(other)
+        return new
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return self._records[item]
+        if isinstance(item, slice):
+            # The new response is a view of these rows
+            self._shared = True
+        else:
+            item = np.asarray(item)
+            if item.dtype == bool:
+                if len(item) != len(self):
+                    raise IndexError("Boolean index has length {} but the response has "
+                                     "{} records.".format(len(item), len(self)))
+                item = np.flatnonzero(item)
+            elif not item.size:
+                # An empty list of indices
+                item = item.astype(int)
+
+        new = type(self).__new__(type(self))
+        # Carry over everything else such as the client
+        new.__dict__.update((k, v) for k, v in self.__dict__.items()
+                            if k not in ('_rows', '_table'))
+        new._rows = self._rows[:self._size][item]
+        new._size = len(new._rows)
+        # Index arrays take a copy of the rows
+        new._shared = isinstance(item, slice)
+        new._table = None if self._table is None else self._table[item]
+        return new
+
+    def __setitem__(self, item, value):
+        if isinstance(item, (int, np.integer)):
+            rows = self._make_rows([value])[0]
+        else:
+            rows = self._make_rows(value)
+            if isinstance(item, slice) and item.step in (None, 1):
+                start, stop, _ = item.indices(self._size)
+                stop = max(start, stop)
+                if stop - start != len(rows):
+                    # Like a list, a slice can be replaced by a different
+                    # number of records
+                    current = self._rows[:self._size]
+                    self._changed(np.concatenate([current[:start], rows, current[stop:]]))
+                    return
+        self._changed()
+        self._rows[:self._size][item] = rows
+
+    def __delitem__(self, item):
+        self._changed(np.delete(self._rows[:self._size], np.arange(self._size)[item], axis=0))
+
+    def insert(self, index, record):
+        self._changed(np.insert(self._rows[:self._size], index, self._make_rows([record]),
+                                axis=0))
+
+    def _reserve(self, size):
+        """
+        Make room for ``size`` rows, growing the array geometrically so that
+        appending one record at a time is not quadratic.
+        """
+        if size > len(self._rows):
+            grown = np.empty((max(size, 2 * len(self._rows), 16), self._rows.shape[1]),
+                             dtype=object)
+            grown[:self._size] = self._rows[:self._size]
+            self._rows = grown
+            self._shared = False
+        # The rows past the end are not in any view, so don't need copying
+        self._table = None
+
+    def extend(self, records):
+        rows = self._make_rows(records)
+        self._reserve(self._size + len(rows))
+        self._rows[self._size:self._size + len(rows)] = rows
+        self._size += len(rows)
+
+    def append(self, record):
+        self._reserve(self._size + 1)
+        row = self._rows[self._size]
+        row[0] = record
+        for i, (name, attribute) in enumerate(self._record_attributes):
+            row[1 + i] = _attribute_or_none(attribute)(record)
+        self._size += 1
+
+    def pop(self, index=-1):
+        record = self[index]
+        del self[index]
+        return record
+
+    def clear(self):
+        self._changed(self._rows[:0].copy())
+
+    def reverse(self):
+        self._changed(self._rows[:self._size][::-1].copy())
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the records in place, like `list.sort`.
+        """
+        records = self._records
+        order = sorted(range(self._size), reverse=reverse,
+                       key=(lambda i: records[i]) if key is None else (lambda i: key(records[i])))
+        self._changed(self._rows[:self._size][order])
 
 
 class BaseClient(ABC):
@@ -6,16 +6,18 @@ from functools import partial
 import pathlib
 
 import numpy as np
+import pandas as pd
 import astropy.table
 import astropy.units as u
+import astropy.time
 
 import sunpy
 from sunpy.time import TimeRange
 from sunpy.util import replacement_filename
 from sunpy import config
 
-from sunpy.net.base_client import BaseClient
-from sunpy.net.download import Downloader, Results
+from sunpy.net.base_client import BaseClient, BaseQueryResponse
+from sunpy.net.download import Downloader, Results, get_file_index
 from sunpy.net.vso.attrs import Time, Wavelength, _Range
 
 TIME_FORMAT = config.get("general", "time_format")
@@ -57,13 +59,16 @@ def iter_urls(amap, url_list, time):
         yield tmp
 
 
-class QueryResponse(list):
+class QueryResponse(BaseQueryResponse):
     """
     Container of QueryResponseBlocks
     """
+    _record_attributes = (('start', 'time.start'), ('end', 'time.end'),
+                          ('source', 'source'), ('instrument', 'instrument'),
+                          ('wave', 'wave'))
 
-    def __init__(self, lst):
-        super(QueryResponse, self).__init__(lst)
+    def __init__(self, lst, table=None):
+        super(QueryResponse, self).__init__(lst, table=table)
 
     @classmethod
     def create(cls, amap, lst, time=None):
@@ -99,17 +104,31 @@ class QueryResponse(list):
         return self._build_table()._repr_html_()
 
     def _build_table(self):
-        columns = OrderedDict((('Start Time', []), ('End Time', []),
-                               ('Source', []), ('Instrument', []),
-                               ('Wavelength', [])))
-        for i, qrblock in enumerate(self):
-            columns['Start Time'].append(
-                (qrblock.time.start).strftime(TIME_FORMAT))
-            columns['End Time'].append(
-                (qrblock.time.end).strftime(TIME_FORMAT))
-            columns['Source'].append(qrblock.source)
-            columns['Instrument'].append(qrblock.instrument)
-            columns['Wavelength'].append(str(u.Quantity(qrblock.wave)))
+        return self._cached_table()
+
+    def _make_table(self):
+        columns = OrderedDict()
+        for name, column in (('Start Time', 'start'), ('End Time', 'end')):
+            times = self._column(column)
+            if len(times):
+                times = astropy.time.Time(list(times))
+                try:
+                    times = pd.to_datetime(times.isot).strftime(TIME_FORMAT)
+                except ValueError:
+                    # pandas can not represent leap seconds
+                    times = times.strftime(TIME_FORMAT)
+            columns[name] = list(times)
+        columns['Source'] = list(self._column('source'))
+        columns['Instrument'] = list(self._column('instrument'))
+        # Most of the time every block has the same wavelength, so only
+        # format each distinct one once.
+        waves = {}
+        columns['Wavelength'] = []
+        for wave in self._column('wave'):
+            key = repr(wave)
+            if key not in waves:
+                waves[key] = str(u.Quantity(wave))
+            columns['Wavelength'].append(waves[key])
 
         return astropy.table.Table(columns)
 
@@ -290,7 +309,7 @@ class GenericClient(BaseClient):
                 return QueryResponse.create(self.map_, urls, times)
         return QueryResponse.create(self.map_, urls)
 
-    def fetch(self, qres, path=None, error_callback=None, **kwargs):
+    def fetch(self, qres, path=None, error_callback=None, overwrite=False, **kwargs):
         """
         Download a set of results.
 
@@ -305,6 +324,11 @@ class GenericClient(BaseClient):
         error_callback : Function
             Callback function for error during downloads
 
+        overwrite : `bool`
+            If `False`, files which were downloaded before and are still
+            intact on disk are not downloaded again. The number of bytes this
+            saved is available as ``bytes_saved`` on the returned Results.
+
         Returns
         -------
         Results Object
@@ -326,7 +350,8 @@ class GenericClient(BaseClient):
 
         res = Results(lambda x: None, 0, lambda map_: self._link(map_))
 
-        dobj = Downloader(max_conn=len(urls), max_total=len(urls))
+        dobj = Downloader(max_conn=len(urls), max_total=len(urls),
+                          file_index=get_file_index(), overwrite=overwrite)
 
         # We cast to list here in list(zip... to force execution of
         # res.require([x]) at the start of the loop.
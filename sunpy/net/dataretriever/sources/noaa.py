@@ -17,7 +17,7 @@ import sunpy
 from sunpy.util import replacement_filename
 from sunpy.net.dataretriever.client import simple_path
 
-from sunpy.net.download import Downloader, Results
+from sunpy.net.download import Downloader, Results, get_file_index
 
 
 __all__ = ['NOAAIndicesClient', 'NOAAPredictClient', 'SRSClient']
@@ -142,7 +142,7 @@ class SRSClient(GenericClient):
 
         return result
 
-    def fetch(self, qres, path=None, error_callback=None, **kwargs):
+    def fetch(self, qres, path=None, error_callback=None, overwrite=False, **kwargs):
         """
         Download a set of results.
 
@@ -151,6 +151,10 @@ class SRSClient(GenericClient):
         qres : `~sunpy.net.dataretriever.QueryResponse`
             Results to download.
 
+        overwrite : `bool`
+            If `False`, archives which were downloaded before and are still
+            intact on disk are not downloaded again.
+
         Returns
         -------
         Results Object
@@ -181,14 +185,15 @@ class SRSClient(GenericClient):
         # Those files that will be present after get returns
         local_paths = self._get_full_filenames(qres, local_filenames, path)
 
-        res = Results(lambda x: None, 0, lambda map_: self._link(map_))
+        res = Results(lambda x: None, 0)
 
         # remove duplicate urls. This will make paths and urls to have same number of elements.
         # OrderedDict is required to maintain ordering because it will be zipped with paths later
 
         urls = list(OrderedDict.fromkeys(urls))
 
-        dobj = Downloader(max_conn=len(urls), max_total=len(urls))
+        dobj = Downloader(max_conn=len(urls), max_total=len(urls),
+                          file_index=get_file_index(), overwrite=overwrite)
 
         # We cast to list here in list(zip... to force execution of
         # res.require([x]) at the start of the loop.
@@ -196,7 +201,10 @@ class SRSClient(GenericClient):
                                                      urls), paths)):
             dobj.download(aurl, fname, ncall, error_callback)
 
-        res.wait()
+        # Files reused from an earlier download live wherever they were saved
+        # then, so take the paths from the results rather than the plan.
+        downloaded = res.wait()
+        paths = [downloaded[url]['path'] for url in urls if url in downloaded]
 
         res2 = Results(lambda x: None, 0)
 
@@ -208,8 +216,6 @@ class SRSClient(GenericClient):
             past_year = False
             for i, fname2 in enumerate(paths):
 
-                fname2 = fname2.args[0]
-
                 if fname2.endswith('.txt'):
                     continue
 
@@ -234,6 +240,8 @@ class SRSClient(GenericClient):
                 callback = res2.require([fname])
                 callback({'path': fname})
 
+        res2.skipped = res.skipped
+        res2.bytes_saved = res.bytes_saved
         return res2
 
     def _makeimap(self):
@@ -1,3 +1,5 @@
+import numpy as np
+
 from sunpy.time import parse_time
 from sunpy.net.dataretriever.client import QueryResponse
 
@@ -11,3 +13,26 @@ def test_reprs():
     strs = ["2012-01-01 00:00:00", "2012-01-02 00:00:00"]
     assert all(s in str(resp) for s in strs)
     assert all(s in repr(resp) for s in strs)
+
+
+def test_slicing_shares_table():
+    map_ = {'Time_start': parse_time("2012/1/1"), 'Time_end': parse_time("2012/1/2"),
+            'source': 'SDO', 'instrument': 'EVE'}
+    resp = QueryResponse.create(map_, ['url{}'.format(i) for i in range(10)])
+    table = resp._build_table()
+    assert resp._build_table() is table
+
+    sliced = resp[2:8:2]
+    assert isinstance(sliced, QueryResponse)
+    assert [block.url for block in sliced] == ['url2', 'url4', 'url6']
+    assert len(sliced._build_table()) == 3
+    assert np.shares_memory(sliced._build_table()['Source'], table['Source'])
+
+    mask = np.zeros(len(resp), dtype=bool)
+    mask[[1, 3]] = True
+    assert [block.url for block in resp[mask]] == ['url1', 'url3']
+    assert [block.url for block in resp[[0, 9]]] == ['url0', 'url9']
+
+    # Changing the records drops the cached table
+    resp.append(resp[0])
+    assert len(resp._build_table()) == 11
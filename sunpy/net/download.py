@@ -7,16 +7,24 @@
 
 import os
 import re
-import urllib
+import json
+import atexit
+import shutil
+import weakref
+import urllib.request
+import hashlib
 import threading
 from functools import partial
 from contextlib import closing
-from collections import deque, defaultdict
+from collections import deque, defaultdict, namedtuple
 
 from sunpy.util.config import get_and_create_download_dir
 from sunpy.util.progressbar import TTYProgressBar as ProgressBar
 
-__all__ = ['Downloader', 'Results']
+__all__ = ['Downloader', 'Results', 'FileIndex', 'get_file_index', 'save_file_indices',
+           'IntegrityError']
+
+INDEX_FILENAME = '.sunpy_file_index.json'
 
 
 def default_name(path, sock, url):
@@ -24,11 +32,227 @@ def default_name(path, sock, url):
     return os.path.join(path, name)
 
 
+class IntegrityError(Exception):
+    """
+    Raised when a downloaded file does not match the size announced by the
+    server.
+    """
+
+
+IndexEntry = namedtuple('IndexEntry', 'path size sha256 mtime disposition')
+# Indices written before the Content-Disposition header was recorded
+IndexEntry.__new__.__defaults__ = (None,)
+
+
+class _IndexedResponse(object):
+    """
+    Stands in for the server response when naming an already indexed file.
+    """
+    def __init__(self, entry):
+        self.headers = {}
+        if entry.disposition is not None:
+            self.headers['Content-Disposition'] = entry.disposition
+
+
+def _file_checksum(path, buf=2**20):
+    """
+    Return the hex SHA-256 digest of the file at ``path``.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fd:
+        for chunk in iter(partial(fd.read, buf), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileIndex(object):
+    """
+    A persistent index of files previously downloaded, keyed on their URL.
+
+    Every entry records where the file was saved together with its size,
+    SHA-256 checksum and modification time. `lookup` only returns an entry if
+    the file is still present on disk and unchanged; the checksum is only
+    recomputed when the modification time no longer matches the recorded one.
+
+    Changes are only written to ``filename`` by `save`, which
+    `save_file_indices` calls for every changed index once a batch of
+    downloads is complete.
+
+    Parameters
+    ----------
+    filename : `str`, optional
+        JSON file the index is stored in. If `None` the index is only kept in
+        memory.
+    """
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.lock = threading.RLock()
+        self._entries = {}
+        self._changed = False
+        if filename is not None and os.path.isfile(filename):
+            try:
+                with open(filename) as fd:
+                    self._entries = {url: IndexEntry(*entry)
+                                     for url, entry in json.load(fd).items()}
+            except (ValueError, TypeError):
+                # A corrupt index only means we download again.
+                self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, url):
+        return self.lookup(url) is not None
+
+    def lookup(self, url):
+        """
+        Return the `IndexEntry` for ``url`` if the file recorded for it is
+        present and intact, otherwise `None`.
+        """
+        with self.lock:
+            entry = self._entries.get(url)
+        if entry is None or not os.path.isfile(entry.path):
+            return None
+        stat = os.stat(entry.path)
+        if stat.st_size != entry.size:
+            return None
+        if stat.st_mtime != entry.mtime:
+            if _file_checksum(entry.path) != entry.sha256:
+                return None
+            entry = entry._replace(mtime=stat.st_mtime)
+            with self.lock:
+                self._entries[url] = entry
+        return entry
+
+    def record(self, url, path, sha256=None, disposition=None):
+        """
+        Add (or replace) the entry for ``url`` which was saved to ``path``.
+
+        ``sha256`` should be computed while the file is written, otherwise
+        the file is read again to compute it. ``disposition`` is the
+        Content-Disposition header the file was served with.
+        """
+        path = os.path.abspath(path)
+        if sha256 is None:
+            sha256 = _file_checksum(path)
+        stat = os.stat(path)
+        entry = IndexEntry(path, stat.st_size, sha256, stat.st_mtime, disposition)
+        with self.lock:
+            self._entries[url] = entry
+            self._mark_changed()
+        return entry
+
+    def forget(self, url):
+        """
+        Remove the entry for ``url`` from the index.
+        """
+        with self.lock:
+            if self._entries.pop(url, None) is not None:
+                self._mark_changed()
+
+    def _mark_changed(self):
+        self._changed = True
+        if self.filename is not None:
+            _changed_indices.add(self)
+
+    def save(self):
+        """
+        Write the index to ``filename``.
+        """
+        if self.filename is None:
+            return
+        with self.lock:
+            tmpname = self.filename + '.tmp'
+            with open(tmpname, 'w') as fd:
+                json.dump({url: list(entry) for url, entry in self._entries.items()}, fd)
+            os.replace(tmpname, self.filename)
+            self._changed = False
+
+    @staticmethod
+    def place(entry, fullname):
+        """
+        Return the path at which the file of ``entry`` satisfies a download
+        to ``fullname``.
+
+        The recorded file is used as it is if it is in the directory of
+        ``fullname``, otherwise it is hard linked, or copied, to
+        ``fullname``.
+        """
+        fullname = os.path.abspath(fullname)
+        dir_ = os.path.dirname(fullname)
+        if dir_ == os.path.dirname(entry.path):
+            return entry.path
+        if not os.path.exists(dir_):
+            os.makedirs(dir_)
+        if os.path.exists(fullname):
+            os.remove(fullname)
+        try:
+            os.link(entry.path, fullname)
+        except OSError:
+            shutil.copyfile(entry.path, fullname)
+        return fullname
+
+
+_changed_indices = weakref.WeakSet()
+
+
+def save_file_indices():
+    """
+    Write every `FileIndex` with unsaved changes to its file.
+    """
+    for index in list(_changed_indices):
+        with index.lock:
+            if index._changed:
+                index.save()
+        _changed_indices.discard(index)
+
+
+atexit.register(save_file_indices)
+
+
+_file_indices = {}
+
+
+def get_file_index(directory=None):
+    """
+    Return the shared `FileIndex` stored in ``directory``.
+
+    Parameters
+    ----------
+    directory : `str`, optional
+        Defaults to the SunPy download directory.
+    """
+    if directory is None:
+        directory = get_and_create_download_dir()
+    filename = os.path.join(os.path.abspath(os.path.expanduser(directory)), INDEX_FILENAME)
+    if filename not in _file_indices:
+        _file_indices[filename] = FileIndex(filename)
+    return _file_indices[filename]
+
+
 class Downloader(object):
-    def __init__(self, max_conn=5, max_total=20):
+    """
+    Download files concurrently with a bounded number of connections.
+
+    Parameters
+    ----------
+    max_conn : `int`
+        Maximum number of connections to a single server.
+    max_total : `int`
+        Maximum number of connections in total.
+    file_index : `FileIndex`, optional
+        If given, every completed download is recorded in the index.
+    overwrite : `bool`
+        If `False` (and ``file_index`` is given) a URL whose file is already
+        present and intact is not downloaded again; the callback is instead
+        called straight away with the existing path.
+    """
+    def __init__(self, max_conn=5, max_total=20, file_index=None, overwrite=False):
         self.max_conn = max_conn
         self.max_total = max_total
         self.conns = 0
+        self.file_index = file_index
+        self.overwrite = overwrite
 
         self.connections = defaultdict(int)  # int() -> 0
         self.q = defaultdict(deque)
@@ -53,15 +277,28 @@ class Downloader(object):
                 if not os.path.exists(dir_):
                     os.makedirs(dir_)
 
+                expected = sock.headers.get('Content-Length')
+                digest = hashlib.sha256()
+                size = 0
                 with open(fullname, 'wb') as fd:
                     while True:
                         rec = sock.read(self.buf)
                         if not rec:
-                            with self.mutex:
-                                self._close(callback, [{'path': fullname}], server)
                             break
-                        else:
-                            fd.write(rec)
+                        fd.write(rec)
+                        digest.update(rec)
+                        size += len(rec)
+
+                if expected is not None and int(expected) != size:
+                    os.remove(fullname)
+                    raise IntegrityError("Downloaded {} bytes from {} but the server "
+                                         "announced {}.".format(size, url, expected))
+                if self.file_index is not None:
+                    self.file_index.record(url, fullname, digest.hexdigest(),
+                                           sock.headers.get('Content-Disposition'))
+
+                with self.mutex:
+                    self._close(callback, [{'path': fullname}], server)
         except Exception as e:
             # TODO: Fix the silent failing
             if errback is not None:
@@ -155,6 +392,19 @@ class Downloader(object):
         if errback is None:
             errback = self._default_error_callback
 
+        # Reuse an intact copy from a previous download, placed where this
+        # download would have saved it.
+        if self.file_index is not None and not self.overwrite:
+            entry = self.file_index.lookup(url)
+            if entry is not None:
+                try:
+                    fullname = self.file_index.place(entry, path(_IndexedResponse(entry), url))
+                except Exception as e:
+                    errback(e)
+                else:
+                    callback({'path': fullname, 'skipped': True, 'size': entry.size})
+                return
+
         # Attempt to download file from URL
         if not self._attempt_download(url, path, callback, errback):
             # If there are too many concurrent downloads, queue for later
@@ -193,6 +443,9 @@ class Results(object):
         self.evt = threading.Event()
         self.errors = []
         self.lock = threading.RLock()
+        # Files reused from a previous download instead of being transferred
+        self.skipped = 0
+        self.bytes_saved = 0
 
         self.progress = None
 
@@ -207,6 +460,10 @@ class Results(object):
         value : object
             value to save
         """
+        if isinstance(value, dict) and value.get('skipped'):
+            with self.lock:
+                self.skipped += 1
+                self.bytes_saved += value.get('size', 0)
         for key in keys:
             self.map_[key] = value
         self.poke()
@@ -252,6 +509,8 @@ class Results(object):
             pass
         if progress:
             self.progress.finish()
+        # Write the file indices once for the whole batch of downloads
+        save_file_indices()
 
         return self.map_
 
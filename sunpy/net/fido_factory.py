@@ -82,18 +82,16 @@ class UnifiedResponse(Sequence):
         Given a slice to be applied to the results from a single client, return
         an object of the same type as client_resp.
         """
-        # When we subindex, we want to persist the type of the response object.
-        resp_type = type(client_resp)
-
         # Make sure we always have an iterable, as most of the response objects
         # expect one.
         if isinstance(record_slice, int):
-            resp = [client_resp[record_slice]]
-        else:
-            resp = client_resp[record_slice]
+            if not -len(client_resp) <= record_slice < len(client_resp):
+                raise IndexError("Record index {} is out of range.".format(record_slice))
+            record_slice = slice(record_slice, (record_slice + 1) or None)
 
-        # Reconstruct a response object with the sub-indexed records.
-        ret = resp_type(resp)
+        # Slicing a response gives a response of the same type, which shares
+        # the records and table rather than copying them.
+        ret = client_resp[record_slice]
         # Make sure we pass the client back out again.
         ret.client = client_resp.client
 
@@ -230,6 +228,14 @@ class DownloadResponse(list):
 
         return filelist
 
+    @property
+    def bytes_saved(self):
+        """
+        Number of bytes not transferred because the files were already present
+        from an earlier download.
+        """
+        return sum(getattr(resobj, 'bytes_saved', 0) for resobj in self)
+
 
 """
 Construct a simple AttrWalker to split up searches into blocks of attrs being
@@ -5,30 +5,182 @@ import os
 import json
 import errno
 import codecs
-import urllib
+import weakref
+import hashlib
+import threading
+import http.client
+import urllib.error
+import urllib.parse
+import urllib.request
+from functools import partial
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+
+import astropy.units as u
 from astropy.utils.decorators import lazyproperty
 
 import sunpy
 from sunpy.util.xml import xml_to_dict
 from sunpy.time import parse_time
-from sunpy.util.net import download_fileobj
+from sunpy.util.net import download_fileobj, get_system_filename
+from sunpy.util import replacement_filename
+from sunpy.net.download import get_file_index, save_file_indices
 
 
 __all__ = ['HelioviewerClient']
 
 
+class _PooledResponse(http.client.HTTPResponse):
+    """
+    A response which hands its connection back to the pool once the body has
+    been read, or drops it if the response is closed before that.
+    """
+    _release = None
+
+    def close(self):
+        if self.fp is not None:
+            # Unread data is left on the connection, so it can't be reused
+            self.will_close = True
+        super().close()
+
+    def _close_conn(self):
+        super()._close_conn()
+        release, self._release = self._release, None
+        if release is not None:
+            release(not self.will_close)
+
+
+class _PooledHTTPConnection(http.client.HTTPConnection):
+    response_class = _PooledResponse
+
+
+class _PooledHTTPSConnection(http.client.HTTPSConnection):
+    response_class = _PooledResponse
+
+
+class _KeepAliveHandler(urllib.request.HTTPHandler, urllib.request.HTTPSHandler):
+    """
+    Opens HTTP(S) requests on persistent connections, kept in a pool per
+    host so that consecutive and concurrent requests reuse them.
+
+    It replaces the default HTTP and HTTPS handlers in an opener from
+    `urllib.request.build_opener`, so the proxy and redirect handlers of
+    the opener still apply.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def http_open(self, req):
+        return self._open(_PooledHTTPConnection, req)
+
+    def https_open(self, req):
+        return self._open(_PooledHTTPSConnection, req, context=self._context)
+
+    def close(self):
+        """
+        Close all the idle connections.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _open(self, http_class, req, **http_conn_args):
+        if not req.host:
+            raise urllib.error.URLError('no host given')
+        key = (http_class, req.host, req._tunnel_host)
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers["Connection"] = "keep-alive"
+        headers = {name.title(): val for name, val in headers.items()}
+        tunnel_headers = {}
+        if "Proxy-Authorization" in headers and req._tunnel_host:
+            # Proxy-Authorization should not be sent to origin server.
+            tunnel_headers["Proxy-Authorization"] = headers.pop("Proxy-Authorization")
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                conn = idle.pop() if idle else None
+            reused = conn is not None
+            if conn is None:
+                conn = http_class(req.host, timeout=req.timeout, **http_conn_args)
+                conn.set_debuglevel(self._debuglevel)
+                if req._tunnel_host:
+                    conn.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            try:
+                conn.request(req.get_method(), req.selector, req.data, headers,
+                             encode_chunked=req.has_header('Transfer-encoding'))
+                response = conn.getresponse()
+            except OSError as err:
+                conn.close()
+                if reused and isinstance(err, ConnectionError):
+                    # The server closed the idle connection, try a new one
+                    continue
+                raise urllib.error.URLError(err)
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        def release(reusable):
+            if reusable:
+                with self._lock:
+                    self._idle.setdefault(key, []).append(conn)
+            else:
+                conn.close()
+
+        if response.isclosed():
+            release(not response.will_close)
+        else:
+            response._release = release
+        response.url = req.get_full_url()
+        # urllib clients expect the reason in .msg
+        response.msg = response.reason
+        return response
+
+
 class HelioviewerClient(object):
     """Helioviewer.org Client"""
-    def __init__(self, url="https://api.helioviewer.org/"):
+    def __init__(self, url="https://api.helioviewer.org/", cache=False,
+                 closest_image_bucket=None):
         """
         Parameters
         ----------
         url : `str`
             Default URL points to the Helioviewer API.
+        cache : `bool`, optional
+            Defaults to False.
+            If set to True, JSON responses are kept in memory and downloaded
+            files are reused as long as they are intact on disk, both keyed
+            on the normalised request parameters. Requests which are cached
+            never hit the API again, unless a file is downloaded with
+            ``overwrite=True``.
+        closest_image_bucket : `~astropy.units.Quantity`, optional
+            Defaults to None.
+            If set, `get_closest_image` results are cached per source id and
+            time bucket of this width, so that all dates within one bucket
+            are answered by a single API call.
         """
         self._api = url
+        self._cache = cache
+        self._closest_image_bucket = (None if closest_image_bucket is None else
+                                      u.Quantity(closest_image_bucket, u.s).value)
+        self._json_cache = {}
+        self._closest_image_cache = {}
+        self._cache_lock = threading.Lock()
+        # Requests share persistent connections, the proxy settings are read
+        # from the environment when the client is created.
+        self._connections = _KeepAliveHandler()
+        self._opener = urllib.request.build_opener(self._connections)
+        weakref.finalize(self, self._connections.close)
 
     @lazyproperty
     def data_sources(self):
@@ -118,16 +270,28 @@ class HelioviewerClient(object):
                                "do not correspond to a source_id. Please check the list using "
                                "HelioviewerClient.data_sources.")
 
+        bucket_key = None
+        if self._closest_image_bucket is not None:
+            bucket = np.floor(parse_time(date).unix / self._closest_image_bucket)
+            bucket_key = (source_id, bucket)
+            with self._cache_lock:
+                if bucket_key in self._closest_image_cache:
+                    return dict(self._closest_image_cache[bucket_key])
+
         params = {
             "action": "getClosestImage",
             "date": self._format_date(date),
             "sourceId": source_id
         }
-        response = self._get_json(params)
+        response = dict(self._get_json(params))
 
         # Cast date string to Time
         response['date'] = parse_time(response['date'])
 
+        if bucket_key is not None:
+            with self._cache_lock:
+                self._closest_image_cache[bucket_key] = dict(response)
+
         return response
 
     def download_jp2(self, date, observatory=None, instrument=None, detector=None,
@@ -191,6 +355,71 @@ class HelioviewerClient(object):
 
         return self._get_file(params, directory=directory, overwrite=overwrite)
 
+    def download_jp2_multiple(self, dates, observatory=None, instrument=None, detector=None,
+                              measurement=None, source_id=None, directory=None,
+                              overwrite=False, max_conn=5):
+        """
+        Downloads the JPEG 2000 images that most closely match each of the
+        specified times for one data source, using several connections at once.
+
+        Parameters
+        ----------
+        dates : iterable of `astropy.time.Time` or `str`
+            The desired dates of the images.
+        observatory : `str`
+            Observatory name
+        instrument : `str`
+            Instrument name
+        measurement : `str`
+            Measurement name
+        detector : `str`
+            Detector name
+        source_id : `int`
+            ID number for the required instrument/measurement.
+            This can be used directly instead of using the previous parameters.
+        directory : `str`
+            Directory to download JPEG 2000 images to.
+        overwrite : bool
+            Defaults to False.
+            If set to True, will overwrite any files with the same name.
+        max_conn : `int`
+            Defaults to 5.
+            Maximum number of simultaneous connections to the API.
+
+        Returns
+        -------
+        out : `list` of `str`
+            The filepaths of the downloaded images, in the order of ``dates``.
+
+        Examples
+        --------
+        >>> from sunpy.net import helioviewer
+        >>> hv = helioviewer.HelioviewerClient()  # doctest: +REMOTE_DATA
+        >>> filepaths = hv.download_jp2_multiple(['2012/07/03 14:30:00', '2012/07/03 15:30:00'],
+        ...                                      observatory='SDO', instrument='HMI',
+        ...                                      measurement='continuum')  # doctest: +SKIP
+        """
+        if source_id is None:
+            try:
+                key = (observatory, instrument, detector, measurement)
+                source_id = self.data_sources[key]
+            except KeyError:
+                raise KeyError("The values used for observatory, instrument, detector, measurement "
+                               "do not correspond to a source_id. Please check the list using "
+                               "HelioviewerClient.data_sources.")
+
+        def download(date):
+            return self.download_jp2(date, source_id=source_id, directory=directory,
+                                     overwrite=overwrite)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_conn) as executor:
+                filepaths = list(executor.map(download, dates))
+        finally:
+            self._connections.close()
+        save_file_indices()
+        return filepaths
+
     def get_jp2_header(self, date, observatory=None, instrument=None, detector=None, measurement=None, jp2_id=None):
         """
         Get the XML header embedded in a JPEG2000 image. Includes the FITS header as well as a section 
@@ -404,9 +633,23 @@ class HelioviewerClient(object):
 
     def _get_json(self, params):
         """Returns a JSON result as a string."""
+        key = self._cache_key(params)
+        if self._cache:
+            with self._cache_lock:
+                if key in self._json_cache:
+                    return self._json_cache[key]
+
         reader = codecs.getreader("utf-8")
         response = self._request(params)
-        return json.load(reader(response))
+        try:
+            result = json.load(reader(response))
+        finally:
+            response.close()
+
+        if self._cache:
+            with self._cache_lock:
+                self._json_cache[key] = result
+        return result
 
     def _get_file(self, params, directory=None, overwrite=False):
         """Downloads a file and return the filepath to that file."""
@@ -422,14 +665,50 @@ class HelioviewerClient(object):
             if e.errno != errno.EEXIST:
                 raise OSError('Tried to create a directory and it failed.')
 
+        if not self._cache:
+            response = self._request(params)
+            try:
+                filepath = download_fileobj(response, directory, overwrite=overwrite)
+            finally:
+                response.close()
+            return filepath
+
+        key = self._cache_key(params)
+        file_index = get_file_index()
+        entry = None if overwrite else file_index.lookup(key)
+        if entry is not None:
+            filepath = os.path.join(directory, os.path.basename(entry.path))
+            if os.path.dirname(entry.path) != directory and os.path.exists(filepath):
+                filepath = replacement_filename(filepath)
+            return file_index.place(entry, filepath)
+
         response = self._request(params)
         try:
-            filepath = download_fileobj(response, directory, overwrite=overwrite)
+            filename = get_system_filename(response, '').decode('utf-8')
+            filepath = os.path.join(directory, filename)
+            if not overwrite and os.path.exists(filepath):
+                filepath = replacement_filename(filepath)
+            # Hash while writing so the file is not read again for the index
+            digest = hashlib.sha256()
+            with open(filepath, 'wb') as fd:
+                for chunk in iter(partial(response.read, 2**16), b''):
+                    fd.write(chunk)
+                    digest.update(chunk)
         finally:
             response.close()
 
+        file_index.record(key, filepath, digest.hexdigest(),
+                          response.headers.get('Content-Disposition'))
         return filepath
 
+    def _cache_key(self, params):
+        """
+        Returns a key for the request which does not depend on the order or
+        type of the parameters.
+        """
+        return "{}?{}".format(self._api, urllib.parse.urlencode(
+            sorted((key, str(value)) for key, value in params.items())))
+
     def _request(self, params):
         """
         Sends an API request and returns the result.
@@ -443,7 +722,7 @@ class HelioviewerClient(object):
         -------
         out : result of the request
         """
-        response = urllib.request.urlopen(
+        response = self._opener.open(
             self._api, urllib.parse.urlencode(params).encode('utf-8'))
         return response
 
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 import os
 import time
-import urllib
 import warnings
+import itertools
 from functools import partial
 from collections import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import drms
 import numpy as np
@@ -16,7 +17,7 @@ from astropy.utils.misc import isiterable
 
 from sunpy import config
 from sunpy.net.base_client import BaseClient
-from sunpy.net.download import Downloader, Results
+from sunpy.net.download import Downloader, Results, get_file_index
 from sunpy.net.attr import and_
 from sunpy.net.jsoc.attrs import walker
 
@@ -26,11 +27,35 @@ __all__ = ['JSOCClient', 'JSOCResponse']
 PKEY_LIST_TIME = {'T_START', 'T_REC', 'T_OBS', 'MidTime', 'OBS_DATE',
                   'obsdate', 'DATE_OBS', 'starttime', 'stoptime', 'UTC_StartTime'}
 
+# Maximum number of record set specifications joined into a single drms call,
+# this keeps the length of the request URL within limits.
+MAX_BATCH_SIZE = 50
+
 
 def simple_path(path, sock, url):
     return path
 
 
+def _batch_key(block):
+    """
+    Blocks that only differ in their time range can be combined into one
+    record set list.
+    """
+    return sorted((key, repr(value)) for key, value in block.items()
+                  if key not in ('start_time', 'end_time'))
+
+
+def _batches(blocks, batch_size=MAX_BATCH_SIZE):
+    """
+    Split a list of query blocks into batches of consecutive blocks that can
+    be combined, preserving their order.
+    """
+    for _, group in itertools.groupby(blocks, key=_batch_key):
+        group = list(group)
+        for i in range(0, len(group), batch_size):
+            yield group[i:i + batch_size]
+
+
 class NotExportedError(Exception):
     pass
 
@@ -333,7 +358,9 @@ class JSOCClient(BaseClient):
             iargs = kwargs.copy()
             iargs.update(block)
             blocks.append(iargs)
-            return_results.append(self._lookup_records(iargs))
+
+        for batch in _batches(blocks):
+            return_results.append(self._lookup_records(*batch))
 
         return_results.query_args = blocks
         return return_results
@@ -391,7 +418,9 @@ class JSOCClient(BaseClient):
             iargs.update(block)
             iargs.update({'meta': True})
             blocks.append(iargs)
-            res = res.append(self._lookup_records(iargs))
+
+        for batch in _batches(blocks):
+            res = res.append(self._lookup_records(*batch))
 
         return res
 
@@ -417,10 +446,12 @@ class JSOCClient(BaseClient):
 
         requests = []
         self.query_args = jsoc_response.query_args
-        for block in jsoc_response.query_args:
-
-            ds = self._make_recordset(**block)
-            cd = drms.Client(email=block.get('notify', ''))
+        # Blocks which only differ in time are exported as one request
+        for batch in _batches(jsoc_response.query_args):
+            block = batch[0]
+            ds = ','.join(self._make_recordset(**dict(b, primekey=dict(b.get('primekey', {}))))
+                          for b in batch)
+            cd = self._drms_client(block.get('notify', ''))
             protocol = block.get('protocol', 'fits')
 
             if protocol != 'fits' and protocol != 'as-is':
@@ -483,14 +514,70 @@ class JSOCClient(BaseClient):
         jsoc_response.requests = [r for r in responses]
         time.sleep(sleep/2.)
 
+        self.wait_for_requests(responses, sleep=sleep, progress=progress)
+
+        # All the requests share one pool of connections
+        if downloader is None:
+            downloader = Downloader(max_conn=max_conn, max_total=max_conn,
+                                    file_index=get_file_index(), overwrite=overwrite)
+
         r = Results(lambda x: None, done=lambda maps: [v['path'] for v in maps.values()])
 
-        for response in responses:
-            response.wait(verbose=progress)
-            r = self.get_request(response, path=path, overwrite=overwrite,
-                                 progress=progress, results=r)
+        return self.get_request(responses, path=path, overwrite=overwrite,
+                                progress=progress, downloader=downloader, results=r)
+
+    def wait_for_requests(self, requests, sleep=10, max_sleep=120, timeout=None,
+                          progress=True):
+        """
+        Wait for several export requests to be staged, polling their status
+        concurrently.
+
+        The interval between two status checks of a request starts at ``sleep``
+        seconds and is doubled after every check, up to ``max_sleep``.
+
+        Parameters
+        ----------
+        requests : `~drms.ExportRequest` or `list`
+            The export requests to wait for.
+
+        sleep : `float`
+            Initial number of seconds to wait between two status checks.
+
+        max_sleep : `float`
+            Maximum number of seconds to wait between two status checks.
+
+        timeout : `float`, optional
+            Maximum number of seconds to wait for each request.
+
+        progress : `bool`
+            Print a message when a request has been staged.
+
+        Returns
+        -------
+        requests : `list`
+            The list of `~drms.ExportRequest` objects.
+        """
+        if not isiterable(requests):
+            requests = [requests]
+        requests = list(requests)
+        if not requests:
+            return requests
+
+        def wait(request):
+            start = time.time()
+            delay = sleep
+            while not request.has_finished():
+                if timeout is not None and time.time() - start + delay > timeout:
+                    raise NotExportedError("Request {} was not staged within {} "
+                                           "seconds.".format(request.id, timeout))
+                time.sleep(delay)
+                delay = min(delay * 2, max_sleep)
+            if progress:
+                print("Request {} staged.".format(request.id))
+            return request
 
-        return r
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            return list(executor.map(wait, requests))
 
     def get_request(self, requests, path=None, overwrite=False, progress=True,
                     max_conn=5, downloader=None, results=None):
@@ -529,11 +616,12 @@ class JSOCClient(BaseClient):
             A `~sunpy.net.download.Results` instance or `None` if no URLs to download
 
         """
-        c = drms.Client()
+        c = self._drms_client()
 
         # Convert Responses to a list if not already
         if isinstance(requests, str) or not isiterable(requests):
             requests = [requests]
+        requests = list(requests)
 
         # Ensure all the requests are drms ExportRequest objects
         for i, request in enumerate(requests):
@@ -553,22 +641,13 @@ class JSOCClient(BaseClient):
         elif isinstance(path, str) and '{file}' not in path:
             path = os.path.join(path, '{file}')
 
-        paths = []
-        for request in requests:
-            for filename in request.data['filename']:
-                # Ensure we don't duplicate the file extension
-                ext = os.path.splitext(filename)[1]
-                if path.endswith(ext):
-                    fname = path.strip(ext)
-                else:
-                    fname = path
-                fname = fname.format(file=filename)
-                fname = os.path.expanduser(fname)
-                fname = partial(simple_path, fname)
-                paths.append(fname)
+        paths = [partial(simple_path, fname) for request in requests
+                 for fname in self._make_paths(path, request.data['filename'])]
 
+        file_index = get_file_index()
         if downloader is None:
-            downloader = Downloader(max_conn=max_conn, max_total=max_conn)
+            downloader = Downloader(max_conn=max_conn, max_total=max_conn,
+                                    file_index=file_index, overwrite=overwrite)
 
         # A Results object tracks the number of downloads requested and the
         # number that have been completed.
@@ -577,31 +656,48 @@ class JSOCClient(BaseClient):
                               done=lambda maps: [v['path'] for v in maps.values()])
 
         urls = []
+        url_paths = []
+        offset = 0
         for request in requests:
 
             if request.status == 0:
-                for index, data in request.data.iterrows():
-                    is_file = os.path.isfile(paths[index].args[0])
-                    if overwrite or not is_file:
-                        url_dir = request.request_url + '/'
-                        urls.append(urllib.parse.urljoin(url_dir, data['filename']))
-
-                    if not overwrite and is_file:
+                filenames = request.data['filename'].values
+                request_urls = (request.request_url + '/' + request.data['filename']).values
+                for index, (filename, url) in enumerate(zip(filenames, request_urls)):
+                    fname = paths[offset + index].args[0]
+
+                    # Prefer the index as it also knows about files saved to
+                    # another path, fall back to any file at the target path.
+                    existing = None
+                    if not overwrite:
+                        entry = file_index.lookup(url)
+                        if entry is not None:
+                            existing = file_index.place(entry, fname)
+                        elif os.path.isfile(fname):
+                            existing = fname
+
+                    if existing is None:
+                        urls.append(url)
+                        url_paths.append(paths[offset + index])
+                    else:
                         print_message = "Skipping download of file {} as it " \
                                         "has already been downloaded. " \
                                         "If you want to redownload the data, "\
                                         "please set overwrite to True"
-                        print(print_message.format(data['filename']))
+                        print(print_message.format(filename))
                         # Add the file on disk to the output
-                        results.map_.update({data['filename']:
-                                            {'path': paths[index].args[0]}})
+                        with results.lock:
+                            results.map_.update({filename: {'path': existing}})
+                            results.skipped += 1
+                            results.bytes_saved += os.path.getsize(existing)
+            offset += len(request.data)
         if urls:
             if progress:
                 print_message = "{0} URLs found for download. Full request totalling {1}MB"
                 print(print_message.format(len(urls), request._d['size']))
-            for i, url in enumerate(urls):
+            for url, fname in zip(urls, url_paths):
                 downloader.download(url, callback=results.require([url]),
-                                    errback=lambda x: print(x), path=paths[i])
+                                    errback=lambda x: print(x), path=fname)
 
         else:
             # Make Results think it has finished.
@@ -610,6 +706,35 @@ class JSOCClient(BaseClient):
 
         return results
 
+    @staticmethod
+    def _make_paths(path, filenames):
+        """
+        Build the local paths for a column of filenames from a path template
+        containing ``{file}``.
+        """
+        filenames = pd.Series(filenames, dtype=object).reset_index(drop=True)
+        exts = filenames.str.extract(r'(\.[^./]*)$', expand=False).fillna('')
+        fnames = pd.Series(index=filenames.index, dtype=object)
+        # Files of one request nearly always share an extension, so only
+        # format the template once per extension.
+        for ext in exts.unique():
+            # Ensure we don't duplicate the file extension
+            template = path[:-len(ext)] if ext and path.endswith(ext) else path
+            prefix, _, suffix = os.path.expanduser(template).partition('{file}')
+            mask = (exts == ext).values
+            fnames[mask] = prefix + filenames[mask] + suffix
+        return list(fnames)
+
+    def _drms_client(self, email=''):
+        """
+        Return a drms client for ``email`` that is shared by all the calls of
+        this client, so information about a series is only requested once.
+        """
+        clients = self.__dict__.setdefault('_drms_clients', {})
+        if email not in clients:
+            clients[email] = drms.Client(email=email) if email else drms.Client()
+        return clients[email]
+
     def _make_recordset(self, series, start_time='', end_time='', wavelength='',
                         segment='', primekey={}, **kwargs):
         """
@@ -744,7 +869,7 @@ class JSOCClient(BaseClient):
 
         # Extract and format primekeys
         pkstr = ''
-        c = drms.Client()
+        c = self._drms_client()
         si = c.info(series)
         pkeys_isTime = si.keywords.loc[si.primekeys].is_time
         for pkey in pkeys_isTime.index.values:
@@ -770,19 +895,50 @@ class JSOCClient(BaseClient):
 
         return dataset
 
-    def _lookup_records(self, iargs):
+    def _lookup_records(self, *batch):
         """
         Do a LookData request to JSOC to workout what results the query returns.
-        """
 
-        keywords_default = ['T_REC', 'TELESCOP', 'INSTRUME', 'WAVELNTH', 'CAR_ROT']
+        Several query blocks which only differ in their time range can be
+        passed, they are then looked up in a single request.
+        """
+        c = self._drms_client()
+        datasets = [self._check_block(c, iargs) for iargs in batch]
+        iargs = batch[0]
         isMeta = iargs.get('meta', False)
-        c = drms.Client()
+        keywords = self._keywords(iargs)
+
+        # Convert the list of keywords into comma-separated string.
+        if isinstance(keywords, list):
+            key = str(keywords)[1:-1].replace(' ', '').replace("'", '')
+        else:
+            key = keywords
+
+        r = c.query(','.join(datasets), key=key, rec_index=isMeta)
 
+        # If the method was called from search_metadata(), return a Pandas Dataframe,
+        # otherwise return astropy.table
         if isMeta:
-            keywords = '**ALL**'
+            return r
+
+        if r is None or r.empty:
+            return astropy.table.Table()
         else:
-            keywords = iargs.get('keys', keywords_default)
+            return astropy.table.Table.from_pandas(r)
+
+    @staticmethod
+    def _keywords(iargs):
+        keywords_default = ['T_REC', 'TELESCOP', 'INSTRUME', 'WAVELNTH', 'CAR_ROT']
+        if iargs.get('meta', False):
+            return '**ALL**'
+        return iargs.get('keys', keywords_default)
+
+    def _check_block(self, c, iargs):
+        """
+        Validate a query block against the series it requests and return its
+        record set specification.
+        """
+        keywords = self._keywords(iargs)
 
         if 'series' not in iargs:
             error_message = "Series must be specified for a JSOC Query"
@@ -838,25 +994,8 @@ class JSOCClient(BaseClient):
         # If Time has been passed as a PrimeKey, convert the Time object into TAI time scale,
         # and then, convert it to datetime object.
 
-        ds = self._make_recordset(**iargs)
-
-        # Convert the list of keywords into comma-separated string.
-        if isinstance(keywords, list):
-            key = str(keywords)[1:-1].replace(' ', '').replace("'", '')
-        else:
-            key = keywords
-
-        r = c.query(ds, key=key, rec_index=isMeta)
-
-        # If the method was called from search_metadata(), return a Pandas Dataframe,
-        # otherwise return astropy.table
-        if isMeta:
-            return r
-
-        if r is None or r.empty:
-            return astropy.table.Table()
-        else:
-            return astropy.table.Table.from_pandas(r)
+        # _make_recordset consumes the primekey dict, so leave the block intact
+        return self._make_recordset(**dict(iargs, primekey=dict(iargs.get('primekey', {}))))
 
     @classmethod
     def _can_handle_query(cls, *query):
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 import os
+import operator
 import tempfile
+import functools
+from unittest import mock
+
 import pandas as pd
 import astropy.table
 import astropy.time
@@ -8,6 +12,7 @@ import astropy.units as u
 import pytest
 
 from sunpy.net.jsoc import JSOCClient, JSOCResponse
+from sunpy.net.jsoc.jsoc import NotExportedError, _batches
 from sunpy.net.download import Results
 import sunpy.net.jsoc.attrs as attrs
 import sunpy.net.vso.attrs as vso_attrs
@@ -309,3 +314,123 @@ def test_results_filenames():
     assert len(files) == len(responses)
     for hmiurl in aa.map_:
         assert os.path.isfile(hmiurl)
+
+
+class MockSeriesInfo:
+    primekeys = ['T_REC']
+    keywords = pd.DataFrame({'is_time': [True]}, index=['T_REC'])
+    segments = pd.DataFrame(index=['magnetogram'])
+
+
+class MockExportRequest:
+    def __init__(self, ds, polls=0):
+        self.ds = ds
+        self.id = 'JSOC_{}'.format(len(ds))
+        self.polls = polls
+        self.checks = 0
+        self.status = 0
+        self.request_url = 'http://jsoc.stanford.edu/SUM1/D1/S00000'
+        self.data = pd.DataFrame({'filename': ['hmi.m_45s.{}.magnetogram.fits'.format(i)
+                                               for i in range(3)]})
+        self._d = {'size': 1}
+
+    def has_finished(self):
+        self.checks += 1
+        return self.checks > self.polls
+
+    def has_succeeded(self):
+        return True
+
+
+class MockDrmsClient:
+    def __init__(self, email=''):
+        self.queries = []
+        self.exports = []
+        self.info_calls = 0
+
+    def info(self, series):
+        self.info_calls += 1
+        return MockSeriesInfo()
+
+    def pkeys(self, series):
+        return list(self.info(series).primekeys)
+
+    def query(self, ds, key=None, rec_index=False):
+        self.queries.append(ds)
+        return pd.DataFrame({'T_REC': ['t{}'.format(i) for i in range(ds.count('['))]})
+
+    def export(self, ds, method='url', protocol='fits'):
+        self.exports.append(ds)
+        return MockExportRequest(ds)
+
+
+@pytest.fixture
+def mock_drms():
+    drms_client = MockDrmsClient()
+    with mock.patch('sunpy.net.jsoc.jsoc.drms.Client', return_value=drms_client):
+        yield drms_client
+
+
+def _time_blocks(n):
+    times = [vso_attrs.Time('2014/1/{}T00:00:00'.format(i + 1), '2014/1/{}T00:10:00'.format(i + 1))
+             for i in range(n)]
+    return functools.reduce(operator.or_, times)
+
+
+def test_search_batches_time_blocks(mock_drms):
+    jclient = JSOCClient()
+    response = jclient.search(_time_blocks(5), attrs.Series('hmi.m_45s'),
+                              attrs.Notify('jsoc@cadair.com'))
+    assert len(response.query_args) == 5
+    assert len(mock_drms.queries) == 1
+    assert mock_drms.queries[0].count('hmi.m_45s[') == 5
+    assert len(response) == 5
+
+
+def test_batches():
+    batches = list(_batches([{'series': 'a', 'start_time': i} for i in range(5)], 2))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    # Only consecutive blocks are combined so the order of the results is kept
+    batches = list(_batches([{'series': 'a'}, {'series': 'b'}, {'series': 'a'}]))
+    assert [batch[0]['series'] for batch in batches] == ['a', 'b', 'a']
+
+
+def test_request_data_batches_time_blocks(mock_drms):
+    jclient = JSOCClient()
+    response = jclient.search(_time_blocks(3), attrs.Series('hmi.m_45s'),
+                              attrs.Notify('jsoc@cadair.com'))
+    request = jclient.request_data(response)
+    assert len(mock_drms.exports) == 1
+    assert request.ds.count('hmi.m_45s[') == 3
+    # The query blocks are not consumed by building the record sets
+    assert jclient.request_data(response).ds == request.ds
+
+
+def test_wait_for_requests():
+    requests = [MockExportRequest('a', polls=i) for i in range(4)]
+    assert client.wait_for_requests(requests, sleep=0.001, progress=False) == requests
+    assert [r.checks for r in requests] == [1, 2, 3, 4]
+
+    with pytest.raises(NotExportedError):
+        client.wait_for_requests(MockExportRequest('a', polls=100), sleep=0.01,
+                                 timeout=0.05, progress=False)
+
+
+def test_make_paths():
+    filenames = ['a.fits', 'b.fits', 'c.txt']
+    assert JSOCClient._make_paths('/data/{file}', filenames) == ['/data/a.fits', '/data/b.fits',
+                                                                '/data/c.txt']
+    assert JSOCClient._make_paths('/data/{file}.fits', filenames) == ['/data/a.fits',
+                                                                     '/data/b.fits',
+                                                                     '/data/c.txt.fits']
+
+
+def test_get_request_skips_existing(mock_drms, tmpdir):
+    request = MockExportRequest('hmi.m_45s[]')
+    for filename in request.data['filename']:
+        tmpdir.join(filename).write_binary(b'abc')
+    res = JSOCClient().get_request(request, path=str(tmpdir), progress=False)
+    assert res.skipped == 3
+    assert res.bytes_saved == 9
+    assert sorted(res.wait(progress=False)) == sorted(
+        str(tmpdir.join(f)) for f in request.data['filename'])
@@ -13,7 +13,8 @@ from functools import partial
 
 import sunpy
 
-from sunpy.net.download import Downloader, default_name
+from sunpy.net.download import (Downloader, Results, FileIndex, default_name,
+                                 save_file_indices)
 
 
 class CalledProxy(object):
@@ -165,3 +166,100 @@ def test_download_dir():
     assert not timeout.fired
     assert not errback.fired
     assert os.path.exists(os.path.join(tmpdir, 'jquery.min.js'))
+
+
+def _file_url(tmpdir, name, content):
+    source = tmpdir.join(name)
+    source.write_binary(content)
+    return 'file://' + str(source)
+
+
+def _download_once(dw, url, path):
+    items = []
+    errors = []
+    done = threading.Event()
+
+    def callback(item):
+        items.append(item)
+        done.set()
+
+    def errback(e):
+        errors.append(e)
+        done.set()
+
+    dw.download(url, path, callback, errback)
+    assert done.wait(10)
+    return items, errors
+
+
+def test_file_index_record_and_lookup(tmpdir):
+    index = FileIndex(str(tmpdir.join('index.json')))
+    target = tmpdir.join('data.fits')
+    target.write_binary(b'0123456789')
+
+    entry = index.record('http://example.com/data.fits', str(target))
+    assert entry.size == 10
+    assert index.lookup('http://example.com/data.fits') == entry
+    assert 'http://example.com/data.fits' in index
+    assert index.lookup('http://example.com/other.fits') is None
+
+    # The index is persisted once saved and can be reloaded
+    assert not os.path.exists(str(tmpdir.join('index.json')))
+    save_file_indices()
+    assert FileIndex(str(tmpdir.join('index.json'))).lookup('http://example.com/data.fits')
+
+
+def test_file_index_detects_changes(tmpdir):
+    index = FileIndex()
+    target = tmpdir.join('data.fits')
+    target.write_binary(b'0123456789')
+    index.record('http://example.com/data.fits', str(target))
+
+    # Same size but different content
+    target.write_binary(b'9876543210')
+    os.utime(str(target), (0, 0))
+    assert index.lookup('http://example.com/data.fits') is None
+
+    target.remove()
+    assert index.lookup('http://example.com/data.fits') is None
+
+
+def test_download_skips_indexed_file(tmpdir):
+    url = _file_url(tmpdir, 'source.txt', b'some data')
+    outdir = tmpdir.mkdir('out')
+    index = FileIndex()
+
+    dw = Downloader(1, 1, file_index=index)
+    items, errors = _download_once(dw, url, str(outdir))
+    assert not errors
+    assert not items[0].get('skipped')
+    assert index.lookup(url).path == items[0]['path']
+
+    items, errors = _download_once(dw, url, str(outdir))
+    assert items[0]['skipped']
+    assert items[0]['size'] == len(b'some data')
+
+    results = Results(lambda x: None, 0)
+    results.require([url])(items[0])
+    assert results.skipped == 1
+    assert results.bytes_saved == len(b'some data')
+
+    dw = Downloader(1, 1, file_index=index, overwrite=True)
+    items, errors = _download_once(dw, url, str(tmpdir.mkdir('again')))
+    assert not items[0].get('skipped')
+
+
+def test_download_indexed_file_to_other_path(tmpdir):
+    url = _file_url(tmpdir, 'source.txt', b'some data')
+    index = FileIndex()
+    dw = Downloader(1, 1, file_index=index)
+    items, errors = _download_once(dw, url, str(tmpdir.mkdir('out')))
+    first = items[0]['path']
+
+    # A hit in another directory is placed there rather than returned as is
+    items, errors = _download_once(dw, url, str(tmpdir.join('other')))
+    assert not errors
+    assert items[0]['skipped']
+    assert items[0]['path'] == str(tmpdir.join('other', 'source.txt'))
+    assert tmpdir.join('other', 'source.txt').read_binary() == b'some data'
+    assert index.lookup(url).path == first
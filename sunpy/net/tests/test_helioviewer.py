@@ -2,13 +2,22 @@
 Helioviewer Client tests
 """
 import os
+import json
 import urllib
+import urllib.request
+import threading
+import http.server
 from collections import OrderedDict
 import pytest
 
+import astropy.units as u
+
 import sunpy
 import sunpy.map
+from sunpy.time import parse_time
 from sunpy.tests.helpers import skip_glymur
+from sunpy.net import helioviewer
+from sunpy.net.download import FileIndex
 from sunpy.net.helioviewer import HelioviewerClient
 
 
@@ -145,3 +154,157 @@ class TestHelioviewerClient:
         assert filepath_3 == filepath
         os.remove(filepath)
         os.remove(filepath_2)
+
+
+class _StandInHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers Helioviewer API requests with canned responses.
+    """
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which stalls on persistent
+    # connections when Nagle's algorithm is on.
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        params = dict(urllib.parse.parse_qsl(self.rfile.read(length).decode('utf-8')))
+        self.server.requests.append(params)
+        self.server.paths.append(self.path)
+        self.server.clients.append(self.client_address)
+        if params['action'] == 'getClosestImage':
+            body = json.dumps({'id': '1', 'date': '2012-01-01 00:00:07',
+                               'name': 'AIA 171'}).encode('utf-8')
+            ctype = 'application/json'
+            extra = {}
+        else:
+            body = b'jp2' * 100
+            ctype = 'image/jp2'
+            extra = {'Content-Disposition':
+                     'attachment; filename="{}.jp2"'.format(params['date'].replace(':', '_'))}
+        self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in extra.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.clients.append(self.client_address)
+        if self.path == '/moved':
+            self.send_response(301)
+            self.send_header('Location', '/')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StandInHandler)
+    server.requests = []
+    server.paths = []
+    server.clients = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _stand_in_url(server):
+    return "http://127.0.0.1:{}/".format(server.server_address[1])
+
+
+@pytest.fixture
+def file_index(monkeypatch):
+    index = FileIndex()
+    monkeypatch.setattr(helioviewer, 'get_file_index', lambda: index)
+    return index
+
+
+def test_proxy_is_used(stand_in, monkeypatch):
+    monkeypatch.setenv('http_proxy', _stand_in_url(stand_in))
+    monkeypatch.delenv('no_proxy', raising=False)
+    client = HelioviewerClient('http://api.helioviewer.invalid/')
+    assert client.get_closest_image('2012/01/01', source_id=10)['id'] == '1'
+    assert client.get_closest_image('2012/01/02', source_id=10)['id'] == '1'
+    assert stand_in.paths == ['http://api.helioviewer.invalid/'] * 2
+    # Both requests went over the same connection to the proxy
+    assert len(set(stand_in.clients)) == 1
+
+
+def test_connection_is_reused(stand_in):
+    client = HelioviewerClient(_stand_in_url(stand_in))
+    for day in range(1, 4):
+        client.get_closest_image('2012/01/0{}'.format(day), source_id=10)
+    assert len(stand_in.requests) == 3
+    assert len(set(stand_in.clients)) == 1
+
+
+def test_redirect_is_followed(stand_in):
+    client = HelioviewerClient(_stand_in_url(stand_in))
+    response = client._opener.open(_stand_in_url(stand_in) + 'moved')
+    assert response.read() == b'{}'
+    assert response.url == _stand_in_url(stand_in)
+    # The redirect was answered on the same connection
+    assert len(stand_in.clients) == 2
+    assert len(set(stand_in.clients)) == 1
+
+
+def test_closest_image_bucket(stand_in):
+    client = HelioviewerClient(_stand_in_url(stand_in), closest_image_bucket=60*u.s)
+    first = client.get_closest_image('2012/01/01 00:00:10', source_id=10)
+    second = client.get_closest_image('2012/01/01 00:00:50', source_id=10)
+    assert first['id'] == second['id']
+    assert len(stand_in.requests) == 1
+    client.get_closest_image('2012/01/01 00:01:10', source_id=10)
+    client.get_closest_image('2012/01/01 00:00:10', source_id=11)
+    assert len(stand_in.requests) == 3
+
+
+def test_file_cache(stand_in, tmpdir, file_index):
+    client = HelioviewerClient(_stand_in_url(stand_in), cache=True)
+    filepath = client.download_jp2('2012/01/01', source_id=10, directory=str(tmpdir))
+    assert client.download_jp2('2012/01/01', source_id=10, directory=str(tmpdir)) == filepath
+    assert len(stand_in.requests) == 1
+    # Nothing but the image is written to the target directory
+    assert os.listdir(str(tmpdir)) == [os.path.basename(filepath)]
+    os.remove(filepath)
+    assert client.download_jp2('2012/01/01', source_id=10, directory=str(tmpdir)) == filepath
+    assert len(stand_in.requests) == 2
+
+    # overwrite downloads again
+    assert client.download_jp2('2012/01/01', source_id=10, directory=str(tmpdir),
+                               overwrite=True) == filepath
+    assert len(stand_in.requests) == 3
+
+    # A cached file is placed in another target directory
+    other = client.download_jp2('2012/01/01', source_id=10, directory=str(tmpdir.join('other')))
+    assert other == str(tmpdir.join('other', os.path.basename(filepath)))
+    assert os.path.exists(other)
+    assert len(stand_in.requests) == 3
+
+
+def test_download_jp2_multiple(stand_in, tmpdir):
+    client = HelioviewerClient(_stand_in_url(stand_in))
+    dates = ['2012/01/01 00:{:02d}:00'.format(i) for i in range(10)]
+    filepaths = client.download_jp2_multiple(dates, source_id=10, directory=str(tmpdir),
+                                             max_conn=4)
+    assert len(filepaths) == 10
+    for date, filepath in zip(dates, filepaths):
+        assert os.path.exists(filepath)
+        assert parse_time(date).isot.replace(':', '_') in filepath
+    assert len(stand_in.requests) == 10
+    # The workers shared at most max_conn connections, closed at the end
+    assert len(set(stand_in.clients)) <= 4
+    assert not client._connections._idle
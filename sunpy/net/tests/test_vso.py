@@ -1,6 +1,13 @@
 # -*- coding: utf-8 -*-
+import time
+import threading
+import http.server
+from xml.etree import ElementTree
+
+import numpy as np
 
 import pytest
+import zeep
 
 import astropy.units as u
 
@@ -410,3 +417,303 @@ def test_vso_hmi(client, tmpdir):
         fileids = dri.fileiditem.fileid
         series = list(map(lambda x: x.split(':')[0], fileids))
         assert all([s == series[0] for s in series])
+
+
+_VSO_NS = 'http://virtualsolar.org/VSO/VSOi'
+_SOAP_NS = 'http://schemas.xmlsoap.org/soap/envelope/'
+
+# The part of the VSO WSDL needed for GetData requests
+_STAND_IN_WSDL = """<?xml version="1.0" encoding="UTF-8"?>
+<definitions name="VSOi" targetNamespace="{ns}" xmlns="http://schemas.xmlsoap.org/wsdl/"
+    xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:VSO="{ns}">
+  <types>
+    <xsd:schema targetNamespace="{ns}">
+      <xsd:complexType name="FileIdItem"><xsd:sequence>
+        <xsd:element name="fileid" type="xsd:string" maxOccurs="unbounded"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="DataRequestItem"><xsd:sequence>
+        <xsd:element name="provider" type="xsd:string"/>
+        <xsd:element name="fileiditem" type="VSO:FileIdItem"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="DataContainer"><xsd:sequence>
+        <xsd:element name="datarequestitem" type="VSO:DataRequestItem" maxOccurs="unbounded"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="MethodItem"><xsd:sequence>
+        <xsd:element name="methodtype" type="xsd:string" maxOccurs="unbounded"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="Info"><xsd:sequence>
+        <xsd:element name="email" type="xsd:string" minOccurs="0"/>
+        <xsd:element name="site" type="xsd:string" minOccurs="0"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="GetDataRequest"><xsd:sequence>
+        <xsd:element name="method" type="VSO:MethodItem"/>
+        <xsd:element name="info" type="VSO:Info"/>
+        <xsd:element name="datacontainer" type="VSO:DataContainer"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="VSOGetDataRequest"><xsd:sequence>
+        <xsd:element name="version" type="xsd:string" minOccurs="0"/>
+        <xsd:element name="request" type="VSO:GetDataRequest"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="DataItem"><xsd:sequence>
+        <xsd:element name="url" type="xsd:string"/>
+        <xsd:element name="fileiditem" type="VSO:FileIdItem"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="GetDataItem"><xsd:sequence>
+        <xsd:element name="dataitem" type="VSO:DataItem" maxOccurs="unbounded"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="GetDataResponseItem"><xsd:sequence>
+        <xsd:element name="provider" type="xsd:string"/>
+        <xsd:element name="status" type="xsd:string" minOccurs="0"/>
+        <xsd:element name="method" type="VSO:MethodItem"/>
+        <xsd:element name="getdataitem" type="VSO:GetDataItem"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:complexType name="VSOGetDataResponse"><xsd:sequence>
+        <xsd:element name="getdataresponseitem" type="VSO:GetDataResponseItem"
+                     maxOccurs="unbounded"/>
+      </xsd:sequence></xsd:complexType>
+    </xsd:schema>
+  </types>
+  <message name="GetDataRequest"><part name="body" type="VSO:VSOGetDataRequest"/></message>
+  <message name="GetDataResponse"><part name="body" type="VSO:VSOGetDataResponse"/></message>
+  <portType name="VSOiPort">
+    <operation name="GetData">
+      <input message="VSO:GetDataRequest"/><output message="VSO:GetDataResponse"/>
+    </operation>
+  </portType>
+  <binding name="VSOiBinding" type="VSO:VSOiPort">
+    <soap:binding style="rpc" transport="http://schemas.xmlsoap.org/soap/http"/>
+    <operation name="GetData">
+      <soap:operation soapAction="{ns}#GetData"/>
+      <input><soap:body use="literal" namespace="{ns}"/></input>
+      <output><soap:body use="literal" namespace="{ns}"/></output>
+    </operation>
+  </binding>
+  <service name="VSOiService">
+    <port name="standinVSOi" binding="VSO:VSOiBinding">
+      <soap:address location="{location}"/>
+    </port>
+  </service>
+</definitions>
+"""
+
+
+class _StandInVSOHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers SOAP GetData requests with file URLs, after a delay per provider.
+    """
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        items = []
+        for dri in ElementTree.fromstring(body).iter('datarequestitem'):
+            provider = dri.findtext('provider')
+            self.server.requests.append(provider)
+            time.sleep(self.server.delays.get(provider, 0))
+            dataitems = ''.join(
+                '<dataitem><url>{}</url><fileiditem><fileid>{}</fileid></fileiditem>'
+                '</dataitem>'.format(self.server.urls[fileid.text], fileid.text)
+                for fileid in dri.iter('fileid'))
+            items.append('<getdataresponseitem><provider>{}</provider>'
+                         '<method><methodtype>URL-FILE</methodtype></method>'
+                         '<getdataitem>{}</getdataitem></getdataresponseitem>'
+                         .format(provider, dataitems))
+        response = ('<soap:Envelope xmlns:soap="{}"><soap:Body>'
+                    '<VSO:GetDataResponse xmlns:VSO="{}"><body>{}</body>'
+                    '</VSO:GetDataResponse></soap:Body></soap:Envelope>'
+                    .format(_SOAP_NS, _VSO_NS, ''.join(items))).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_service(tmpdir):
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StandInVSOHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.delays = {}
+    server.urls = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    wsdl = tmpdir.join('VSOi_rpc_literal.wsdl')
+    wsdl.write(_STAND_IN_WSDL.format(
+        ns=_VSO_NS, location='http://127.0.0.1:{}/'.format(server.server_address[1])))
+    api = zeep.Client(str(wsdl), port_name='standinVSOi')
+    api.set_ns_prefix('VSO', _VSO_NS)
+    server.api = api
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stand_in_records(tmpdir, stand_in_service):
+    records = []
+    urls = stand_in_service.urls
+    for provider in ['SDAC', 'JSOC', 'ROB']:
+        for i in range(2):
+            fileid = '{}:{}'.format(provider.lower(), i)
+            source = tmpdir.join('{}_{}.fits'.format(provider, i))
+            source.write_binary(b'data')
+            urls[fileid] = 'file://' + str(source)
+            records.append(MockObject(fileid=fileid, provider=provider))
+    return QueryResponse(records), urls
+
+
+def test_fetch_per_provider(stand_in_service, stand_in_records, tmpdir):
+    qr, urls = stand_in_records
+    client = vso.VSOClient(api=stand_in_service.api)
+    files = client.fetch(qr, path=str(tmpdir.mkdir('out')), overwrite=True).wait(progress=False)
+
+    assert len(files) == 6
+    assert sorted(stand_in_service.requests) == ['JSOC', 'ROB', 'SDAC']
+    assert set(qr.provider_stats) == {'SDAC', 'JSOC', 'ROB'}
+    for stats in qr.provider_stats.values():
+        assert stats['status'] == 'ok'
+        assert stats['files'] == 2
+        assert stats['latency'] >= 0
+
+
+def test_fetch_slow_provider_timeout(stand_in_service, stand_in_records, tmpdir):
+    qr, urls = stand_in_records
+    stand_in_service.delays['ROB'] = 5
+    client = vso.VSOClient(api=stand_in_service.api)
+    start = time.time()
+    res = client.fetch(qr, path=str(tmpdir.mkdir('out')), overwrite=True, timeout=1)
+    files = res.wait(progress=False)
+
+    assert time.time() - start < 5
+    assert len(files) == 4
+    assert all('ROB' not in f for f in files)
+    assert qr.provider_stats['ROB']['status'] == 'timeout'
+    assert qr.provider_stats['SDAC']['status'] == 'ok'
+    assert len(res.errors) == 1
+    assert isinstance(res.errors[0], vso.vso.ProviderTimeout)
+
+
+def test_fetch_queued_providers_timeout(stand_in_service, stand_in_records, tmpdir):
+    qr, urls = stand_in_records
+    # One request at a time, the timeout of a provider starts with its request
+    stand_in_service.delays.update({'SDAC': 5, 'JSOC': 0.6, 'ROB': 0.6})
+    client = vso.VSOClient(api=stand_in_service.api)
+    res = client.fetch(qr, path=str(tmpdir.mkdir('out')), overwrite=True, timeout=1,
+                       max_providers=1)
+    files = res.wait(progress=False)
+
+    assert len(files) == 4
+    assert qr.provider_stats['SDAC']['status'] == 'timeout'
+    for provider in ['JSOC', 'ROB']:
+        assert qr.provider_stats[provider]['status'] == 'ok'
+        assert 0.6 <= qr.provider_stats[provider]['latency'] < 1
+
+
+def test_fetch_provider_error(stand_in_service, stand_in_records, tmpdir):
+    qr, urls = stand_in_records
+    # The stand-in fails to answer for files it has no URL for
+    del urls['rob:0']
+    client = vso.VSOClient(api=stand_in_service.api)
+    res = client.fetch(qr, path=str(tmpdir.mkdir('out')), overwrite=True, timeout=5)
+    files = res.wait(progress=False)
+
+    assert len(files) == 4
+    assert qr.provider_stats['ROB']['status'] == 'error'
+    assert qr.provider_stats['ROB']['latency'] < 5
+    assert isinstance(res.errors[0], vso.vso.DownloadFailed)
+
+
+def test_QueryResponse_slicing():
+    records = [MockQRRecord(start_time='2016021408081{}'.format(i),
+                            end_time='2016021408082{}'.format(i)) for i in range(5)]
+    qr = vso.QueryResponse(records, queryresult='result')
+    table = qr.build_table()
+    assert table['Start Time'][3] == '2016-02-14 08:08:13'
+    assert table['End Time'][3] == '2016-02-14 08:08:23'
+
+    sliced = qr[1:3]
+    assert isinstance(sliced, vso.QueryResponse)
+    assert sliced.queryresult == 'result'
+    assert list(sliced) == records[1:3]
+    assert list(sliced.build_table()['Start Time'][:, 0]) == ['2016-02-14 08:08:11',
+                                                             '2016-02-14 08:08:12']
+
+    filtered = qr[np.array([True, False, False, False, True])]
+    assert list(filtered) == [records[0], records[4]]
+    assert len(filtered.build_table()) == 2
+    assert qr[-1] is records[-1]
+
+    # Slices are views onto the same records rather than copies.
+    assert np.shares_memory(sliced._records, qr._records)
+
+    empty = qr[[]]
+    assert len(empty) == 0
+    assert len(empty.build_table()) == 0
+
+
+def test_QueryResponse_build_table_copy():
+    records = [MockQRRecord(start_time='2016021408081{}'.format(i),
+                            end_time='2016021408082{}'.format(i)) for i in range(3)]
+    qr = vso.QueryResponse(records)
+    table = qr.build_table()
+    table['Start Time'][0] = '2000-01-01 00:00:00'
+    assert qr.build_table()['Start Time'][0] == '2016-02-14 08:08:10'
+
+    qr.append(MockQRRecord(start_time='20160214080813', end_time='20160214080823'))
+    assert len(qr.build_table()) == 4
+
+
+def test_QueryResponse_list_methods():
+    records = [MockQRRecord(start_time='2016021408081{}'.format(i),
+                            end_time='2016021408082{}'.format(i)) for i in range(5)]
+    qr = vso.QueryResponse(records[:3], queryresult='result')
+    sliced = qr[:2]
+    table = sliced.build_table()
+
+    qr.insert(0, records[3])
+    qr[1] = records[4]
+    assert qr == [records[3], records[4], records[1], records[2]]
+    assert qr.build_table()['Start Time'][1, 0] == '2016-02-14 08:08:14'
+    # The slice taken before is unchanged by changing the response
+    assert list(sliced) == records[:2]
+    assert sliced.build_table() is not table
+    assert list(sliced.build_table()['Start Time'][:, 0]) == list(table['Start Time'][:, 0])
+
+    assert qr.pop() is records[2]
+    qr.remove(records[3])
+    del qr[0]
+    assert qr == [records[1]]
+    qr[:] = records[::-1]
+    assert qr == records[::-1]
+    qr.reverse()
+    assert qr == records
+
+    qr.sort(key=lambda record: record.time.start, reverse=True)
+    assert qr == records[::-1]
+    assert qr.build_table()['Start Time'][0, 0] == '2016-02-14 08:08:14'
+
+    combined = sliced + qr[:1]
+    assert isinstance(combined, vso.QueryResponse)
+    assert combined.queryresult == 'result'
+    assert combined == [records[0], records[1], records[4]]
+    assert list(sliced) == records[:2]
+
+
+def test_QueryResponse_many_records():
+    # The table of a large response is built from the columns taken when the
+    # records are added, and appending one at a time is not quadratic.
+    records = [MockQRRecord(start_time='20160214080810', end_time='20160214080820')
+               for i in range(10**5)]
+    start = time.perf_counter()
+    qr = vso.QueryResponse([])
+    for record in records:
+        qr.append(record)
+    table = qr.build_table()
+    sliced = qr[::2]
+    assert len(sliced.build_table()) == 5 * 10**4
+    assert time.perf_counter() - start < 30
+    assert len(table) == 10**5
+    assert qr[-1] is records[-1]
@@ -6,17 +6,23 @@ This module provides a wrapper around the VSO API.
 import os
 import re
 import sys
+import time
 import socket
 import warnings
 import itertools
 from functools import partial
 from collections import defaultdict
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib.error import URLError, HTTPError
 from urllib.request import urlopen
 
 import zeep
 from zeep.helpers import serialize_object
 
+import numpy as np
+import pandas as pd
+
 import astropy.units as u
 from astropy.table import QTable as Table
 
@@ -28,7 +34,7 @@ from sunpy.net.vso import attrs
 from sunpy.net.attr import and_
 from sunpy.util.net import slugify, get_filename
 from sunpy.net.vso.attrs import TIMEFORMAT, walker
-from sunpy.net.base_client import BaseClient
+from sunpy.net.base_client import BaseClient, BaseQueryResponse
 from sunpy.util.decorators import deprecated
 
 TIME_FORMAT = config.get("general", "time_format")
@@ -101,18 +107,35 @@ def get_online_vso_url(api, url, port):
                 api = zeep.Client(mirror['url'], port_name=mirror['port'])
                 api.set_ns_prefix('VSO', 'http://virtualsolar.org/VSO/VSOi')
                 return api
+    return api
 
 
-class QueryResponse(list):
+def _format_times(times):
+    """
+    Reformat a list of VSO time strings to ``TIME_FORMAT`` in one go.
+    """
+    try:
+        return list(pd.to_datetime(times, format=TIMEFORMAT).strftime(TIME_FORMAT))
+    except (ValueError, TypeError):
+        # Anything unusual, such as a leap second, goes through parse_time
+        return [parse_time(time).strftime(TIME_FORMAT) for time in times]
+
+
+class QueryResponse(BaseQueryResponse):
     """
     A container for VSO Records returned from VSO Searches.
     """
+    _record_attributes = (('start', 'time.start'), ('end', 'time.end'),
+                          ('source', 'source'), ('instrument', 'instrument'),
+                          ('type', 'extent.type'), ('wavemin', 'wave.wavemin'),
+                          ('wavemax', 'wave.wavemax'), ('waveunit', 'wave.waveunit'))
 
     def __init__(self, lst, queryresult=None, table=None):
-        super(QueryResponse, self).__init__(lst)
+        super(QueryResponse, self).__init__(lst, table=table)
         self.queryresult = queryresult
         self.errors = []
-        self.table = None
+        # Filled in by VSOClient.fetch with one entry per data provider
+        self.provider_stats = {}
 
     def search(self, *query):
         """ Furtherly reduce the query response by matching it against
@@ -141,55 +164,75 @@ class QueryResponse(list):
         """
         Create a human readable table.
 
+        The table is only built once and shared with responses created by
+        slicing this one, the returned table is a copy of it.
+
         Returns
         -------
         table : `astropy.table.QTable`
         """
+        return self._cached_table().copy()
+
+    def _make_table(self):
         keywords = ['Start Time', 'End Time', 'Source', 'Instrument', 'Type', 'Wavelength']
         record_items = {}
-        for key in keywords:
-            record_items[key] = []
-
-        def validate_time(time):
-            # Handle if the time is None when coming back from VSO
-            if time is None:
-                return ['None']
-            if record.time.start is not None:
-                return [parse_time(time).strftime(TIME_FORMAT)]
-            else:
-                return ['N/A']
-
-        for record in self:
-            record_items['Start Time'].append(validate_time(record.time.start))
-            record_items['End Time'].append(validate_time(record.time.end))
-            record_items['Source'].append(str(record.source))
-            record_items['Instrument'].append(str(record.instrument))
-            record_items['Type'].append(str(record.extent.type)
-                                        if record.extent.type is not None else ['N/A'])
-            # If we have a start and end Wavelength, make a quantity
-            if hasattr(record, 'wave') and record.wave.wavemin and record.wave.wavemax:
-                unit = record.wave.waveunit
-                # Convert this so astropy units parses it correctly
-                if unit == "kev":
-                    unit = "keV"
-                record_items['Wavelength'].append(u.Quantity([float(record.wave.wavemin),
-                                                              float(record.wave.wavemax)],
-                                                             unit=unit))
-            # If not save None
-            else:
-                record_items['Wavelength'].append(None)
+
+        starts = self._column('start')
+        ends = self._column('end')
+        has_start = starts != None  # noqa: E711
+        has_end = ends != None  # noqa: E711
+
+        # Handle if the time is None when coming back from VSO, and mark the
+        # end time as N/A if there is no start time.
+        start_col = np.full((len(self), 1), 'None', dtype=object)
+        end_col = np.full((len(self), 1), 'None', dtype=object)
+        if has_start.any():
+            start_col[has_start, 0] = _format_times(list(starts[has_start]))
+        both = has_start & has_end
+        if both.any():
+            end_col[both, 0] = _format_times(list(ends[both]))
+        end_col[has_end & ~has_start, 0] = 'N/A'
+        # Every time is a one element list, but keep empty columns flat
+        record_items['Start Time'] = start_col.astype(str) if len(self) else []
+        record_items['End Time'] = end_col.astype(str) if len(self) else []
+
+        types = self._column('type').copy()
+        types[types == None] = 'N/A'  # noqa: E711
+        for key, column in (('Source', self._column('source')),
+                            ('Instrument', self._column('instrument')),
+                            ('Type', types)):
+            record_items[key] = column.astype(str) if len(self) else []
+
+        # If we have a start and end Wavelength, make a quantity
+        wavemins = self._column('wavemin')
+        wavemaxs = self._column('wavemax')
+        has_wave = wavemins.astype(bool) & wavemaxs.astype(bool)
+        # Convert this so astropy units parses it correctly
+        waveunits = self._column('waveunit').copy()
+        waveunits[waveunits == 'kev'] = 'keV'
+        units = set(waveunits[has_wave])
+
         # If we have no wavelengths for the whole list, drop the col
-        if all([a is None for a in record_items['Wavelength']]):
-            record_items.pop('Wavelength')
+        if not units:
             keywords.remove('Wavelength')
+        elif len(units) == 1 and has_wave.all():
+            # The common case, every record has a range in the same unit
+            record_items['Wavelength'] = u.Quantity(
+                np.stack([wavemins, wavemaxs], axis=1).astype(float), unit=units.pop())
         else:
+            waves = [(wavemin, wavemax, waveunit) if has else None
+                     for wavemin, wavemax, waveunit, has
+                     in zip(wavemins, wavemaxs, waveunits, has_wave)]
+            wavelengths = [None if wave is None else
+                           u.Quantity([float(wave[0]), float(wave[1])], unit=wave[2])
+                           for wave in waves]
             # Make whole column a quantity
             try:
                 with u.set_enabled_equivalencies(u.spectral()):
-                    record_items['Wavelength'] = u.Quantity(record_items['Wavelength'])
+                    record_items['Wavelength'] = u.Quantity(wavelengths)
             # If we have mixed units or some Nones just represent as strings
             except (u.UnitConversionError, TypeError):
-                record_items['Wavelength'] = [str(a) for a in record_items['Wavelength']]
+                record_items['Wavelength'] = [str(a) for a in wavelengths]
 
         return Table(record_items)[keywords]
 
@@ -248,6 +291,10 @@ class UnknownStatus(Exception):
     pass
 
 
+class ProviderTimeout(Exception):
+    pass
+
+
 class VSOClient(BaseClient):
 
     """ Main VSO Client. """
@@ -528,7 +575,8 @@ class VSOClient(BaseClient):
         )
 
     def fetch(self, query_response, path=None, methods=None,
-              downloader=None, site=None):
+              downloader=None, site=None, overwrite=False, timeout=None,
+              max_providers=10):
         """
         Download data specified in the query_response.
 
@@ -572,18 +620,36 @@ class VSOClient(BaseClient):
             NMSU            New Mexico State University (US)
             =============== ========================================================
 
+        overwrite : `bool`
+            If `False`, files which were downloaded before and are still
+            intact on disk are not downloaded again. Only used if no
+            ``downloader`` is given.
+
+        timeout : `float`, optional
+            Number of seconds to wait for each data provider to answer the
+            request for download URLs, counted from when the request to that
+            provider is sent. The files of providers which do not
+            answer in time are skipped and a `ProviderTimeout` is added to
+            the errors of the results.
+
+        max_providers : `int`
+            Maximum number of data providers to request download URLs from
+            at the same time.
+
         Returns
         -------
         out : :py:class:`Results`
             Object that supplies a list of filenames with meta attributes
-            containing the respective QueryResponse.
+            containing the respective QueryResponse. The time each provider
+            took to answer is recorded in ``query_response.provider_stats``.
 
         Examples
         --------
         >>> res = fetch(qr).wait() # doctest:+SKIP
         """
         if downloader is None:
-            downloader = download.Downloader()
+            downloader = download.Downloader(file_index=download.get_file_index(),
+                                             overwrite=overwrite)
             downloader.init()
             res = download.Results(
                 lambda _: downloader.stop(), 1,
@@ -609,16 +675,118 @@ class VSOClient(BaseClient):
         if site is not None:
             info['site'] = site
 
-        VSOGetDataResponse = self.api.get_type("VSO:VSOGetDataResponse")
-
-        data_request = self.make_getdatarequest(query_response, methods, info)
-        data_response = VSOGetDataResponse(self.api.service.GetData(data_request))
+        if methods is None:
+            methods = self.method_order + ['URL']
 
-        self.download_all(data_response, methods, downloader, path, fileids, res)
+        data_responses = self._get_data_by_provider(query_response, methods, info,
+                                                    timeout, max_providers, res)
+        for data_response in data_responses:
+            self.download_all(data_response, methods, downloader, path, fileids, res)
 
         res.poke()
         return res
 
+    def _get_data_by_provider(self, query_response, methods, info, timeout,
+                              max_providers, res):
+        """
+        Send one GetData request per data provider concurrently and return the
+        responses of the providers that answered within ``timeout`` seconds.
+
+        The latency and outcome for each provider are stored in
+        ``query_response.provider_stats``, failures are added to the errors
+        of ``res``.
+        """
+        VSOGetDataResponse = self.api.get_type("VSO:VSOGetDataResponse")
+        providers = {k: [x.fileid for x in v]
+                     for k, v in self.by_provider(query_response).items()}
+
+        # At most max_providers requests run at once. Every provider gets its
+        # own thread so that one which has timed out can hand its slot to the
+        # next provider while its abandoned request is still running.
+        slots = threading.Semaphore(max(1, max_providers))
+        lock = threading.Lock()
+        started = {}
+        released = set()
+
+        def release(provider):
+            with lock:
+                if provider in released:
+                    return
+                released.add(provider)
+            slots.release()
+
+        def get_data(provider, fileids):
+            slots.acquire()
+            start = time.time()
+            with lock:
+                started[provider] = start
+            try:
+                request = self.create_getdatarequest({provider: fileids}, methods, dict(info))
+                response = VSOGetDataResponse(self.api.service.GetData(request))
+                return response, time.time() - start, None
+            except Exception as e:
+                return None, time.time() - start, e
+            finally:
+                release(provider)
+
+        stats = {}
+        responses = []
+        # Providers that time out are abandoned, we do not wait for them.
+        executor = ThreadPoolExecutor(max_workers=max(1, len(providers)))
+        try:
+            pending = {executor.submit(get_data, provider, fileids): provider
+                       for provider, fileids in providers.items()}
+            while pending:
+                done, _ = wait(pending, timeout=self._next_deadline(pending, started, timeout),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    provider = pending.pop(future)
+                    response, latency, error = future.result()
+                    stats[provider] = {'status': 'ok' if error is None else 'error',
+                                       'latency': latency, 'files': len(providers[provider])}
+                    if error is None:
+                        responses.append(response)
+                    else:
+                        self._add_provider_error(res, DownloadFailed(provider, error))
+
+                now = time.time()
+                for future, provider in list(pending.items()):
+                    with lock:
+                        start = started.get(provider)
+                    if timeout is None or start is None or now < start + timeout:
+                        continue
+                    del pending[future]
+                    release(provider)
+                    stats[provider] = {'status': 'timeout', 'latency': None,
+                                       'files': len(providers[provider])}
+                    self._add_provider_error(res, ProviderTimeout(
+                        "{} did not answer within {} s".format(provider, timeout)))
+        finally:
+            executor.shutdown(wait=False)
+
+        query_response.provider_stats = stats
+        return responses
+
+    @staticmethod
+    def _next_deadline(pending, started, timeout):
+        """
+        Seconds until the first of the running ``pending`` provider requests
+        times out, `None` if there is no such deadline.
+        """
+        if timeout is None:
+            return None
+        starts = [started[provider] for provider in pending.values() if provider in started]
+        if not starts:
+            # Wait for the next request to start or finish
+            return 0.05
+        return max(0, min(starts) + timeout - time.time())
+
+    @staticmethod
+    def _add_provider_error(res, error):
+        # Record the failure without counting it as a finished download
+        with res.lock:
+            res.errors.append(error)
+
     @staticmethod
     def link(query_response, maps):
         """ Return list of paths with records associated with them in
@@ -1,8 +1,90 @@
 import numpy as np
 
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+
 __authors__ = ["David PS"]
 __email__ = "dps.helio-?-gmail.com"
 
+__all__ = ['Chaincode', 'decode_chaincodes']
+
+# x and y step of each chaincode digit
+_STEPS = np.array([[-1, -1, 0, 1, 1, 1, 0, -1],
+                   [0, -1, -1, -1, 0, 1, 1, 1]])
+_STEPS_ORIGIN = np.column_stack([_STEPS, [0, 0]])
+
+
+def _chaincode_steps(chaincode):
+    """
+    The digits of a chaincode string as an integer array.
+    """
+    return np.frombuffer(chaincode.encode('ascii'), dtype=np.uint8) - ord('0')
+
+
+def decode_chaincodes(origins, chaincodes, xdelta=1, ydelta=1):
+    """
+    Convert many chaincodes to coordinates at once.
+
+    Parameters
+    ----------
+    origins : `numpy.ndarray`, `list`
+        The origin of each chaincode, shape ``(n, 2)``.
+    chaincodes : `list` of `str`
+        The chaincodes, each made up of the numbers 0-7.
+    xdelta : Float or `numpy.ndarray`
+    ydelta : Float or `numpy.ndarray`
+        The scale to convert between pixels and flat coordinates, either
+        one for all chaincodes or one for each.
+
+    Returns
+    -------
+    `list` of `numpy.ndarray`
+        The coordinates of each chaincode such
+        [[x0, x1, x2, ..., xn], [y0 ,y1, y2, ..., yn]], as
+        `Chaincode.coordinates`.
+    """
+    origins = np.asarray(origins, dtype=float).reshape(-1, 2)
+    lengths = np.array([len(chaincode) for chaincode in chaincodes], dtype=int)
+    if len(lengths) != len(origins):
+        raise ValueError("There must be one origin for each chaincode.")
+    if not len(lengths):
+        return []
+    # A '8' before each chaincode makes a zero step at its origin
+    steps = _chaincode_steps('8' + '8'.join(chaincodes))
+    if np.any(steps > 8) or np.count_nonzero(steps == 8) != len(lengths):
+        raise ValueError("Chaincodes can only contain the numbers 0-7.")
+    # Summing integer steps keeps the long sum across all chaincodes exact
+    offsets = np.cumsum(_STEPS_ORIGIN[:, steps], axis=1)
+    starts = np.cumsum(lengths + 1) - (lengths + 1)
+    offsets -= np.repeat(offsets[:, starts], lengths + 1, axis=1)
+    deltas = np.empty((2, len(lengths)))
+    deltas[0], deltas[1] = xdelta, ydelta
+    coordinates = (np.repeat(origins.T, lengths + 1, axis=1) +
+                   offsets * np.repeat(deltas, lengths + 1, axis=1))
+    return np.split(coordinates, starts[1:], axis=1)
+
+
+def _polygon_mask(x, y, shape):
+    """
+    Mask of the pixels of an array with shape ``shape`` whose centres are
+    inside the polygon with vertices ``x``, ``y`` in pixels, using the
+    even-odd rule for self-intersecting polygons.
+    """
+    mask = np.zeros(shape, dtype=bool)
+    rows = np.arange(max(np.ceil(y.min()), 0), min(np.floor(y.max()), shape[0] - 1) + 1)
+    if not rows.size:
+        return mask
+    x1, y1 = np.roll(x, -1), np.roll(y, -1)
+    # Edges crossing the centre line of each row, counting vertices only once
+    row, edge = np.nonzero((y <= rows[:, np.newaxis]) != (y1 <= rows[:, np.newaxis]))
+    crossing = x[edge] + (rows[row] - y[edge]) * (x1[edge] - x[edge]) / (y1[edge] - y[edge])
+    # Pixels are inside after an odd number of crossings to their left
+    column = np.clip(np.floor(crossing).astype(int) + 1, 0, shape[1])
+    crossings = np.zeros((rows.size, shape[1] + 1), dtype=int)
+    np.add.at(crossings, (row, column), 1)
+    mask[int(rows[0]):int(rows[-1]) + 1] = np.cumsum(crossings[:, :-1], axis=1) % 2 == 1
+    return mask
+
 
 class Chaincode(np.ndarray):
     """
@@ -49,15 +131,12 @@ class Chaincode(np.ndarray):
         return obj
 
     def __init__(self, origin, chaincode, xdelta=1, ydelta=1):
-        x_steps = [-1, -1, 0, 1, 1, 1, 0, -1]
-        y_steps = [0, -1, -1, -1, 0, 1, 1, 1]
         self.coordinates = np.ndarray((2, len(chaincode) + 1))
         self.coordinates[:, 0] = origin
         if chaincode.isdigit():
-            for index, step in enumerate(chaincode):
-                self.coordinates[:, index + 1] = self.coordinates[:, index] + \
-                    [[x_steps[int(step)] * xdelta,
-                      y_steps[int(step)] * ydelta]]
+            offsets = np.cumsum(_STEPS[:, _chaincode_steps(chaincode)], axis=1)
+            self.coordinates[:, 1:] = (self.coordinates[:, :1] +
+                                       offsets * np.array([[xdelta], [ydelta]]))
 
     def matchend(self, end):
         """
@@ -109,17 +188,39 @@ class Chaincode(np.ndarray):
 
     def area(self):
         """
-        Place holder (no code)
+        The area enclosed by the chaincode, closing it with a straight line
+        if it doesn't end at its origin.
         """
         # should we add a mask for possible not flat objects (eg. Sun)?
-        # Check whether it is a closed object
-        pass
+        x, y = self.coordinates
+        return 0.5 * np.abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
 
     def length(self):
         """
-        Place holder (no code)
+        The length of the path of the chaincode.
+        """
+        return np.hypot(*np.diff(self.coordinates, axis=1)).sum()
+
+    def to_mask(self, smap, unit=u.arcsec):
+        """
+        Rasterise the chaincode onto the pixels of a map.
+
+        Parameters
+        ----------
+        smap : `~sunpy.map.GenericMap`
+            The map the coordinates of the chaincode are taken to be in.
+        unit : `~astropy.units.Unit`
+            The unit of the coordinates of the chaincode.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            A boolean array with the shape of the map data which is `True`
+            for the pixels whose centre is inside the chaincode.
         """
-        pass
+        x, y = self.coordinates * unit
+        x, y = smap.world_to_pixel(SkyCoord(x, y, frame=smap.coordinate_frame))
+        return _polygon_mask(x.value, y.value, smap.data.shape)
 
     def subBoundingBox(self, xedge=None, yedge=None):
         """
@@ -2,8 +2,16 @@
 
 # TODO: REMOVE UNITTEST
 import unittest
-from sunpy.roi.chaincode import Chaincode
+
 import numpy as np
+import pytest
+from matplotlib.path import Path
+
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+
+import sunpy.map
+from sunpy.roi.chaincode import Chaincode, decode_chaincodes
 
 class CCTests(unittest.TestCase):
 
@@ -61,3 +69,62 @@ class CCTests(unittest.TestCase):
     def testSubBoundingBoxY(self):
         cc = Chaincode([0, 0], "44464660012075602223")
         self.failUnless(cc.subBoundingBox(yedge=[-1, 0.5]) == [0, 3])
+
+
+def _loop_coordinates(origin, chaincode, xdelta=1, ydelta=1):
+    x_steps = [-1, -1, 0, 1, 1, 1, 0, -1]
+    y_steps = [0, -1, -1, -1, 0, 1, 1, 1]
+    coordinates = [origin]
+    for step in chaincode:
+        x, y = coordinates[-1]
+        coordinates.append([x + x_steps[int(step)] * xdelta, y + y_steps[int(step)] * ydelta])
+    return np.array(coordinates).T
+
+
+def test_coordinates():
+    cc = Chaincode([-88, 812], "44464655567670006011212222324", xdelta=2.629, ydelta=2.629)
+    np.testing.assert_allclose(cc.coordinates,
+                               _loop_coordinates([-88, 812], "44464655567670006011212222324",
+                                                 2.629, 2.629))
+
+
+def test_decode_chaincodes():
+    chaincodes = ["44464655567670006011212222324", "2460", "", "0723"]
+    origins = [[-88, 812], [0, 0], [1, 2], [1.2, 3]]
+    xdelta = [2.629, 1, 1, 0.5]
+    decoded = decode_chaincodes(origins, chaincodes, xdelta=xdelta, ydelta=2)
+    assert len(decoded) == 4
+    for coordinates, origin, chaincode, dx in zip(decoded, origins, chaincodes, xdelta):
+        np.testing.assert_allclose(coordinates, _loop_coordinates(origin, chaincode, dx, 2))
+    assert decode_chaincodes([], []) == []
+    with pytest.raises(ValueError):
+        decode_chaincodes([[0, 0]], ["0128"])
+    with pytest.raises(ValueError):
+        decode_chaincodes([[0, 0], [1, 1]], ["01"])
+
+
+def test_area_length():
+    # A 2x3 rectangle, and the same without its closing side
+    assert Chaincode([0, 0], "4446600022").area() == 6
+    assert Chaincode([0, 0], "44466000").area() == 6
+    assert Chaincode([0, 0], "4446600022", xdelta=0.5).area() == 3
+    assert Chaincode([0, 0], "4446600022").length() == 10
+    np.testing.assert_allclose(Chaincode([0, 0], "3571").length(), 4 * np.sqrt(2))
+
+
+def test_to_mask():
+    header = {'CRVAL1': 0, 'CRVAL2': 0, 'CRPIX1': 1, 'CRPIX2': 1,
+              'CDELT1': 2, 'CDELT2': 2, 'CUNIT1': 'arcsec', 'CUNIT2': 'arcsec',
+              'CTYPE1': 'HPLN-TAN', 'CTYPE2': 'HPLT-TAN', 'NAXIS1': 30, 'NAXIS2': 20}
+    smap = sunpy.map.Map((np.zeros((20, 30)), header))
+    cc = Chaincode([20.6, 10.2], "44464655567670006011212222324", xdelta=2.2, ydelta=3.1)
+    mask = cc.to_mask(smap)
+
+    x, y = smap.world_to_pixel(SkyCoord(*cc.coordinates * u.arcsec, frame=smap.coordinate_frame))
+    path = Path(np.column_stack([x.value, y.value]))
+    rows, columns = np.indices(mask.shape)
+    expected = path.contains_points(np.column_stack([columns.ravel(), rows.ravel()]))
+    assert mask.any()
+    assert np.array_equal(mask, expected.reshape(mask.shape))
+    # Outside the map
+    assert not Chaincode([-500, -500], "2460").to_mask(smap).any()
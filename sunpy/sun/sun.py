@@ -10,9 +10,11 @@ import numpy as np
 
 import astropy.units as u
 from astropy.coordinates import Angle, Latitude, Longitude
+from astropy.utils.decorators import lazyproperty
 
 from sunpy.sun import constants
-from sunpy.time import parse_time, julian_centuries
+from sunpy.time import parse_time
+from sunpy.time.time import _lru_cache_on_time
 from sunpy.util.decorators import add_common_docstring
 
 __all__ = [
@@ -55,6 +57,115 @@ PARAMETER_DOCS = """
 """
 
 
+class _SunEphemeris:
+    """
+    The terms of the solar ephemeris at a time or an array of times.
+
+    Each term is computed on first use from the terms it depends on, so the
+    functions of this module share the intermediate terms rather than each
+    deriving them again.
+    """
+
+    def __init__(self, time):
+        self.jd = time.jd
+        # Julian centuries since J1900.0 (noon on 1900 January 0)
+        self.T = (self.jd - 2415020.0) / 36525.0
+
+    @lazyproperty
+    def eccentricity_SunEarth_orbit(self):
+        T = self.T
+        return 0.016751040 - 0.00004180 * T - 0.0000001260 * T**2
+
+    @lazyproperty
+    def mean_ecliptic_longitude(self):
+        T = self.T
+        result = 279.696680 + 36000.76892 * T + 0.0003025 * T**2
+        return Longitude(result * u.deg)
+
+    @lazyproperty
+    def mean_anomaly(self):
+        T = self.T
+        result = 358.475830 + 35999.049750 * T - 0.0001500 * T**2 - 0.00000330 * T**3
+        return Longitude(result * u.deg)
+
+    @lazyproperty
+    def carrington_rotation_number(self):
+        return (1. / 27.2753) * (self.jd - 2398167.0) + 1.0
+
+    @lazyproperty
+    def geometric_mean_longitude(self):
+        T = self.T
+        result = 279.696680 + 36000.76892 * T + 0.0003025 * T**2
+        return Longitude(result * u.deg)
+
+    @lazyproperty
+    def equation_of_center(self):
+        T = self.T
+        mna = self.mean_anomaly
+        result = ((1.9194600 - 0.0047890 * T - 0.0000140 * T**2) * np.sin(mna) +
+                  (0.0200940 - 0.0001000 * T) * np.sin(2 * mna) + 0.0002930 * np.sin(3 * mna))
+        return Angle(result * u.deg)
+
+    @lazyproperty
+    def true_longitude(self):
+        return Longitude(self.equation_of_center + self.geometric_mean_longitude)
+
+    @lazyproperty
+    def true_anomaly(self):
+        return Longitude(self.mean_anomaly + self.equation_of_center)
+
+    @lazyproperty
+    def apparent_longitude(self):
+        omega = (259.18 - 1934.142 * self.T) * u.deg
+        result = self.true_longitude - (0.00569 - 0.00479 * np.sin(omega)) * u.deg
+        return Longitude(result)
+
+    @lazyproperty
+    def true_obliquity_of_ecliptic(self):
+        T = self.T
+        result = 23.452294 - 0.0130125 * T - 0.00000164 * T**2 + 0.000000503 * T**3
+        return Angle(result, u.deg)
+
+    @lazyproperty
+    def true_rightascension(self):
+        true_long = self.true_longitude
+        y = np.cos(self.true_obliquity_of_ecliptic) * np.sin(true_long)
+        x = np.cos(true_long)
+        true_ra = np.arctan2(y, x)
+        return Longitude(true_ra.to(u.hourangle))
+
+    @lazyproperty
+    def true_declination(self):
+        result = np.arcsin(np.sin(self.true_obliquity_of_ecliptic) *
+                           np.sin(self.apparent_longitude))
+        return Latitude(result.to(u.deg))
+
+    @lazyproperty
+    def apparent_obliquity_of_ecliptic(self):
+        omega = self.apparent_longitude
+        return self.true_obliquity_of_ecliptic + (0.00256 * np.cos(omega)) * u.deg
+
+    @lazyproperty
+    def apparent_rightascension(self):
+        app_long = self.apparent_longitude
+        y = np.cos(self.apparent_obliquity_of_ecliptic) * np.sin(app_long)
+        x = np.cos(app_long)
+        app_ra = np.arctan2(y, x)
+        return Longitude(app_ra.to(u.hourangle))
+
+    @lazyproperty
+    def apparent_declination(self):
+        ob = self.apparent_obliquity_of_ecliptic
+        app_long = self.apparent_longitude
+        result = np.arcsin(np.sin(ob)) * np.sin(app_long)
+        return Latitude(result.to(u.deg))
+
+
+# The ephemeris of recent scalar times is cached, the terms are copied when
+# they are returned by the functions below.
+_ephemeris = _lru_cache_on_time(copy=False)(_SunEphemeris)
+
+
 @add_common_docstring(append=PARAMETER_DOCS)
 def solar_cycle_number(t='now'):
     """
@@ -62,8 +173,8 @@ def solar_cycle_number(t='now'):
 
     """
     time = parse_time(t)
-    result = (int(time.strftime('%Y')) + 8) % 28 + 1
-    return result
+    result = (np.asarray(time.strftime('%Y'), dtype=int) + 8) % 28 + 1
+    return int(result) if time.isscalar else result
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -107,9 +218,7 @@ def eccentricity_SunEarth_orbit(t='now'):
     Returns the eccentricity of the Sun Earth Orbit.
 
     """
-    T = julian_centuries(t)
-    result = 0.016751040 - 0.00004180 * T - 0.0000001260 * T**2
-    return result
+    return _ephemeris(t).eccentricity_SunEarth_orbit.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -118,10 +227,7 @@ def mean_ecliptic_longitude(t='now'):
     Returns the mean ecliptic longitude.
 
     """
-    T = julian_centuries(t)
-    result = 279.696680 + 36000.76892 * T + 0.0003025 * T**2
-    result = result * u.deg
-    return Longitude(result)
+    return _ephemeris(t).mean_ecliptic_longitude.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -137,10 +243,7 @@ def mean_anomaly(t='now'):
     assuming a circular orbit) as a function of time.
 
     """
-    T = julian_centuries(t)
-    result = 358.475830 + 35999.049750 * T - 0.0001500 * T**2 - 0.00000330 * T**3
-    result = result * u.deg
-    return Longitude(result)
+    return _ephemeris(t).mean_anomaly.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -149,9 +252,7 @@ def carrington_rotation_number(t='now'):
     Return the Carrington Rotation number
 
     """
-    jd = parse_time(t).jd
-    result = (1. / 27.2753) * (jd - 2398167.0) + 1.0
-    return result
+    return _ephemeris(t).carrington_rotation_number.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -160,10 +261,7 @@ def geometric_mean_longitude(t='now'):
     Returns the geometric mean longitude (in degrees).
 
     """
-    T = julian_centuries(t)
-    result = 279.696680 + 36000.76892 * T + 0.0003025 * T**2
-    result = result * u.deg
-    return Longitude(result)
+    return _ephemeris(t).geometric_mean_longitude.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -172,12 +270,7 @@ def equation_of_center(t='now'):
     Returns the Sun's equation of center (in degrees).
 
     """
-    T = julian_centuries(t)
-    mna = mean_anomaly(t)
-    result = ((1.9194600 - 0.0047890 * T - 0.0000140 * T**2) * np.sin(mna) +
-              (0.0200940 - 0.0001000 * T) * np.sin(2 * mna) + 0.0002930 * np.sin(3 * mna))
-    result = result * u.deg
-    return Angle(result)
+    return _ephemeris(t).equation_of_center.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -188,8 +281,7 @@ def true_longitude(t='now'):
     accuracy terms from which app_long is derived be added to true_long?)
 
     """
-    result = equation_of_center(t) + geometric_mean_longitude(t)
-    return Longitude(result)
+    return _ephemeris(t).true_longitude.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -198,8 +290,7 @@ def true_anomaly(t='now'):
     Returns the Sun's true anomaly (in degrees).
 
     """
-    result = mean_anomaly(t) + equation_of_center(t)
-    return Longitude(result)
+    return _ephemeris(t).true_anomaly.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -208,11 +299,7 @@ def apparent_longitude(t='now'):
     Returns the apparent longitude of the Sun.
 
     """
-    T = julian_centuries(t)
-    omega = (259.18 - 1934.142 * T) * u.deg
-    true_long = true_longitude(t)
-    result = true_long - (0.00569 - 0.00479 * np.sin(omega)) * u.deg
-    return Longitude(result)
+    return _ephemeris(t).apparent_longitude.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -240,9 +327,7 @@ def true_obliquity_of_ecliptic(t='now'):
     Returns the true obliquity of the ecliptic.
 
     """
-    T = julian_centuries(t)
-    result = 23.452294 - 0.0130125 * T - 0.00000164 * T**2 + 0.000000503 * T**3
-    return Angle(result, u.deg)
+    return _ephemeris(t).true_obliquity_of_ecliptic.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -251,10 +336,7 @@ def true_rightascension(t='now'):
     Return the true right ascension.
 
     """
-    y = np.cos(true_obliquity_of_ecliptic(t)) * np.sin(true_longitude(t))
-    x = np.cos(true_longitude(t))
-    true_ra = np.arctan2(y, x)
-    return Longitude(true_ra.to(u.hourangle))
+    return _ephemeris(t).true_rightascension.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -263,8 +345,7 @@ def true_declination(t='now'):
     Return the true declination.
 
     """
-    result = np.arcsin(np.sin(true_obliquity_of_ecliptic(t)) * np.sin(apparent_longitude(t)))
-    return Latitude(result.to(u.deg))
+    return _ephemeris(t).true_declination.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -273,9 +354,7 @@ def apparent_obliquity_of_ecliptic(t='now'):
     Return the apparent obliquity of the ecliptic.
 
     """
-    omega = apparent_longitude(t)
-    result = true_obliquity_of_ecliptic(t) + (0.00256 * np.cos(omega)) * u.deg
-    return result
+    return _ephemeris(t).apparent_obliquity_of_ecliptic.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -284,10 +363,7 @@ def apparent_rightascension(t='now'):
     Returns the apparent right ascension of the Sun.
 
     """
-    y = np.cos(apparent_obliquity_of_ecliptic(t)) * np.sin(apparent_longitude(t))
-    x = np.cos(apparent_longitude(t))
-    app_ra = np.arctan2(y, x)
-    return Longitude(app_ra.to(u.hourangle))
+    return _ephemeris(t).apparent_rightascension.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -296,10 +372,7 @@ def apparent_declination(t='now'):
     Returns the apparent declination of the Sun.
 
     """
-    ob = apparent_obliquity_of_ecliptic(t)
-    app_long = apparent_longitude(t)
-    result = np.arcsin(np.sin(ob)) * np.sin(app_long)
-    return Latitude(result.to(u.deg))
+    return _ephemeris(t).apparent_declination.copy()
 
 
 @add_common_docstring(append=PARAMETER_DOCS)
@@ -1,4 +1,5 @@
 import astropy.units as u
+from astropy.time import Time
 
 from sunpy.sun import sun
 from astropy.tests.helper import assert_quantity_allclose
@@ -102,3 +103,20 @@ def test_apparent_rightascension():
     assert_quantity_allclose(sun.apparent_rightascension("2012/11/11"), 15.103 * u.hourangle, atol=1e-3 * u.hourangle)
     assert_quantity_allclose(sun.apparent_rightascension("2013/12/13"), 17.356 * u.hourangle, atol=1e-3 * u.hourangle)
     assert_quantity_allclose(sun.apparent_rightascension("2512/04/09"), 1.196 * u.hourangle, atol=1e-3 * u.hourangle)
+
+
+def test_array_time_matches_scalar_time():
+    times = Time(['2002-12-22', '2013-02-26 12:34', '2512-04-09'])
+    for func in [sun.true_longitude, sun.apparent_longitude, sun.apparent_rightascension,
+                 sun.apparent_declination, sun.true_declination, sun.carrington_rotation_number,
+                 sun.solar_cycle_number]:
+        values = func(times)
+        assert len(values) == len(times)
+        for value, t in zip(values, times):
+            assert value == func(t)
+
+
+def test_cached_terms_are_copies():
+    longitude = sun.true_longitude("2012/11/11")
+    longitude[...] = 0 * u.deg
+    assert sun.true_longitude("2012/11/11") != 0 * u.deg
@@ -5,10 +5,12 @@ import pandas
 import pytest
 
 import astropy.time
-from astropy.time import Time
+from astropy.time import Time, TimeDelta
+import astropy.units as u
 
 import sunpy.time as time
 from sunpy.time import parse_time, is_time_equal
+from sunpy.time.time import TIME_FORMAT_LIST
 
 LANDING = Time('1966-02-03', format='isot')
 
@@ -329,6 +331,30 @@ def test_parse_time_list_2():
     assert np.all(parse_time(tstrings) == Time(tstrings))
 
 
+@pytest.mark.parametrize('fmt', TIME_FORMAT_LIST)
+def test_parse_time_list_formats(fmt):
+    tstrings = [datetime(2007, 5, 4, 21, 8, 12, 120000).strftime(fmt),
+                datetime(2016, 12, 31, 3, 4, 5, 999999).strftime(fmt)]
+    expected = [parse_time(t) for t in tstrings]
+
+    for times in [parse_time(tstrings), parse_time(np.array(tstrings))]:
+        assert times.shape == (2,)
+        assert times.scale == expected[0].scale
+        assert all(is_time_equal(t, e) for t, e in zip(times, expected))
+
+
+def test_parse_time_list_mixed_formats():
+    tstrings = ['2007/05/04 21:08', '2007-May-04 21:08:12', '2007-05-04T24:00:00']
+    times = parse_time(np.array(tstrings).reshape(1, 3))
+
+    assert times.shape == (1, 3)
+    assert times.format == 'isot'
+    assert all(is_time_equal(t, parse_time(s)) for t, s in zip(times[0], tstrings))
+
+    with pytest.raises(ValueError):
+        parse_time(['2007/05/04', 'not a time'])
+
+
 def test_break_time():
     t = datetime(2007, 5, 4, 21, 8, 12)
     assert time.break_time(t) == '20070504_210812'
@@ -419,3 +445,96 @@ def test_get_day():
     assert begining_of_day.minute == 0
     assert begining_of_day.second == 0
     assert begining_of_day.microsecond == 0
+
+
+def _isot_datetime64(start, offsets, unit=u.s):
+    times = parse_time(start) + TimeDelta(offsets * unit)
+    times.precision = 9
+    return times.isot.astype('datetime64[ns]')
+
+
+@pytest.mark.parametrize('start, offsets, unit', [
+    ('2011-06-07', np.arange(0, 86400, 2.048), u.s),
+    ('2015-01-01T00:00:01.5', np.arange(1440), u.min),
+    ('2016.05.04_21:08:12_TAI', np.linspace(0, 1000, 7), u.s),
+    # Fermi MET, with leap seconds since the start
+    ('2001-01-01', np.array([3e8, 5e8, 4.0001e8]), u.s),
+    # A leap second between the times
+    ('2012-06-30T23:59', np.array([0, 30, 90, 120.25]), u.s),
+])
+def test_offsets_to_datetime64(start, offsets, unit):
+    times = time.time._offsets_to_datetime64(start, offsets, unit)
+    assert times.dtype == np.dtype('datetime64[ns]')
+    expected = _isot_datetime64(start, offsets, unit)
+    assert np.all(np.abs(times - expected) <= np.timedelta64(1, 'ns'))
+
+
+def test_offsets_to_datetime64_empty():
+    times = time.time._offsets_to_datetime64('2011-06-07', [])
+    assert times.dtype == np.dtype('datetime64[ns]')
+    assert len(times) == 0
+
+
+def test_lru_cache_on_time():
+    calls = []
+
+    @time.time._lru_cache_on_time(maxsize=3)
+    def scaled_jd(time, scale=2):
+        calls.append(time)
+        return np.array(time.jd * scale)
+
+    assert scaled_jd('2012-01-01') == scaled_jd(parse_time('2012-01-01')) == 2 * 2455927.5
+    assert len(calls) == 1
+    # Different formats, scales and arguments are cached separately
+    scaled_jd(parse_time('2012-01-01').tai)
+    scaled_jd(Time(2455927.5, format='jd'))
+    assert scaled_jd('2012-01-01', scale=3) == 3 * 2455927.5
+    assert len(calls) == 4
+    assert scaled_jd.cache_info().currsize == 3
+    # Arrays aren't cached
+    scaled_jd(Time(['2012-01-01']))
+    scaled_jd(Time(['2012-01-01']))
+    assert len(calls) == 6
+
+    scaled_jd.cache_clear()
+    times = parse_time(['2012-01-01', '2012-01-02'])
+    scaled_jd.cache_preload(times)
+    assert len(calls) == 7
+    assert scaled_jd(times[1]) == 2 * 2455928.5
+    assert len(calls) == 7
+    assert scaled_jd.cache_info().hits == 1
+
+
+def test_lru_cache_on_time_preload_copies():
+    results = []
+
+    @time.time._lru_cache_on_time()
+    def days(time):
+        results.append(np.empty(time.shape, dtype=object))
+        for index in np.ndindex(time.shape):
+            results[-1][index] = [time[index].jd - 2455927.5]
+        return results[-1]
+
+    times = parse_time(['2012-01-01', '2012-01-02'])
+    days.cache_preload(times)
+    assert len(results) == 1
+    # The cached results are copies, not shared with the array of results
+    results[0][1][0] = 0
+    assert days(times[1]) == [1]
+    assert days.cache_info().hits == 1
+
+
+def test_lru_cache_on_time_preload_not_array():
+    calls = []
+
+    @time.time._lru_cache_on_time(copy=False)
+    def wrapped(time):
+        calls.append(time)
+        return [time]
+
+    times = parse_time(['2012-01-01', '2012-01-02'])
+    wrapped.cache_preload(times)
+    # Results which aren't one per time are cached for each time on its own
+    assert len(calls) == 3
+    assert wrapped(times[0]) == [times[0]]
+    assert wrapped.cache_info().misses == 2
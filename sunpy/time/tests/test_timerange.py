@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from datetime import timedelta
 
+import numpy as np
 import pytest
 
 import astropy.units as u
@@ -276,3 +277,72 @@ def test_contains(timerange_a):
     assert '2100/1/1'not in timerange
     assert '2014/05/03 12:00' in timerange
     assert '2014/05/05 21:00' in timerange
+
+
+@pytest.mark.parametrize("inputs", [
+    ([tbegin_str, '2012/1/3'], [tfin_str, '2012/1/4']),
+    ([tfin_str, '2012/1/4'], [tbegin_str, '2012/1/3']),
+    ([tbegin_str, '2012/1/3'], dt),
+    ([tbegin_str, '2012/1/3'], TimeDelta(1*u.day)),
+    ([tbegin_str, '2012/1/3'], timedelta(days=1)),
+    ([sunpy.time.TimeRange(tbegin_str, tfin_str),
+      sunpy.time.TimeRange('2012/1/3', '2012/1/4')],)
+])
+def test_timerange_array_inputs(inputs):
+    ranges = sunpy.time.TimeRangeArray(*inputs)
+    assert len(ranges) == 2
+    assert ranges[0] == sunpy.time.TimeRange(start, end)
+    assert ranges[1] == sunpy.time.TimeRange(start + 2 * delta, end + 2 * delta)
+    assert np.all(ranges.dt == delta)
+    assert ranges[::-1] == sunpy.time.TimeRangeArray(list(ranges)[::-1])
+
+
+def test_timerange_array_contains_overlaps():
+    ranges = sunpy.time.TimeRangeArray(['2014/05/03 12:00', '2014/05/05 00:00'], 1 * u.day)
+    assert np.all(ranges.contains('2014/05/04 06:00') == [True, False])
+    assert np.all(ranges.contains(['2014/05/04 13:00', '2014/05/06 00:00']) == [False, True])
+    assert '2014/05/04 12:00' in ranges
+    assert '2014/05/04 18:00' not in ranges
+    touching = sunpy.time.TimeRange('2014/05/04 12:00', '2014/05/04 18:00')
+    assert np.all(ranges.overlaps(touching) == [True, False])
+    assert np.all(ranges.overlaps(ranges[::-1]) == [False, False])
+
+
+def test_timerange_array_union_intersection():
+    ranges = sunpy.time.TimeRangeArray(['2012/1/5', '2012/1/1', '2012/1/2', '2012/1/2 12:00'],
+                                       ['2012/1/6', '2012/1/2', '2012/1/3', '2012/1/2 13:00'])
+    union = ranges.union()
+    assert union == sunpy.time.TimeRangeArray(['2012/1/1', '2012/1/5'], ['2012/1/3', '2012/1/6'])
+    assert ranges.union(sunpy.time.TimeRange('2012/1/3', '2012/1/5')) == \
+        sunpy.time.TimeRangeArray(['2012/1/1'], ['2012/1/6'])
+
+    other = sunpy.time.TimeRangeArray(['2012/1/1 12:00', '2012/1/2 12:00', '2012/1/7'],
+                                      ['2012/1/2 06:00', '2012/1/5 06:00', '2012/1/8'])
+    intersection = ranges.intersection(other)
+    assert intersection == sunpy.time.TimeRangeArray(
+        ['2012/1/1 12:00', '2012/1/2 12:00', '2012/1/5'],
+        ['2012/1/2 06:00', '2012/1/3', '2012/1/5 06:00'])
+    assert len(ranges.intersection(sunpy.time.TimeRange('2011/1/1', '2011/1/2'))) == 0
+
+
+def test_timerange_array_split_window():
+    timeranges = [sunpy.time.TimeRange(tbegin_str, tfin_str),
+                  sunpy.time.TimeRange('2012/1/3', '2012/1/3 05:00')]
+    ranges = sunpy.time.TimeRangeArray(timeranges)
+
+    expected = [r for timerange in timeranges for r in timerange.split(3)]
+    for r, e in zip(ranges.split(3), expected):
+        assert abs((r.start - e.start).to_value(u.s)) < 1e-6
+        assert abs((r.end - e.end).to_value(u.s)) < 1e-6
+    assert len(ranges.split(3)) == 6
+    with pytest.raises(ValueError):
+        ranges.split(0)
+
+    expected = [r for timerange in timeranges for r in timerange.window(7 * u.hour, 1 * u.hour)]
+    assert list(ranges.window(7 * u.hour, 1 * u.hour)) == expected
+
+
+def test_timerange_array_sort():
+    ranges = sunpy.time.TimeRangeArray(['2012/1/3', '2012/1/1', '2012/1/1'],
+                                       ['2012/1/4', '2012/1/3', '2012/1/2'])
+    assert ranges.sort() == ranges[[2, 1, 0]]
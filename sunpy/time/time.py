@@ -1,12 +1,15 @@
 import re
+import inspect
 import textwrap
 from datetime import datetime, date
-from functools import singledispatch
+from functools import wraps, lru_cache, singledispatch
+from threading import RLock
+from collections import namedtuple, OrderedDict
 
 import numpy as np
 
 import astropy.time
-from astropy.time import Time
+from astropy.time import Time, TimeDelta
 import astropy.units as u
 
 from sunpy.time.utime import TimeUTime  # noqa: F401
@@ -58,6 +61,9 @@ TIME_FORMAT_LIST = [
     "%Y.%m.%d_%H:%M:%S_TAI",  # Example 2016.05.04_21:08:12_TAI
 ]
 
+_MONTHS = {month: i + 1 for i, month in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])}
+
 
 def is_time_equal(t1, t2):
     """
@@ -82,13 +88,33 @@ def _n_or_eq(a, b):
     return a is None or a == b
 
 
+@lru_cache(maxsize=None)
+def _format_regex(format):
+    """
+    The compiled regular expression of a time format, with the format codes
+    replaced by the patterns in `REGEX`.
+    """
+    for key, value in REGEX.items():
+        format = format.replace(key, value)
+    return re.compile(format)
+
+
+@lru_cache(maxsize=None)
+def _format_fullmatch_regex(format):
+    """
+    The compiled regular expression matching the whole of a string in a time
+    format, with the characters between the format codes matched literally.
+    """
+    codes = '({})'.format('|'.join(re.escape(key) for key in REGEX))
+    parts = re.split(codes, format)
+    return re.compile(''.join(REGEX.get(part, re.escape(part)) for part in parts))
+
+
 def _regex_parse_time(inp, format):
     # Parser for finding out the minute value so we can adjust the string
     # from 24:00:00 to 00:00:00 the next day because strptime does not
     # understand the former.
-    for key, value in REGEX.items():
-        format = format.replace(key, value)
-    match = re.match(format, inp)
+    match = _format_regex(format).match(inp)
     if match is None:
         return None, None
     try:
@@ -112,10 +138,7 @@ def find_time(string, format):
 
     Currently supported format codes: TODO: ADD THIS
     """
-    re_format = format
-    for key, value in REGEX.items():
-        re_format = re_format.replace(key, value)
-    matches = re.finditer(re_format, string)
+    matches = _format_regex(format).finditer(string)
     for match in matches:
         try:
             matchstr = string[slice(*match.span())]
@@ -145,6 +168,179 @@ def _astropy_time(time):
         parse_time(time))
 
 
+def _offsets_to_datetime64(start, offsets, unit=u.s):
+    """
+    Convert times given as offsets from a start time to a ``datetime64[ns]`` array.
+
+    This is equivalent to ``(start + TimeDelta(offsets * unit)).isot`` parsed as
+    ``datetime64``, including the leap seconds `~astropy.time.Time` adds, but
+    is computed with integer nanosecond arithmetic rather than by formatting
+    and parsing a string for every time.
+
+    Parameters
+    ----------
+    start : `astropy.time.Time` or time string
+        The time the offsets are measured from.
+    offsets : `numpy.ndarray`
+        The offsets from ``start``.
+    unit : `astropy.units.Unit`, optional
+        The unit of ``offsets``, a whole number of nanoseconds. Defaults to
+        seconds.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The times as ``datetime64[ns]`` in the scale of ``start``.
+    """
+    start = Time(_astropy_time(start), precision=9)
+    offsets = np.asarray(offsets, dtype=np.float64)
+    if offsets.size == 0:
+        return np.array([], dtype='datetime64[ns]')
+
+    # Split into whole and fractional parts so large offsets keep nanosecond
+    # precision, treating every day as 86400 seconds long.
+    scale = unit.to(u.ns)
+    whole = np.floor(offsets)
+    nanoseconds = (whole.astype(np.int64) * np.int64(round(scale)) +
+                   np.round((offsets - whole) * scale).astype(np.int64))
+    times = np.datetime64(start.isot, 'ns') + nanoseconds.astype('timedelta64[ns]')
+
+    # Correct for the leap seconds between the start and the first and last
+    # times. If these differ there is a leap second within the times, so
+    # leave it to astropy.
+    ends = [np.argmin(offsets), np.argmax(offsets)]
+    exact = start + TimeDelta(offsets[ends] * unit)
+    exact.precision = 9
+    try:
+        leaps = np.round((exact.isot.astype('datetime64[ns]') - times[ends]) /
+                         np.timedelta64(1, 's')).astype(np.int64)
+    except ValueError:
+        # A time at 23:59:60
+        leaps = None
+    if leaps is None or leaps[0] != leaps[1]:
+        times = start + TimeDelta(offsets * unit)
+        times.precision = 9
+        return times.isot.astype('datetime64[ns]')
+    return times + np.timedelta64(int(leaps[0]), 's')
+
+
+def _time_to_datetime64(time):
+    """
+    Convert an `~astropy.time.Time` to ``datetime64[ns]`` UTC times.
+
+    This is equivalent to ``time.utc.datetime64`` but is computed from the
+    Julian dates rather than by formatting and parsing a string for every time.
+    """
+    time = time.utc
+    days = time.jd1 - 2440587.5
+    whole = np.round(days)
+    nanoseconds = (whole.astype(np.int64) * np.int64(86400 * 10**9) +
+                   np.round((days - whole + time.jd2) * 86400e9).astype(np.int64))
+    return nanoseconds.view('datetime64[ns]')
+
+
+_CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _time_key(time):
+    """
+    A hashable key of a scalar `~astropy.time.Time`, equal for times with the
+    same value, scale and format.
+    """
+    return (time.scale, time.format, float(time.jd1), float(time.jd2))
+
+
+def _lru_cache_on_time(maxsize=128, copy=True):
+    """
+    Memoize a function with a ``time`` argument, like `functools.lru_cache`.
+
+    The time is run through `~sunpy.time.parse_time`. Results for scalar times
+    without a location are cached on the time and the other arguments, which
+    must be hashable, other calls are passed straight to the function. If
+    ``copy`` is `True` a copy of the cached result is returned so callers
+    can't change the cache.
+
+    Like `functools.lru_cache` the decorated function has ``cache_info`` and
+    ``cache_clear`` attributes. It also has a ``cache_preload`` attribute,
+    taking the same arguments as the function, which calls the function once
+    with an array of times and caches the result for each of the times.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        cache = OrderedDict()
+        stats = {'hits': 0, 'misses': 0}
+        lock = RLock()
+
+        def bind(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            bound.arguments['time'] = parse_time(bound.arguments['time'])
+            others = tuple((name, value) for name, value in bound.arguments.items()
+                           if name != 'time')
+            return bound, bound.arguments['time'], others
+
+        def store(key, result):
+            with lock:
+                cache[key] = result
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound, time, others = bind(args, kwargs)
+            if not time.isscalar or time.location is not None:
+                return func(*bound.args, **bound.kwargs)
+            key = (_time_key(time), others)
+            try:
+                with lock:
+                    result = cache[key]
+                    cache.move_to_end(key)
+                    stats['hits'] += 1
+            except KeyError:
+                result = func(*bound.args, **bound.kwargs)
+                with lock:
+                    stats['misses'] += 1
+                    store(key, result)
+            except TypeError:
+                # Unhashable arguments
+                return func(*bound.args, **bound.kwargs)
+            return result.copy() if copy else result
+
+        def cache_preload(*args, **kwargs):
+            bound, times, others = bind(args, kwargs)
+            if times.isscalar or times.location is not None:
+                wrapper(*bound.args, **bound.kwargs)
+                return
+            results = func(*bound.args, **bound.kwargs)
+            if getattr(results, 'shape', None) != times.shape:
+                # The result can't be split into one per time, so cache each
+                # time on its own instead.
+                for time in times.ravel():
+                    bound.arguments['time'] = time
+                    wrapper(*bound.args, **bound.kwargs)
+                return
+            # Store copies so the cached results don't share the memory of
+            # the array of results.
+            for index in np.ndindex(times.shape):
+                store((_time_key(times[index]), others), results[index].copy())
+
+        def cache_info():
+            with lock:
+                return _CacheInfo(stats['hits'], stats['misses'], maxsize, len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0)
+
+        wrapper.cache_preload = cache_preload
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
 @singledispatch
 def convert_time(time_string, format=None, **kwargs):
     # default case when no type matches
@@ -197,10 +393,19 @@ def convert_time_npdatetime64(time_string, **kwargs):
 def convert_time_npndarray(time_string, **kwargs):
     if 'datetime64' in str(time_string.dtype):
         return Time([str(dt.astype('M8[ns]')) for dt in time_string], **kwargs)
+    elif time_string.dtype.kind in 'US' and time_string.size:
+        return _convert_time_str_array(time_string, **kwargs)
     else:
         return convert_time.dispatch(object)(time_string, **kwargs)
 
 
+@convert_time.register(list)
+def convert_time_list(time_string, **kwargs):
+    if time_string and all(isinstance(t, str) for t in time_string):
+        return _convert_time_str_array(np.array(time_string), **kwargs)
+    return convert_time.dispatch(object)(time_string, **kwargs)
+
+
 @convert_time.register(astropy.time.Time)
 def convert_time_astropy(time_string, **kwargs):
     return time_string
@@ -232,6 +437,76 @@ def convert_time_str(time_string, **kwargs):
     return convert_time.dispatch(object)(time_string, **kwargs)
 
 
+def _convert_time_str_array(time_strings, **kwargs):
+    """
+    Parse an array of time strings.
+
+    Arrays in the formats understood by `~astropy.time.Time` are parsed by it.
+    Otherwise the format is found from the first string and if every string
+    is in the same format they are parsed together, else each string is
+    parsed on its own.
+    """
+    try:
+        return Time(time_strings, **kwargs)
+    except ValueError:
+        if kwargs.get('format') is not None:
+            raise
+
+    strings = time_strings.astype(str).ravel()
+    times = _parse_time_strings_in_one_format(strings, **kwargs)
+    if times is None:
+        times = Time([convert_time_str(string, **kwargs) for string in strings])
+    return times.reshape(time_strings.shape)
+
+
+def _parse_time_strings_in_one_format(strings, **kwargs):
+    """
+    Parse an array of time strings if they are all in the one format of
+    `TIME_FORMAT_LIST`, by converting them to ISO 8601 (or year and day of year)
+    strings for `~astropy.time.Time`. Returns `None` if they are not.
+    """
+    for time_format in TIME_FORMAT_LIST:
+        regex = _format_fullmatch_regex(time_format)
+        if regex.fullmatch(strings[0]):
+            break
+    else:
+        return None
+
+    matches = [regex.fullmatch(string) for string in strings]
+    if any(match is None for match in matches):
+        return None
+
+    day_of_year = '%j' in time_format
+    fields = []
+    for match in matches:
+        groups = match.groupdict()
+        hour = groups.get('hour', '0')
+        if hour == '24':
+            return None
+        if day_of_year:
+            date = '{}:{:0>3}'.format(groups['year'], groups['dayofyear'])
+        else:
+            month = groups.get('month')
+            if month is None:
+                month = _MONTHS.get(groups['month_str'].lower())
+                if month is None:
+                    return None
+            date = '{}-{:0>2}-{:0>2}'.format(groups['year'], month, groups['day'])
+        fields.append('{}{}{:0>2}:{:0>2}:{:0>2}.{}'.format(
+            date, ':' if day_of_year else 'T', hour, groups.get('minute', '0'),
+            groups.get('second', '0'), groups.get('microsecond', '0')))
+
+    kwargs['format'] = 'yday' if day_of_year else 'isot'
+    if 'TAI' in time_format:
+        kwargs['scale'] = 'tai'
+    try:
+        times = Time(fields, **kwargs)
+    except ValueError:
+        return None
+    times.format = 'isot'
+    return times
+
+
 def _variables_for_parse_time_docstring():
     ret = {}
 
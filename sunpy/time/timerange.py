@@ -1,5 +1,7 @@
 from datetime import timedelta
 
+import numpy as np
+
 import astropy.units as u
 from astropy.time import TimeDelta
 from astropy.time import Time
@@ -9,7 +11,7 @@ from sunpy import config
 
 TIME_FORMAT = config.get('general', 'time_format')
 
-__all__ = ['TimeRange']
+__all__ = ['TimeRange', 'TimeRangeArray']
 
 
 class TimeRange(object):
@@ -416,3 +418,420 @@ class TimeRange(object):
         """
         this_time = parse_time(time)
         return this_time >= self.start and this_time <= self.end
+
+
+def _in_scale(time, scale):
+    """
+    The times in ``scale``.
+    """
+    return time if time.scale == scale else getattr(time, scale)
+
+
+def _jd_time(jd1, jd2, like):
+    """
+    A `~astropy.time.Time` from two-part Julian dates, with the scale, format
+    and precision of ``like``.
+    """
+    time = Time(jd1, jd2, format='jd', scale=like.scale)
+    time.format = like.format
+    time.precision = like.precision
+    return time
+
+
+def _select(mask, a, b):
+    """
+    The times of ``a`` where ``mask`` is true and of ``b`` elsewhere, exactly.
+    """
+    b = _in_scale(b, a.scale)
+    return _jd_time(np.where(mask, a.jd1, b.jd1), np.where(mask, a.jd2, b.jd2), a)
+
+
+def _concatenate(a, b):
+    """
+    Join two one dimensional `~astropy.time.Time` arrays, in the scale of ``a``.
+    """
+    b = _in_scale(b, a.scale)
+    return _jd_time(np.concatenate([a.jd1, b.jd1]), np.concatenate([a.jd2, b.jd2]), a)
+
+
+class TimeRangeArray(object):
+    """
+    A one dimensional array of time ranges.
+
+    The start and end times are stored in two `astropy.time.Time` arrays so
+    operations on many time ranges are vectorised. As for
+    `~sunpy.time.TimeRange` the start of every range is before its end and
+    both limits are inclusive.
+
+    Parameters
+    ----------
+    a : `list` of `~sunpy.time.TimeRange`, `~sunpy.time.TimeRangeArray`, or array of times
+        The time ranges, or parse_time-compatible start times.
+    b : array of times, `astropy.time.TimeDelta`, time `astropy.units.Quantity` or timedelta
+        The end times, or the durations of the time ranges. Must be given if
+        ``a`` is times. Start and end times are broadcast against each other.
+    format : `str`, optional
+        The format of the times passed to `~sunpy.time.parse_time`.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> from sunpy.time import TimeRange, TimeRangeArray
+    >>> ranges = TimeRangeArray(['2010/03/04 00:10', '2010/03/04 00:30'], 20 * u.min)
+    >>> len(ranges)
+    2
+    >>> ranges.union()[0].end
+    <Time object: scale='utc' format='isot' value=2010-03-04T00:50:00.000>
+    >>> ranges.contains('2010/03/04 00:35')
+    array([False,  True])
+    >>> ranges = TimeRangeArray([TimeRange('2010/03/04 00:10', '2010/03/04 00:20'),
+    ...                          TimeRange('2010/03/05 00:10', '2010/03/05 00:20')])
+    """
+    def __init__(self, a, b=None, format=None):
+        if isinstance(a, TimeRangeArray):
+            self.__dict__ = a.__dict__.copy()
+            return
+
+        if b is None:
+            if len(a) == 0:
+                raise ValueError('If b is None a must be a non-empty list of TimeRanges')
+            ranges = [TimeRange(r) for r in a]
+            x = parse_time([r.start for r in ranges])
+            y = parse_time([r.end for r in ranges])
+        else:
+            x = parse_time(a, format=format)
+            y = b
+            if isinstance(y, u.Quantity):
+                y = TimeDelta(y)
+            if isinstance(y, timedelta):
+                y = TimeDelta(y, format='datetime')
+            if isinstance(y, TimeDelta):
+                y = x + y
+            else:
+                y = parse_time(y, format=format)
+
+        earlier = x <= y
+        start = _select(earlier, x, y)
+        end = _select(earlier, y, x)
+        if start.ndim > 1:
+            raise ValueError('A TimeRangeArray must be one dimensional')
+        self._t1 = start.reshape(-1)
+        self._t2 = end.reshape(-1)
+
+    @classmethod
+    def _from_times(cls, start, end):
+        ranges = cls.__new__(cls)
+        ranges._t1 = start
+        ranges._t2 = _in_scale(end, start.scale)
+        return ranges
+
+    @property
+    def start(self):
+        """
+        Get the start times
+
+        Returns
+        -------
+        start : `astropy.time.Time`
+        """
+        return self._t1
+
+    @property
+    def end(self):
+        """
+        Get the end times
+
+        Returns
+        -------
+        end : `astropy.time.Time`
+        """
+        return self._t2
+
+    @property
+    def dt(self):
+        """
+        Get the lengths of the time ranges. Always positive values.
+
+        Returns
+        -------
+        dt : `astropy.time.TimeDelta`
+        """
+        return self._t2 - self._t1
+
+    @property
+    def center(self):
+        """
+        Gets the centers of the time ranges.
+
+        Returns
+        -------
+        value : `astropy.time.Time`
+        """
+        return self._t1 + self.dt / 2
+
+    def __len__(self):
+        return len(self._t1)
+
+    def __getitem__(self, item):
+        """
+        A `~sunpy.time.TimeRange` for an integer index, otherwise a
+        `~sunpy.time.TimeRangeArray`.
+        """
+        if isinstance(item, (int, np.integer)):
+            return TimeRange(self._t1[item], self._t2[item])
+        return self._from_times(self._t1[item], self._t2[item])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other):
+        """
+        Check two TimeRangeArray objects have the same start and end times.
+
+        Parameters
+        ----------
+        other : `~sunpy.time.timerange.TimeRangeArray`
+            The second TimeRangeArray object to compare to.
+
+        Returns
+        -------
+        result : `bool`
+        """
+        if isinstance(other, TimeRangeArray):
+            return (len(self) == len(other) and
+                    bool(np.all(self._t1 == other._t1) and np.all(self._t2 == other._t2)))
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        """
+        Returns a human-readable representation of the TimeRangeArray instance.
+        """
+        fully_qualified_name = '{0}.{1}'.format(self.__class__.__module__, self.__class__.__name__)
+        text = ('   <{0} object at {1}>'.format(fully_qualified_name, hex(id(self))) +
+                '\n    Length:'.ljust(12) + str(len(self)))
+        if len(self):
+            text += ('\n    Start:'.ljust(12) + self._t1.min().strftime(TIME_FORMAT) +
+                     '\n    End:'.ljust(12) + self._t2.max().strftime(TIME_FORMAT))
+        return text + '\n'
+
+    def _offsets(self, jd1=None):
+        """
+        The start and end times in days from the Julian date ``jd1``, which
+        defaults to the first day of the earliest start.
+        """
+        if jd1 is None:
+            jd1 = self._t1.jd1.min() if len(self) else 0.
+        return ((self._t1.jd1 - jd1) + self._t1.jd2,
+                (self._t2.jd1 - jd1) + self._t2.jd2)
+
+    def argsort(self):
+        """
+        The indices which sort the time ranges by start time and then end time.
+
+        Returns
+        -------
+        indices : `numpy.ndarray`
+        """
+        start, end = self._offsets()
+        return np.lexsort((end, start))
+
+    def sort(self):
+        """
+        The time ranges sorted by start time and then end time.
+
+        Returns
+        -------
+        time ranges : `~sunpy.time.TimeRangeArray`
+        """
+        return self[self.argsort()]
+
+    def contains(self, time):
+        """
+        Checks whether times lie within the time ranges, with both limits
+        inclusive.
+
+        Parameters
+        ----------
+        time : parse_time-compatible time or array of times
+            The times to check, broadcast against the time ranges.
+
+        Returns
+        -------
+        value : `numpy.ndarray`
+            True where the time lies between the start and end of the range.
+        """
+        time = parse_time(time)
+        return (self._t1 <= time) & (time <= self._t2)
+
+    def __contains__(self, time):
+        """
+        Checks whether the given time lies within any of the time ranges.
+        """
+        return bool(np.any(self.contains(time)))
+
+    def overlaps(self, other):
+        """
+        Checks whether the time ranges overlap other time ranges, including
+        ranges which only touch.
+
+        Parameters
+        ----------
+        other : `~sunpy.time.TimeRange` or `~sunpy.time.TimeRangeArray`
+            The time ranges to compare to, broadcast against these ranges.
+
+        Returns
+        -------
+        value : `numpy.ndarray`
+        """
+        other = _as_time_range_array(other)
+        return (self._t1 <= other._t2) & (other._t1 <= self._t2)
+
+    def union(self, other=None):
+        """
+        Merge overlapping time ranges.
+
+        Parameters
+        ----------
+        other : `~sunpy.time.TimeRange` or `~sunpy.time.TimeRangeArray`, optional
+            More time ranges to merge with these.
+
+        Returns
+        -------
+        time ranges : `~sunpy.time.TimeRangeArray`
+            The sorted, disjoint time ranges covering the same times.
+        """
+        ranges = self
+        if other is not None:
+            other = _as_time_range_array(other)
+            ranges = self._from_times(_concatenate(self._t1, other._t1),
+                                      _concatenate(self._t2, other._t2))
+        if not len(ranges):
+            return ranges
+
+        order = ranges.argsort()
+        start, end = ranges._offsets()
+        start, end = start[order], end[order]
+        # A new range starts where a start is after all the previous ends.
+        reach = np.maximum.accumulate(end)
+        new = np.ones(len(start), dtype=bool)
+        new[1:] = start[1:] > reach[:-1]
+        group = np.cumsum(new) - 1
+        last = np.cumsum(np.bincount(group)) - 1
+        latest = order[np.lexsort((end, group))[last]]
+        return self._from_times(ranges._t1[order[new]], ranges._t2[latest])
+
+    def intersection(self, other):
+        """
+        The times covered by both these and other time ranges.
+
+        Parameters
+        ----------
+        other : `~sunpy.time.TimeRange` or `~sunpy.time.TimeRangeArray`
+            The time ranges to intersect with.
+
+        Returns
+        -------
+        time ranges : `~sunpy.time.TimeRangeArray`
+            The sorted, disjoint time ranges covered by both.
+        """
+        a = self.union()
+        b = _as_time_range_array(other).union()
+        if not len(a) or not len(b):
+            return a[:0]
+        b = self._from_times(_in_scale(b._t1, a._t1.scale), b._t2)
+
+        jd1 = min(a._t1.jd1.min(), b._t1.jd1.min())
+        a_start, a_end = a._offsets(jd1)
+        b_start, b_end = b._offsets(jd1)
+        # Both are sorted and disjoint, so each range of a overlaps a
+        # contiguous block of the ranges of b.
+        lo = np.searchsorted(b_end, a_start, side='left')
+        hi = np.searchsorted(b_start, a_end, side='right')
+        counts = np.maximum(hi - lo, 0)
+        ia = np.repeat(np.arange(len(a)), counts)
+        ib = lo[ia] + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        start = _select(a_start[ia] >= b_start[ib], a._t1[ia], b._t1[ib])
+        end = _select(a_end[ia] <= b_end[ib], a._t2[ia], b._t2[ib])
+        return self._from_times(start, end)
+
+    def split(self, n=2):
+        """
+        Splits each time range into multiple equally sized parts.
+
+        Parameters
+        ----------
+        n : int
+            The number of times to split the time ranges (must >= 1)
+
+        Returns
+        -------
+        time ranges : `~sunpy.time.TimeRangeArray`
+            The ``n`` parts of the first time range, then of the second and so on.
+
+        Raises
+        ------
+        ValueError
+            If requested amount is less than 1
+        """
+        if n <= 0:
+            raise ValueError('n must be greater than or equal to 1')
+        edges = (self._t1.reshape(-1, 1) +
+                 self.dt.reshape(-1, 1) * (np.arange(n + 1) / n))
+        end = _in_scale(self._t2, edges.scale)
+        jd1, jd2 = edges.jd1.copy(), edges.jd2.copy()
+        jd1[:, -1], jd2[:, -1] = end.jd1, end.jd2
+        return self._from_times(_jd_time(jd1[:, :-1].ravel(), jd2[:, :-1].ravel(), self._t1),
+                                _jd_time(jd1[:, 1:].ravel(), jd2[:, 1:].ravel(), self._t1))
+
+    def window(self, cadence, window):
+        """
+        Split each time range up into a series of windows, 'window' long,
+        between its start and end with a cadence of 'cadence', as
+        `~sunpy.time.TimeRange.window`.
+
+        Parameters
+        ----------
+        cadence : `astropy.units.Quantity`, `astropy.time.TimeDelta`
+            Cadence in seconds or a timedelta instance
+        window : `astropy.units.quantity`, `astropy.time.TimeDelta`
+            The length of the windows.
+
+        Returns
+        -------
+        time ranges : `~sunpy.time.TimeRangeArray`
+            The windows of the first time range, then of the second and so on.
+        """
+        if isinstance(window, timedelta):
+            window = TimeDelta(window, format="datetime")
+        if isinstance(cadence, timedelta):
+            cadence = TimeDelta(cadence, format="datetime")
+
+        if not isinstance(window, TimeDelta):
+            window = TimeDelta(window)
+        if not isinstance(cadence, TimeDelta):
+            cadence = TimeDelta(cadence)
+        if cadence.jd <= 0:
+            raise ValueError('cadence must be positive')
+
+        # Windows are added until one reaches the end of the time range.
+        steps = np.ceil((self.dt - window).to_value(u.s) / cadence.to_value(u.s))
+        counts = np.maximum(steps, 0).astype(int) + 1
+        index = np.repeat(np.arange(len(self)), counts)
+        step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        start = self._t1[index] + cadence * step
+        return self._from_times(start, start + window)
+
+
+def _as_time_range_array(ranges):
+    if isinstance(ranges, TimeRangeArray):
+        return ranges
+    if isinstance(ranges, TimeRange):
+        return TimeRangeArray._from_times(ranges.start.reshape(1), ranges.end.reshape(1))
+    return TimeRangeArray(ranges)
@@ -8,7 +8,7 @@ instruments as this will become part of the universal downloader.
 """
 from sunpy.timeseries.metadata import TimeSeriesMetaData
 from sunpy.timeseries.timeseries_factory import TimeSeries
-from sunpy.timeseries.timeseriesbase import GenericTimeSeries
+from sunpy.timeseries.timeseriesbase import GenericTimeSeries, TimeSeriesView
 from sunpy.timeseries.sources.eve import EVESpWxTimeSeries
 from sunpy.timeseries.sources.goes import XRSTimeSeries
 from sunpy.timeseries.sources.noaa import NOAAIndicesTimeSeries, NOAAPredictIndicesTimeSeries
@@ -0,0 +1,173 @@
+"""
+An on-disk cache of parsed TimeSeries source files.
+
+Each cached file is stored in its own directory holding the time index and
+the data columns as ``.npy`` files, with columns of the same dtype stored
+together in a column-major array so they can be memory mapped straight into a
+`~pandas.DataFrame`, and a pickle of the metadata, units and source class.
+"""
+import os
+import shutil
+import pickle
+import hashlib
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import sunpy
+
+__all__ = ['TimeSeriesCache', 'get_default_cache_dir']
+
+# Increment if the layout of the cache changes to ignore old entries.
+CACHE_VERSION = 1
+
+
+def get_default_cache_dir():
+    """
+    The default location of the TimeSeries cache, within the SunPy working
+    directory.
+    """
+    return os.path.join(sunpy.config.get('general', 'working_dir'), 'timeseries_cache')
+
+
+class TimeSeriesCache(object):
+    """
+    An on-disk cache of the (data, header, units) parsed from TimeSeries files.
+
+    Entries are keyed by the absolute path, modification time and size of the
+    source file and the ``source`` given to the factory, so changed files are
+    parsed again. Cached data is memory mapped copy-on-write when loaded.
+
+    Parameters
+    ----------
+    directory : `str`, optional
+        The directory to store the cache in. Defaults to
+        `~sunpy.timeseries.cache.get_default_cache_dir`.
+
+    Examples
+    --------
+    >>> import sunpy.timeseries
+    >>> ts = sunpy.timeseries.TimeSeries('EVE_L0CS_DIODES_1m.txt', source='EVE',
+    ...                                  cache=True)  # doctest: +SKIP
+    """
+
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = get_default_cache_dir()
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+
+    def _key(self, filepath, source=None):
+        stat = os.stat(filepath)
+        key = repr((CACHE_VERSION, os.path.abspath(filepath), stat.st_mtime_ns,
+                    stat.st_size, str(source or '').lower()))
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def _path(self, filepath, source=None):
+        return os.path.join(self.directory, self._key(filepath, source))
+
+    def load(self, filepath, source=None):
+        """
+        Load the parsed contents of a file from the cache.
+
+        Parameters
+        ----------
+        filepath : `str`
+            The source file.
+        source : `str`, optional
+            The source given when the file was parsed.
+
+        Returns
+        -------
+        `tuple` or `None`
+            The cached ``(kind, cls, (data, header, units))`` or `None` if
+            the file is not in the cache.
+        """
+        path = self._path(filepath, source)
+        try:
+            with open(os.path.join(path, 'info.pickle'), 'rb') as f:
+                info = pickle.load(f)
+            index = pd.DatetimeIndex(np.load(os.path.join(path, 'index.npy')),
+                                     name=info['index_name'])
+            frames = []
+            for filename, columns in info['groups']:
+                values = np.load(os.path.join(path, filename), mmap_mode='c',
+                                 allow_pickle=False)
+                frames.append(pd.DataFrame(values, index=index, columns=columns, copy=False))
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+
+        if len(frames) == 1:
+            data = frames[0]
+        else:
+            data = pd.concat(frames, axis=1)[info['columns']]
+
+        return info['kind'], info['cls'], (data, info['header'], info['units'])
+
+    def save(self, filepath, parsed, source=None):
+        """
+        Store the parsed contents of a file in the cache.
+
+        Only data in a `~pandas.DataFrame` with a time index and uniquely named
+        columns of numeric, boolean or datetime dtypes can be cached, other
+        data is silently not stored.
+
+        Parameters
+        ----------
+        filepath : `str`
+            The source file.
+        parsed : `tuple`
+            The ``(kind, cls, (data, header, units))`` parsed from the file.
+        source : `str`, optional
+            The source given when the file was parsed.
+
+        Returns
+        -------
+        `bool`
+            Whether the file was cached.
+        """
+        kind, cls, (data, header, units) = parsed
+        if not (isinstance(data, pd.DataFrame) and
+                isinstance(data.index, pd.DatetimeIndex) and data.index.tz is None and
+                data.columns.is_unique and
+                all(dtype.kind in 'biufcmM' for dtype in data.dtypes)):
+            return False
+
+        # Group the columns by dtype, each group is stored column-major.
+        groups = {}
+        for i, dtype in enumerate(data.dtypes):
+            groups.setdefault(dtype, []).append(i)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(filepath, source)
+        tmp = tempfile.mkdtemp(dir=self.directory)
+        try:
+            np.save(os.path.join(tmp, 'index.npy'), data.index.values)
+            info_groups = []
+            for i, (dtype, positions) in enumerate(groups.items()):
+                filename = 'data_{}.npy'.format(i)
+                values = np.empty((len(data), len(positions)), dtype=dtype, order='F')
+                for j, position in enumerate(positions):
+                    values[:, j] = data.iloc[:, position].values
+                np.save(os.path.join(tmp, filename), values)
+                info_groups.append((filename, [data.columns[p] for p in positions]))
+            info = {'kind': kind, 'cls': cls, 'header': header, 'units': units,
+                    'index_name': data.index.name, 'columns': list(data.columns),
+                    'groups': info_groups}
+            with open(os.path.join(tmp, 'info.pickle'), 'wb') as f:
+                pickle.dump(info, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            # Another process may have cached the same file first.
+            shutil.rmtree(tmp, ignore_errors=True)
+            return os.path.isdir(path)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+        return True
+
+    def clear(self):
+        """
+        Remove all the entries in the cache.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
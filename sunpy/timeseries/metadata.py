@@ -4,14 +4,136 @@ __email__ = "stuart@mumford.me.uk"
 
 from sunpy.util.metadata import MetaDict
 import itertools
+import functools
+import bisect
 import copy
 
 import warnings
 import inspect
 
+import numpy as np
+
 from sunpy.time import TimeRange, parse_time
 
 
+def _jd(time):
+    """
+    Return the two part UTC Julian date of a `~astropy.time.Time`.
+    """
+    time = time.utc
+    return time.jd1, time.jd2
+
+
+def _counts_changes(name):
+    """
+    Wrap a `list` method so calling it increments the list's version.
+    """
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _MetaDataList(list):
+    """
+    The list of entries of a `~sunpy.timeseries.TimeSeriesMetaData`, which
+    counts the changes made to it so the index over it can tell it is out of
+    date without comparing every entry.
+    """
+    version = 0
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend',
+              'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(_MetaDataList, _name, _counts_changes(_name))
+del _name
+
+
+class _MetaDataIndex(object):
+    """
+    An index over the entries of a `~sunpy.timeseries.TimeSeriesMetaData`,
+    holding arrays of the start and end times of each TimeRange and the
+    entries listing each column, so lookups don't loop over `~astropy.time.Time`
+    comparisons in Python.
+
+    Parameters
+    ----------
+    metadata : `_MetaDataList`
+        The list of metadata entries to index.
+    """
+
+    def __init__(self, metadata):
+        self.version = metadata.version
+        times = np.array([_jd(entry[0].start) + _jd(entry[0].end) for entry in metadata],
+                         dtype=float).reshape(-1, 4)
+        self._size = len(times)
+        # The times and ids are held in buffers with spare rows at the end, so
+        # inserting an entry only shifts the rows after it.
+        self._times = np.empty((max(2 * self._size, 16), 4))
+        self._times[:self._size] = times
+        self._ids = np.empty(len(self._times), dtype=int)
+        self._ids[:self._size] = np.arange(self._size)
+        # The ids of the entries listing each column, entries keep their id
+        # when others are inserted before them.
+        self._columns = {}
+        for i, entry in enumerate(metadata):
+            self._add_columns(i, entry)
+
+    @property
+    def times(self):
+        """
+        The ``(n, 4)`` array of the start and end Julian dates of each entry.
+        """
+        return self._times[:self._size]
+
+    def _add_columns(self, id_, entry):
+        for column in set(entry[1]):
+            self._columns.setdefault(column, []).append(id_)
+
+    def insert(self, pos, entry, version):
+        """
+        Insert an entry into the index at the same position as in the list.
+        """
+        size = self._size
+        if size == len(self._times):
+            self._times = np.concatenate([self._times, np.empty_like(self._times)])
+            self._ids = np.concatenate([self._ids, np.empty_like(self._ids)])
+        self._times[pos + 1:size + 1] = self._times[pos:size]
+        self._ids[pos + 1:size + 1] = self._ids[pos:size]
+        self._times[pos] = _jd(entry[0].start) + _jd(entry[0].end)
+        self._ids[pos] = size
+        self._add_columns(size, entry)
+        self._size = size + 1
+        self.version = version
+
+    def starts_minus(self, time):
+        """
+        The start of each entry minus the given time, in days.
+        """
+        jd1, jd2 = _jd(time)
+        return (self.times[:, 0] - jd1) + (self.times[:, 1] - jd2)
+
+    def ends_minus(self, time):
+        """
+        The end of each entry minus the given time, in days.
+        """
+        jd1, jd2 = _jd(time)
+        return (self.times[:, 2] - jd1) + (self.times[:, 3] - jd2)
+
+    def column_mask(self, colname):
+        """
+        A boolean mask of the entries which list the given column.
+        """
+        ids = self._columns.get(colname)
+        if not ids:
+            return np.zeros(self._size, dtype=bool)
+        return np.isin(self._ids[:self._size], ids)
+
+
 class TimeSeriesMetaData(object):
     """
     An object used to store metadata for TimeSeries objects that enables multiple
@@ -75,7 +197,8 @@ class TimeSeriesMetaData(object):
                 self.metadata.append(meta)
             elif isinstance(meta, list):
                 # Given a complex metadata list (of tuples)
-                self.metadata = copy.copy(meta)
+                # Setting the metadata copies the list.
+                self.metadata = meta
         else:
             # In the event no metadata dictionary is sent we default to something usable
             if isinstance(timerange, TimeRange) and isinstance(colnames, list):
@@ -86,6 +209,27 @@ class TimeSeriesMetaData(object):
             else:
                 raise ValueError("You cannot create a TimeSeriesMetaData object without specifying a TimeRange")
 
+    @property
+    def metadata(self):
+        """
+        The list of 3-tuples which each represent a source files metadata.
+        """
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata):
+        self._metadata = _MetaDataList(metadata)
+        self._index = None
+
+    def _get_index(self):
+        """
+        Return the index over the metadata entries, rebuilding it if the list
+        of entries has been changed.
+        """
+        if self._index is None or self._index.version != self._metadata.version:
+            self._index = _MetaDataIndex(self._metadata)
+        return self._index
+
     def __eq__(self, other):
         """
         Check two TimeSeriesMetaData objects are the same, they have the same
@@ -152,9 +296,10 @@ class TimeSeriesMetaData(object):
         # Check the types are correct.
         pos = 0
         if isinstance(timerange, TimeRange):
-            for i, meta in enumerate(self.metadata):
-                if timerange.start > meta[0].start:
-                    pos = i + 1
+            index = self._get_index()
+            before = np.flatnonzero(index.starts_minus(timerange.start) < 0)
+            if before.size:
+                pos = before[-1] + 1
         else:
             raise ValueError(
                 'Incorrect datatime or data for append to TimeSeriesMetaData.')
@@ -172,6 +317,7 @@ class TimeSeriesMetaData(object):
         # Insert into the given position
         if not duplicate:
             self.metadata.insert(pos, new_metadata)
+            index.insert(pos, new_metadata, self.metadata.version)
 
     def find_indices(self, time=None, colname=None, **kwargs):
         """
@@ -201,22 +347,21 @@ class TimeSeriesMetaData(object):
         dt = time
         if not dt:
             dt = False
-        elif isinstance(dt, str):
+        else:
             dt = parse_time(dt)
 
+        index = self._get_index()
+        matches = np.ones(len(self.metadata), dtype=bool)
+
         # Find all results with suitable timerange.
-        results_indices = []
-        for i, meta in enumerate(self.metadata):
-            if (not dt) or dt in meta[0]:
-                results_indices.append(i)
+        if dt:
+            matches &= (index.starts_minus(dt) <= 0) & (index.ends_minus(dt) >= 0)
 
         # Filter out only those with the correct column.
-        results = []
-        for i in results_indices:
-            if (colname in self.metadata[i][1]) or (not colname):
-                results.append(i)
+        if colname:
+            matches &= index.column_mask(colname)
 
-        return results
+        return np.flatnonzero(matches).tolist()
 
     def find(self, time=None, colname=None, **kwargs):
         """
@@ -312,25 +457,57 @@ class TimeSeriesMetaData(object):
         # Return a TimeSeriesMetaData object
         return TimeSeriesMetaData(meta=metadata)
 
-    def concatenate(self, tsmetadata2, **kwargs):
+    def concatenate(self, others, **kwargs):
         """
-        Combine the metadata from a TimeSeriesMetaData object with the current
-        TimeSeriesMetaData and return as a new TimeSeriesMetaData object.
+        Combine the metadata from one or more TimeSeriesMetaData objects with
+        the current TimeSeriesMetaData and return as a new TimeSeriesMetaData
+        object.
+
+        The result is the same as appending every entry of ``others`` in turn,
+        but the insertion points are found by bisecting on the start times and
+        the index over the result is only built once it is first used, so
+        merging the metadata of many files is not quadratic.
 
         Parameters
         ----------
-        tsmetadata2 : `~sunpy.timeseries.TimeSeriesMetaData`
-            The second TimeSeriesMetaData object.
+        others : `~sunpy.timeseries.TimeSeriesMetaData` or `list`
+            The TimeSeriesMetaData object, or list of objects, to combine with
+            this one.
         """
-        # Create a copy of the metadata
-        meta = TimeSeriesMetaData(copy.copy(self.metadata))
-
-        # Append each metadata entry from the second TimeSeriesMetaData object
-        # to the original TimeSeriesMetaData object.
-        for entry in tsmetadata2.metadata:
-            meta.append(entry[0], entry[1], entry[2])
-
-        return meta
+        if isinstance(others, TimeSeriesMetaData):
+            others = [others]
+
+        times = self._get_index().times
+        keys = list(zip(times[:, 0], times[:, 1]))
+
+        # Bisecting only finds the same position as append if the entries
+        # are in order, which they are unless the list was built out of order.
+        if any(later < earlier for earlier, later in zip(keys, keys[1:])):
+            meta = TimeSeriesMetaData(self.metadata)
+            for other in others:
+                for entry in other.metadata:
+                    meta.append(entry[0], entry[1], entry[2])
+            return meta
+
+        # Insert each metadata entry from the other TimeSeriesMetaData objects
+        # after all the entries that start before it, unless it duplicates the
+        # entry already at that position (same TR and colnames).
+        metadata = list(self.metadata)
+        for other in others:
+            for timerange, columns, entry_meta in other.metadata:
+                if not isinstance(timerange, TimeRange):
+                    raise ValueError(
+                        'Incorrect datatime or data for append to TimeSeriesMetaData.')
+                key = _jd(timerange.start)
+                pos = bisect.bisect_left(keys, key)
+                if pos < len(metadata):
+                    old_metadata = metadata[pos]
+                    if (timerange == old_metadata[0]) and (columns == old_metadata[1]):
+                        continue
+                metadata.insert(pos, (timerange, columns, MetaDict(entry_meta)))
+                keys.insert(pos, key)
+
+        return TimeSeriesMetaData(metadata)
 
     def update(self, dictionary, time=None, colname=None, row=None, overwrite=False, **kwargs):
         """
@@ -356,21 +533,27 @@ class TimeSeriesMetaData(object):
         # Find all matching metadata entries
         indices = self.find_indices(time=time, colname=colname, row=row, indices=True)
 
-        # Now update each matching entries
+        # Now update each matching entries, replacing rather than changing the
+        # MetaDicts as they may be shared with other TimeSeriesMetaData objects.
         for i in indices:
+            timerange, colnames, metadict = self.metadata[i]
+            metadict = MetaDict(metadict)
+
             # Seperate keys for new and current pairs
             old_keys = set(dictionary.keys())
-            old_keys.intersection_update(set(self.metadata[i][2].keys()))
+            old_keys.intersection_update(set(metadict.keys()))
             new_keys = set(dictionary.keys())
             new_keys.difference_update(old_keys)
 
             # Old keys only overwritten if allowed
-            for key in (self.metadata[i][2].keys()):
+            for key in (metadict.keys()):
                 if key in old_keys and overwrite:
-                    self.metadata[i][2][key] = dictionary[key]
+                    metadict[key] = dictionary[key]
             for key in dictionary:
                 if key in new_keys:
-                    self.metadata[i][2][key] = dictionary[key]
+                    metadict[key] = dictionary[key]
+
+            self.metadata[i] = (timerange, colnames, metadict)
 
     def _truncate(self, timerange):
         """Removes metadata entries outside of the new (truncated) TimeRange.
@@ -382,30 +565,36 @@ class TimeSeriesMetaData(object):
         timerange : `sunpy.time.TimeRange`
             Either a time range to truncate to.
         """
-        truncated = []
-        for metatuple in self.metadata:
-            # Get metadata time range parameters
-            start = metatuple[0].start
-            end   = metatuple[0].end
-            out_of_range = False
-
-            # Find truncations
-            if start < timerange.start and end > timerange.start:
-                # Truncate the start
-                start = timerange.start
-            elif start > timerange.end:
-                # Metadata time range starts after truncated data ends.
-                out_of_range = True
-            if end > timerange.end and start < timerange.end:
-                # Truncate the end
-                end = timerange.end
-            elif end < timerange.start:
-                # Metadata time range finishes before truncated data starts.
-                out_of_range = True
+        if not self.metadata:
+            return
+
+        index = self._get_index()
+        starts_before = index.starts_minus(timerange.start)
+        ends_before = index.ends_minus(timerange.start)
+        starts_after = index.starts_minus(timerange.end)
+        ends_after = index.ends_minus(timerange.end)
+
+        # Find truncations
+        # Truncate the start
+        truncate_start = (starts_before < 0) & (ends_before > 0)
+        # Metadata time range starts after truncated data ends.
+        out_of_range = ~truncate_start & (starts_after > 0)
+        # Truncate the end, once the start has been truncated
+        truncate_end = ((ends_after > 0) &
+                        np.where(truncate_start, timerange.start < timerange.end, starts_after < 0))
+        # Metadata time range finishes before truncated data starts.
+        out_of_range |= ~truncate_end & (ends_before < 0)
 
+        truncated = []
+        for i, metatuple in enumerate(self.metadata):
             # Add the values if applicable
-            if not out_of_range:
-                truncated.append((TimeRange(start, end), metatuple[1], metatuple[2]))
+            if out_of_range[i]:
+                continue
+            if truncate_start[i] or truncate_end[i]:
+                start = timerange.start if truncate_start[i] else metatuple[0].start
+                end = timerange.end if truncate_end[i] else metatuple[0].end
+                metatuple = (TimeRange(start, end), metatuple[1], metatuple[2])
+            truncated.append(metatuple)
 
         # Update the original list
         self.metadata = truncated
@@ -452,9 +641,11 @@ class TimeSeriesMetaData(object):
         """Returns the TimeRange of the entire time series meta data."""
         start = self.metadata[0][0].start
         end = self.metadata[0][0].end
-        for metatuple in self.metadata:
-            if end < metatuple[0].end:
-               end = metatuple[0].end
+        # Use the first of the latest ending entries
+        ends = self._get_index().ends_minus(end)
+        latest = np.argmax(ends)
+        if ends[latest] > 0:
+            end = self.metadata[latest][0].end
         return TimeRange(start, end)
 
     def _remove_columns(self, colnames):
@@ -469,14 +660,17 @@ class TimeSeriesMetaData(object):
         if isinstance(colnames, str):
             colnames = [ colnames ]
 
-        # Create a new list with all metadata entries without colnames
+        # Create a new list with all metadata entries without colnames, the
+        # entries may be shared with other TimeSeriesMetaData objects so
+        # changed entries are replaced rather than altered.
         reduced = []
         for metatuple in self.metadata:
             # Check each colname
-            for colname in colnames:
-                if colname in metatuple[1]:
-                    # Removed from the list.
-                    metatuple[1].remove(colname)
+            if any(colname in metatuple[1] for colname in colnames):
+                # Removed from the list.
+                metatuple = (metatuple[0],
+                             [column for column in metatuple[1] if column not in colnames],
+                             metatuple[2])
             # Add the column if it still has some columns listed
             if len(metatuple[1]) > 0:
                 reduced.append(metatuple)
@@ -484,8 +678,6 @@ class TimeSeriesMetaData(object):
         # Update the original list
         self.metadata = reduced
 
-
-
     def _rename_column(self, old, new):
         """
         Change the name of a column in all the metadata entries.
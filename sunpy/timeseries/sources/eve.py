@@ -3,7 +3,7 @@
 import os
 import codecs
 import numpy
-from datetime import datetime
+import pandas
 from collections import OrderedDict
 import matplotlib.pyplot as plt
 from pandas.io.parsers import read_csv
@@ -162,16 +162,16 @@ class EVESpWxTimeSeries(GenericTimeSeries):
         # Next line is YYYY DOY MM DD
         date_parts = line.split(" ")
 
-        year = int(date_parts[0])
-        month = int(date_parts[2])
-        day = int(date_parts[3])
+        date = numpy.datetime64('{:04d}-{:02d}-{:02d}'.format(
+            int(date_parts[0]), int(date_parts[2]), int(date_parts[3])), 'm')
 
-        def parser(x):
-            # Parse date column (HHMM)
-            return datetime(year, month, day, int(x[0:2]), int(x[2:4]))
+        data = read_csv(fp, sep=r"\s+", names=fields, index_col=0, header=None)
+
+        # Parse date column (HHMM) as minutes from the start of the day
+        hhmm = data.index.values.astype(int)
+        minutes = date + hhmm // 100 * 60 + hhmm % 100
+        data.index = pandas.DatetimeIndex(minutes.astype('datetime64[ns]'), name=fields[0])
 
-        data = read_csv(fp, sep=r"\s+", names=fields,
-                        index_col=0, date_parser=parser, header=None, engine='python')
         if is_missing_data:  # If missing data specified in header
             data[data == float(missing_data_val)] = numpy.nan
 
@@ -8,9 +8,9 @@ import pandas as pd
 import sunpy.io
 from sunpy.instr import fermi
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
+from sunpy.time.time import _offsets_to_datetime64
 from sunpy.util.metadata import MetaDict
 
-from astropy.time import Time
 from astropy import units as u
 
 __all__ = ['GBMSummaryTimeSeries']
@@ -117,9 +117,7 @@ class GBMSummaryTimeSeries(GenericTimeSeries):
         summary_counts = _bin_data_for_summary(energy_bins, count_data)
 
         # get the time information in datetime format with the correct MET adjustment
-        gbm_times = Time([fermi.met_to_utc(t) for t in count_data['time']])
-        gbm_times.precision = 9
-        gbm_times = gbm_times.isot.astype('datetime64')
+        gbm_times = _offsets_to_datetime64(fermi.met_to_utc(0), count_data['time'])
 
         column_labels = ['4-15 keV', '15-25 keV', '25-50 keV', '50-100 keV',
                          '100-300 keV', '300-800 keV', '800-2000 keV']
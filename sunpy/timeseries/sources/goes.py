@@ -11,10 +11,11 @@ from pandas import DataFrame
 from matplotlib import pyplot as plt
 
 from astropy import units as u
-from astropy.time import TimeDelta, Time
+from astropy.time import Time
 
 import sunpy.io
 from sunpy.time import TimeRange, parse_time, is_time_in_given_format
+from sunpy.time.time import _offsets_to_datetime64
 from sunpy.util.metadata import MetaDict
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 
@@ -175,8 +176,7 @@ class XRSTimeSeries(GenericTimeSeries):
         else:
             raise ValueError("Don't know how to parse this file")
 
-        times = start_time + TimeDelta(seconds_from_start*u.second)
-        times.precision = 9
+        times = _offsets_to_datetime64(start_time, seconds_from_start)
 
         # remove bad values as defined in header comments
         xrsb[xrsb == -99999] = np.nan
@@ -187,7 +187,7 @@ class XRSTimeSeries(GenericTimeSeries):
         newxrsb = xrsb.byteswap().newbyteorder()
 
         data = DataFrame({'xrsa': newxrsa, 'xrsb': newxrsb},
-                         index=times.isot.astype('datetime64'))
+                         index=times)
         data.sort_index(inplace=True)
 
         # Add the units
@@ -7,11 +7,11 @@ from matplotlib import pyplot as plt
 import pandas
 
 from astropy import units as u
-from astropy.time import Time, TimeDelta
 
 import sunpy.io
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.time import parse_time
+from sunpy.time.time import _offsets_to_datetime64
 from sunpy.util.metadata import MetaDict
 from sunpy import config
 
@@ -137,10 +137,10 @@ class LYRATimeSeries(GenericTimeSeries):
         # First column are times.  For level 2 data, the units are [s].
         # For level 3 data, the units are [min]
         if hdulist[1].header['TUNIT1'] == 's':
-            times = start + TimeDelta(fits_record.field(0)*u.second)
+            times = _offsets_to_datetime64(start, fits_record.field(0))
         elif hdulist[1].header['TUNIT1'] == 'MIN':
-            td = [int(n) for n in fits_record.field(0)]
-            times = start + TimeDelta(td*u.minute)
+            td = fits_record.field(0).astype(int)
+            times = _offsets_to_datetime64(start, td, u.minute)
         else:
             raise ValueError("Time unit in LYRA fits file not recognised.  "
                              "Value = {0}".format(hdulist[1].header['TUNIT1']))
@@ -156,8 +156,7 @@ class LYRATimeSeries(GenericTimeSeries):
                 table[col.name] = fits_record.field(i + 1)
 
         # Return the header and the data
-        times.precision = 9
-        data = pandas.DataFrame(table, index=times.isot.astype('datetime64'))
+        data = pandas.DataFrame(table, index=times)
         data.sort_index(inplace=True)
 
         # Add the units data
@@ -3,10 +3,9 @@
 from collections import OrderedDict
 from matplotlib import pyplot as plt
 from pandas.io.parsers import read_csv
-import numpy as np
+import pandas as pd
 
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
-from astropy.time import Time
 from sunpy.util.metadata import MetaDict
 
 from astropy import units as u
@@ -135,15 +134,9 @@ class NOAAIndicesTimeSeries(GenericTimeSeries):
                 line = fp.readline()
             fields = ('yyyy', 'mm', 'sunspot SWO', 'sunspot RI', 'sunspot ratio', 'sunspot SWO smooth',
                       'sunspot RI smooth', 'radio flux', 'radio flux smooth', 'geomagnetic ap', 'geomagnetic smooth')
-            data = read_csv(fp, delim_whitespace=True, names=fields,
-                            comment='#', dtype={'yyyy': np.str, 'mm': np.str})
+            data = read_csv(fp, delim_whitespace=True, names=fields, comment='#')
             data = data.dropna(how='any')
-            timeindex = Time.strptime([x + y for x, y in zip(data['yyyy'], data['mm'])], '%Y%m')
-            timeindex.precision = 9
-            data['time'] = timeindex.isot.astype('datetime64')
-            data = data.set_index('time')
-            data = data.drop('mm', 1)
-            data = data.drop('yyyy', 1)
+            data = _set_year_month_index(data)
 
             # Add the units data
             units = OrderedDict([('sunspot SWO', u.dimensionless_unscaled),
@@ -248,16 +241,9 @@ class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
             fields = ('yyyy', 'mm', 'sunspot', 'sunspot low', 'sunspot high',
                       'radio flux', 'radio flux low', 'radio flux high')
             data = read_csv(filepath, delim_whitespace=True, names=fields,
-                            comment='#', skiprows=2, dtype={'yyyy': np.str, 'mm': np.str})
+                            comment='#', skiprows=2)
             data = data.dropna(how='any')
-
-            timeindex = Time.strptime([x + y for x, y in zip(data['yyyy'], data['mm'])], '%Y%m')
-            timeindex.precision = 9
-            data['time'] = timeindex.isot.astype('datetime64')
-
-            data = data.set_index('time')
-            data = data.drop('mm', 1)
-            data = data.drop('yyyy', 1)
+            data = _set_year_month_index(data)
 
             # Add the units data
             units = OrderedDict([('sunspot', u.dimensionless_unscaled),
@@ -274,3 +260,15 @@ class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
         """Determines if header corresponds to an NOAA predict indices timeseries"""
         if kwargs.get('source', ''):
             return kwargs.get('source', '').lower().startswith(cls._source)
+
+
+def _set_year_month_index(data):
+    """
+    Replace the numeric year and month columns of the data with a time index
+    of the start of each month.
+    """
+    months = ((data['yyyy'].values.astype(int) - 1970) * 12 +
+              data['mm'].values.astype(int) - 1).astype('datetime64[M]')
+    data = data.drop(columns=['yyyy', 'mm'])
+    data.index = pd.DatetimeIndex(months.astype('datetime64[ns]'), name='time')
+    return data
@@ -7,19 +7,15 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 import astropy.units as u
-from astropy.time import TimeDelta
 
 import sunpy.io
 from sunpy import config
 from sunpy.time import parse_time
+from sunpy.time.time import _offsets_to_datetime64
 from sunpy.util.metadata import MetaDict
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 
 
-import astropy.units as u
-from astropy.time import TimeDelta
-
-
 TIME_FORMAT = config.get("general", "time_format")
 
 __all__ = ['NoRHTimeSeries']
@@ -113,9 +109,7 @@ class NoRHTimeSeries(GenericTimeSeries):
         cadence = np.float(header['CDELT1'])
         sec_array = np.linspace(0, length - 1, int(length / cadence))
 
-        norh_time = obs_start_time + TimeDelta(sec_array*u.second)
-        norh_time.precision = 9
-        norh_time = norh_time.isot.astype('datetime64')
+        norh_time = _offsets_to_datetime64(obs_start_time, sec_array)
 
         # Add the units data
         units = OrderedDict([('Correlation Coefficient', u.dimensionless_unscaled)])
@@ -4,6 +4,7 @@ from collections import OrderedDict
 import datetime
 import matplotlib.dates
 import matplotlib.pyplot as plt
+import numpy as np
 from pandas import DataFrame
 
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
@@ -115,8 +116,12 @@ class RHESSISummaryTimeSeries(GenericTimeSeries):
     def _parse_hdus(cls, hdulist):
         """Parses a RHESSI FITS HDU list form a FITS file."""
         header, d = rhessi.parse_observing_summary_hdulist(hdulist)
-        # The time of dict d is astropy Time. But dataframe can only take datetime
-        d['time'] = d['time'].datetime
+        # The time of dict d is astropy Time. But dataframe can only take datetime,
+        # which is built from the first time and the elapsed times as converting
+        # each time is slow.
+        times = d['time']
+        elapsed = np.round((times - times[0]).to_value(u.s) * 1e9).astype('timedelta64[ns]')
+        d['time'] = np.datetime64(times[0].datetime, 'ns') + elapsed
         header = MetaDict(OrderedDict(header))
         data = DataFrame(d['data'], columns=d['labels'], index=d['time'])
         # Add the units data
@@ -0,0 +1,58 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import sunpy.data.test
+import sunpy.timeseries
+from sunpy.timeseries.cache import TimeSeriesCache
+
+filepath = sunpy.data.test.rootdir
+eve_filepath = os.path.join(filepath, 'EVE_L0CS_DIODES_1m_truncated.txt')
+goes_filepath = os.path.join(filepath, 'go1520120601.fits.gz')
+noaa_ind_filepath = os.path.join(filepath, 'RecentIndices_truncated.txt')
+
+
+def _is_memmapped(ts):
+    values = ts.data._data.blocks[0].values
+    while not isinstance(values, np.memmap) and values.base is not None:
+        values = values.base
+    return isinstance(values, np.memmap)
+
+
+@pytest.mark.parametrize('path, source', [(eve_filepath, 'EVE'),
+                                          (goes_filepath, None),
+                                          (noaa_ind_filepath, 'NOAAIndices')])
+def test_cached_timeseries_match(tmpdir, path, source):
+    kwargs = {'source': source} if source else {}
+    uncached = sunpy.timeseries.TimeSeries(path, **kwargs)
+    first = sunpy.timeseries.TimeSeries(path, cache=str(tmpdir), **kwargs)
+    second = sunpy.timeseries.TimeSeries(path, cache=str(tmpdir), **kwargs)
+    assert uncached == first == second
+    assert len(tmpdir.listdir()) == 1
+
+
+def test_cached_data_is_memory_mapped(tmpdir):
+    cache = TimeSeriesCache(str(tmpdir))
+    sunpy.timeseries.TimeSeries(eve_filepath, source='EVE', cache=cache)
+    ts = sunpy.timeseries.TimeSeries(eve_filepath, source='EVE', cache=cache)
+    assert _is_memmapped(ts)
+    # Copy-on-write, changes don't reach the cache
+    ts.data.iloc[0, 0] = -1
+    ts = sunpy.timeseries.TimeSeries(eve_filepath, source='EVE', cache=cache)
+    assert ts.data.iloc[0, 0] != -1
+
+
+def test_cache_changed_file(tmpdir):
+    path = str(tmpdir.join('eve.txt'))
+    shutil.copy(eve_filepath, path)
+    cache = TimeSeriesCache(str(tmpdir.join('cache')))
+    sunpy.timeseries.TimeSeries(path, source='EVE', cache=cache)
+    assert cache.load(path, 'EVE') is not None
+    # A different source or a changed file are not found
+    assert cache.load(path, 'NOAAIndices') is None
+    os.utime(path, ns=(0, 0))
+    assert cache.load(path, 'EVE') is None
+    cache.clear()
+    assert not os.path.exists(cache.directory)
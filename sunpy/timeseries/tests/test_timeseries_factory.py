@@ -10,7 +10,7 @@ import glob
 import pytest
 import datetime
 import numpy as np
-from pandas import DataFrame
+from pandas import DataFrame, DatetimeIndex
 from collections import OrderedDict
 
 import sunpy.data.test
@@ -81,6 +81,54 @@ class TestTimeSeries(object):
         ts_from_glob = sunpy.timeseries.TimeSeries(os.path.join(filepath, "eve", "*"), source='EVE', concatenate=True)
         assert isinstance(ts_from_glob, sunpy.timeseries.sources.eve.EVESpWxTimeSeries)
 
+    def test_factory_parallel_same_source(self):
+        # Test parsing files in worker processes gives the same result
+        ts_serial = sunpy.timeseries.TimeSeries(a_list_of_many, source='EVE', concatenate=True)
+        ts_parallel = sunpy.timeseries.TimeSeries(a_list_of_many, source='EVE', concatenate=True,
+                                                  parallel=2)
+        assert ts_serial == ts_parallel
+
+    def test_factory_parallel_implicit_source(self):
+        # Test files read by sunpy.io are parsed by the matching source in the workers
+        files = [goes_filepath_com, lyra_filepath, fermi_gbm_filepath]
+        ts_serial = sunpy.timeseries.TimeSeries(files)
+        ts_parallel = sunpy.timeseries.TimeSeries(files, parallel=True)
+        assert [type(ts) for ts in ts_parallel] == [type(ts) for ts in ts_serial]
+        assert all(a == b for a, b in zip(ts_serial, ts_parallel))
+
+    @pytest.mark.parametrize('method', ['mean', 'sum', 'min', 'max', 'count'])
+    def test_factory_resample(self, method):
+        # Test resampling file by file matches resampling all the data at once
+        ts_full = sunpy.timeseries.TimeSeries(a_list_of_many, source='EVE', concatenate=True)
+        ts_resampled = sunpy.timeseries.TimeSeries.resample(a_list_of_many, source='EVE',
+                                                            cadence=1*u.h, method=method)
+        assert isinstance(ts_resampled, sunpy.timeseries.sources.eve.EVESpWxTimeSeries)
+        resampler = ts_full.data.resample('1h')
+        expected = resampler.sum(min_count=1) if method == 'sum' else getattr(resampler, method)()
+        expected = expected[resampler.size() > 0]
+        assert (ts_resampled.index == expected.index).all()
+        assert np.allclose(ts_resampled.data.values, expected.values.astype(float),
+                           equal_nan=True)
+        assert ts_resampled.meta.metas == ts_full.meta.metas
+        if method == 'count':
+            assert set(ts_resampled.units.values()) == {u.dimensionless_unscaled}
+        else:
+            assert ts_resampled.units == ts_full.units
+
+    def test_factory_resample_repeated_rows(self):
+        # Test rows repeated in consecutive files are counted once
+        ts_once = sunpy.timeseries.TimeSeries.resample(goes_filepath, cadence=10*u.min,
+                                                       method='count')
+        ts_twice = sunpy.timeseries.TimeSeries.resample([goes_filepath, goes_filepath],
+                                                        cadence=10*u.min, method='count')
+        assert ts_once == ts_twice
+
+    def test_factory_resample_invalid(self):
+        with pytest.raises(ValueError):
+            sunpy.timeseries.TimeSeries.resample(goes_filepath, cadence=1*u.min, method='median')
+        with pytest.raises(ValueError):
+            sunpy.timeseries.TimeSeries.resample(goes_filepath, cadence=0*u.min)
+
 #==============================================================================
 # Individual Implicit Source Tests
 #==============================================================================
@@ -123,6 +171,10 @@ class TestTimeSeries(object):
         #Test an EVE TimeSeries
         ts_eve = sunpy.timeseries.TimeSeries(eve_filepath, source='EVE')
         assert isinstance(ts_eve, sunpy.timeseries.sources.eve.EVESpWxTimeSeries)
+        # The HHMM column is combined with the date line of the file
+        assert ts_eve.data.index.name == 'HHMM'
+        assert (ts_eve.data.index == DatetimeIndex(
+            np.datetime64('2016-06-10T00:00') + np.arange(10) * np.timedelta64(1, 'm'))).all()
 
     def test_fermi_gbm(self):
         #Test a GBMSummary TimeSeries
@@ -158,6 +210,10 @@ class TestTimeSeries(object):
         #Test a NOAAPredictIndices TimeSeries
         ts_noaa_ind = sunpy.timeseries.TimeSeries(noaa_ind_filepath, source='NOAAIndices')
         assert isinstance(ts_noaa_ind, sunpy.timeseries.sources.noaa.NOAAIndicesTimeSeries)
+        # The year and month columns become the time index
+        assert 'yyyy' not in ts_noaa_ind.columns and 'mm' not in ts_noaa_ind.columns
+        assert (ts_noaa_ind.data.index.day == 1).all()
+        assert ts_noaa_ind.data.index.is_monotonic_increasing
 
     def test_noaa_pre(self):
         #Test a NOAAIndices TimeSeries
@@ -432,6 +432,55 @@ def test_extraction(eve_test_ts, extraction_test_ts):
     extracted_df = extracted_df.sort_index()
     assert_frame_equal(extraction_test_ts.data, extracted_df)
 
+def test_extraction_shares_metadata(eve_test_ts, extraction_test_ts):
+    # Removing the other columns from the extracted metadata leaves the original alone
+    assert len(eve_test_ts.meta.columns) == len(eve_test_ts.columns)
+    extraction_test_ts.meta.update({'new_key': 'new_value'})
+    assert 'new_key' not in eve_test_ts.meta.metadata[0][2]
+
+
+def test_truncation_of_sorted_data_is_not_copied(eve_test_ts, truncation_slice_test_ts_1):
+    assert np.shares_memory(truncation_slice_test_ts_1.data.values, eve_test_ts.data.values)
+
+
+def test_truncation_of_unsorted_data(eve_test_ts):
+    unsorted = eve_test_ts.__class__(eve_test_ts.data.iloc[::-1], eve_test_ts.meta,
+                                     eve_test_ts.units)
+    truncated = unsorted.truncate(eve_test_ts.time_range)
+    assert_frame_equal(truncated.data, eve_test_ts.data)
+
+
+#==============================================================================
+# Test TimeSeriesView
+#==============================================================================
+
+def test_view(eve_test_ts):
+    times = eve_test_ts.data.index
+    view = eve_test_ts.view(TimeRange(times[2], times[6]))
+    truncated = eve_test_ts.truncate(TimeRange(times[2], times[6]))
+    assert isinstance(view, sunpy.timeseries.TimeSeriesView)
+    assert len(view) == 5
+    assert np.shares_memory(view.data.values, eve_test_ts.data.values)
+    assert_frame_equal(view.data, truncated.data)
+    assert view.meta == truncated.meta
+    assert view.time_range == truncated.time_range
+    assert view.columns == truncated.columns
+    assert_quantity_allclose(view.quantity('CMLon'), truncated.quantity('CMLon'))
+
+
+def test_view_of_view(eve_test_ts):
+    view = eve_test_ts.view(2, 8).truncate(1, 3)
+    assert view.timeseries is eve_test_ts
+    assert_frame_equal(view.data, eve_test_ts.data.iloc[3:5])
+
+
+def test_view_to_timeseries(eve_test_ts):
+    times = eve_test_ts.data.index
+    copied = eve_test_ts.view(TimeRange(times[2], times[6])).to_timeseries()
+    assert copied == eve_test_ts.truncate(TimeRange(times[2], times[6]))
+    assert not np.shares_memory(copied.data.values, eve_test_ts.data.values)
+
+
 #==============================================================================
 # Test Concatenation Operations
 #==============================================================================
@@ -494,6 +543,31 @@ def test_concatenation_of_different_data(eve_test_ts, fermi_gbm_test_ts,
     assert_frame_equal(concatenation_different_data_test_ts.data, comined_df)
 
 
+def test_concatenation_of_many(eve_test_ts):
+    # Concatenating several slices at once matches concatenating them in turn
+    times = eve_test_ts.data.index
+    tr = [TimeRange(times[i], times[j]) for i, j in
+          ((0, 2), (3, 5), (6, 7), (8, len(times) - 1))]
+    slices = [eve_test_ts.truncate(t) for t in tr]
+    pairwise = slices[0]
+    for ts in slices[1:]:
+        pairwise = pairwise.concatenate(ts)
+    all_at_once = slices[0].concatenate(slices[1:])
+    assert_frame_equal(all_at_once.data, pairwise.data)
+    assert all_at_once.meta == pairwise.meta
+    assert all_at_once.units == pairwise.units
+    assert_frame_equal(all_at_once.data, eve_test_ts.data)
+
+
+def test_concatenation_drops_repeated_rows(eve_test_ts):
+    # Rows present in overlapping time series only appear once
+    times = eve_test_ts.data.index
+    first = eve_test_ts.truncate(TimeRange(times[0], times[6]))
+    second = eve_test_ts.truncate(TimeRange(times[3], times[-1]))
+    concatenated = first.concatenate([second])
+    assert_frame_equal(concatenated.data, eve_test_ts.data)
+
+
 def test_concatenation_different_data_error(eve_test_ts, fermi_gbm_test_ts):
     # Take two different data sources and concatenate but set with the same_source
     # kwarg as true, this should not concatenate.
@@ -153,6 +153,23 @@ def test_concatenate(basic_ascending_append_md, basic_4_md, complex_append_md):
     assert concatenated == complex_append_md
 
 
+def test_concatenate_many(basic_1_md, basic_2_md, basic_3_md, basic_4_md, complex_append_md):
+    # Concatenating a list gives the same result as appending in turn
+    concatenated = basic_1_md.concatenate([basic_3_md, basic_4_md, basic_2_md])
+    assert concatenated == complex_append_md
+    # Entries already present are not duplicated
+    assert concatenated.concatenate([basic_2_md, basic_4_md]) == complex_append_md
+
+
+def test_concatenate_out_of_order(basic_1_md, basic_2_md, basic_3_md, basic_4_md):
+    # Entries built out of order are merged as append would
+    unordered = TimeSeriesMetaData([basic_3_md.metadata[0], basic_1_md.metadata[0]])
+    appended = copy.deepcopy(unordered)
+    appended.append(*basic_4_md.metadata[0])
+    appended.append(*basic_2_md.metadata[0])
+    assert unordered.concatenate([basic_4_md, basic_2_md]) == appended
+
+
 #==============================================================================
 # Test TimeSeriesMetaData Truncation
 #==============================================================================
@@ -262,6 +279,39 @@ def test_find_both_filters(basic_2_md, basic_4_md, complex_append_md):
     assert complex_append_md.find(time='2010-01-02 20:59:57.468999', colname='md4_column1') == basic_4_md
 
 
+def test_find_boundaries(complex_append_md):
+    # Both ends of the time ranges are inclusive
+    assert complex_append_md.find_indices(time='2010-01-02 13:59:56.091999') == [0, 1]
+    assert complex_append_md.find_indices(time='2010-01-02 13:59:57.468999') == [1, 2]
+    assert complex_append_md.find_indices(time='2009-12-31') == []
+    assert complex_append_md.find_indices(colname='no_such_column') == []
+
+def test_find_after_append(basic_1_md, basic_2_md, basic_3_md, basic_4_md):
+    # Appending keeps the index up to date rather than rebuilding it
+    md = copy.deepcopy(basic_1_md)
+    md.append(*basic_3_md.metadata[0])
+    index = md._get_index()
+    md.append(*basic_4_md.metadata[0])
+    md.append(*basic_2_md.metadata[0])
+    assert md._get_index() is index
+    assert md.find_indices(colname='md4_column1') == [1]
+    assert md.find_indices(colname='column1') == [0, 2, 3]
+    assert md.find_indices(time='2010-01-02 20:59:57.468999') == [1, 2]
+
+def test_find_after_metadata_changed(basic_1_md, basic_2_md, complex_append_md):
+    # Lookups follow changes made directly to the list of entries
+    md = copy.deepcopy(complex_append_md)
+    assert md.find(colname='md4_column1').metadata[0][1] == ['md4_column1', 'md4_column2']
+    md.metadata = md.metadata[:1]
+    assert md.find(time='2010-01-02 20:59:57.468999').metadata == []
+    md.metadata.append(basic_2_md.metadata[0])
+    assert md.find(time='2010-01-02 20:59:57.468999') == basic_2_md
+    md._rename_column('column1', 'renamed')
+    assert md.find_indices(colname='renamed') == [0, 1]
+    md._remove_columns('renamed')
+    assert md.find_indices(colname='renamed') == []
+
+
 #==============================================================================
 # Test TimeSeriesMetaData get and update methods
 #==============================================================================
@@ -2,7 +2,9 @@ import os
 import copy
 import glob
 import warnings
+from functools import partial
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from urllib.request import urlopen
 
 import numpy as np
@@ -22,6 +24,7 @@ from sunpy.io.header import FileHeader
 from sunpy.util.config import get_and_create_download_dir
 from sunpy.io.file_tools import UnrecognizedFileTypeError, read_file
 from sunpy.util.metadata import MetaDict
+from sunpy.timeseries.cache import TimeSeriesCache
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.datatype_factory_base import (NoMatchError, MultipleMatchError,
                                               ValidationFunctionError, BasicRegistrationFactory)
@@ -47,7 +50,20 @@ class TimeSeriesFactory(BasicRegistrationFactory):
 
     concatenate : `bool`, optional, default:False
         If set, combine any resulting list of TimeSeries objects into a single
-        TimeSeries, using successive concatenate methods.
+        TimeSeries, using a single call to the concatenate method.
+
+    parallel : `bool` or `int`, optional, default:False
+        If set, read and parse the given files in a pool of worker processes,
+        one file per task. An integer sets the number of workers, otherwise
+        one is used per CPU. The time series from files are returned first, in
+        the order the files were given.
+
+    cache : `bool`, `str` or `~sunpy.timeseries.cache.TimeSeriesCache`, optional, default:False
+        If set, the data parsed from files is stored in an on-disk cache and
+        loaded, memory mapped, from the cache when the same unchanged file is
+        given again. A string gives the cache directory, otherwise the default
+        `~sunpy.timeseries.cache.get_default_cache_dir` is used. As with
+        ``parallel``, the time series from files are returned first.
 
     Examples
     --------
@@ -84,6 +100,17 @@ class TimeSeriesFactory(BasicRegistrationFactory):
 
     >>> my_timeseries = sunpy.timeseries.TimeSeries('local_dir/sub_dir')  # doctest: +SKIP
 
+    * Many files read in parallel
+
+    >>> my_timeseries = sunpy.timeseries.TimeSeries('local_dir/sub_dir', source='lyra',
+    ...                                             concatenate=True,
+    ...                                             parallel=True)  # doctest: +SKIP
+
+    * Files parsed once and then loaded from a cache
+
+    >>> my_timeseries = sunpy.timeseries.TimeSeries('local_dir/sub_dir', source='lyra',
+    ...                                             concatenate=True, cache=True)  # doctest: +SKIP
+
     * Some regex globs
 
     >>> my_timeseries = sunpy.timeseries.TimeSeries('eit_*.fits')  # doctest: +SKIP
@@ -259,6 +286,22 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         # Take source kwarg if defined
         source = kwargs.get('source', None)
 
+        # When parsing in parallel or with a cache the files are read later,
+        # one at a time, so all filepaths are passed on unread.
+        read_files = kwargs.pop('read_files', True)
+
+        def add_file(path):
+            # Sort a file into data-header pairs read by sunpy.io or filepaths
+            # to be read by a source.
+            if not read_files:
+                filepaths.append(path)
+                return
+            read, result = self._read_file(path, **kwargs)
+            if read:
+                data_header_pairs.append(result)
+            else:
+                filepaths.append(result)
+
         # Account for nested lists of items. Simply outputs a single list of
         # items, nested lists are expanded to element level.
         args = expand_list(args)
@@ -308,13 +351,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                   os.path.isfile(os.path.expanduser(arg))):
 
                 path = os.path.expanduser(arg)
-
-                read, result = self._read_file(path, **kwargs)
-
-                if read:
-                    data_header_pairs.append(result)
-                else:
-                    filepaths.append(result)
+                add_file(path)
 
             # Directory
             elif (isinstance(arg, str) and
@@ -323,13 +360,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                 path = os.path.expanduser(arg)
                 files = [os.path.join(path, elem) for elem in os.listdir(path)]
                 for afile in files:
-                    # returns a boolean telling us if it were read and either a
-                    # tuple or the original filepath for reading by a source
-                    read, result = self._read_file(afile, **kwargs)
-                    if read:
-                        data_header_pairs.append(result)
-                    else:
-                        filepaths.append(result)
+                    add_file(afile)
 
             # Glob
             elif (isinstance(arg, str) and '*' in arg):
@@ -337,14 +368,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                 files = glob.glob(os.path.expanduser(arg))
 
                 for afile in files:
-                    # data_header_unit_tuples += self._read_file(afile, **kwargs)
-                    # returns a boolean telling us if it were read and either a
-                    # tuple or the original filepath for reading by a source
-                    read, result = self._read_file(afile, **kwargs)
-                    if read:
-                        data_header_pairs.append(result)
-                    else:
-                        filepaths.append(result)
+                    add_file(afile)
 
             # Already a TimeSeries
             elif isinstance(arg, GenericTimeSeries):
@@ -392,12 +416,48 @@ class TimeSeriesFactory(BasicRegistrationFactory):
 
         # Hack to get around Python 2.x not backporting PEP 3102.
         silence_errors = kwargs.pop('silence_errors', False)
+        parallel = kwargs.pop('parallel', False)
+        cache = kwargs.pop('cache', False)
+        if cache and not isinstance(cache, TimeSeriesCache):
+            cache = TimeSeriesCache(None if cache is True else cache)
 
         (data_header_unit_tuples, data_header_pairs,
-         already_timeseries, filepaths) = self._parse_args(*args, **kwargs)
+         already_timeseries, filepaths) = self._parse_args(
+             *args, read_files=not (parallel or cache), **kwargs)
 
         new_timeseries = list()
 
+        if parallel or cache:
+            # Each file is read and parsed whole, in a worker if parallel, and
+            # the TimeSeries are built here in the order the files were given.
+            parse = partial(_parse_file, self, kwargs=kwargs, cache=cache or None)
+            if parallel:
+                max_workers = None if parallel is True else parallel
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+                results = [executor.submit(parse, filepath) for filepath in filepaths]
+            else:
+                executor = None
+                results = filepaths
+            try:
+                for result in results:
+                    try:
+                        if executor is None:
+                            kind, cls, (data, header, units) = parse(result)
+                        else:
+                            kind, cls, (data, header, units) = result.result()
+                        new_ts = self._from_parsed_file(kind, cls, (data, header, units),
+                                                        **kwargs)
+                    except (NoMatchError, MultipleMatchError, ValidationFunctionError):
+                        if not silence_errors:
+                            raise
+                        continue
+
+                    new_timeseries.append(new_ts)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            filepaths = []
+
         # The filepaths for unreadable files
         for filepath in filepaths:
             try:
@@ -415,31 +475,11 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         # data_header_unit_tuples by calling the _parse_hdus method
         # of the class.
         for pairs in data_header_pairs:
-            # Pairs may be x long where x is the number of HDUs in the file.
-            headers = [pair.header for pair in pairs]
-
-            types = []
-            for header in headers:
-                try:
-                    match = self._get_matching_widget(meta=header, **kwargs)
-                    if not match == GenericTimeSeries:
-                        types.append(match)
-                except (MultipleMatchError, NoMatchError):
-                    continue
-
-            if not types:
-                # If no specific classes have been found we can read the data
-                # if we only have one data header pair:
-                if len(pairs) == 1:
-                    already_timeseries.append(GenericTimeSeries(pairs[0].data,
-                                                                pairs[0].header))
-                else:
-                    raise NoMatchError("Input read by sunpy.io can not find a "
-                                       "matching class for reading multiple HDUs")
-            if len(set(types)) > 1:
-                raise MultipleMatchError("Multiple HDUs return multiple matching classes.")
-
-            cls = types[0]
+            cls = self._get_matching_hdus_widget(pairs, **kwargs)
+            if cls is GenericTimeSeries:
+                already_timeseries.append(GenericTimeSeries(pairs[0].data,
+                                                            pairs[0].header))
+                continue
 
             data_header_unit_tuples.append(cls._parse_hdus(pairs))
 
@@ -447,11 +487,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         # matches the arguments.  If it does, use that type
         for triple in data_header_unit_tuples:
             data, header, units = triple
-            # Make a MetaDict from various input types
-            meta = header
-            if isinstance(meta, astropy.io.fits.header.Header):
-                meta = sunpy.io.header.FileHeader(meta)
-            meta = MetaDict(meta)
+            meta = _to_metadict(header)
 
             try:
                 new_ts = self._check_registered_widgets(data=data, meta=meta,
@@ -470,9 +506,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         concatenate = kwargs.get('concatenate', False)
         if concatenate:
             # Merge all these timeseries into one.
-            full_timeseries = new_timeseries.pop(0)
-            for timeseries in new_timeseries:
-                full_timeseries = full_timeseries.concatenate(timeseries)
+            full_timeseries = new_timeseries[0].concatenate(new_timeseries[1:])
 
             new_timeseries = [full_timeseries]
 
@@ -485,6 +519,125 @@ class TimeSeriesFactory(BasicRegistrationFactory):
             return new_timeseries[0]
         return new_timeseries
 
+    def resample(self, *args, cadence, method='mean', **kwargs):
+        """
+        Read time series one at a time, aggregating each into fixed time bins,
+        and return the binned data of them all as a single TimeSeries.
+
+        Only the binned data and one file at a time are held in memory, so
+        long archives of high cadence data can be reduced to a low cadence
+        without reading them into one TimeSeries first. Files are read in the
+        order of their names, which for most archives is time order.
+
+        Parameters
+        ----------
+        args
+            Anything accepted by the `~sunpy.timeseries.TimeSeries` factory.
+        cadence : `~astropy.units.Quantity` or `~astropy.time.TimeDelta`
+            The width of the time bins, which start at whole multiples of the
+            cadence since 1970-01-01.
+        method : {'mean', 'sum', 'min', 'max', 'count'}, optional, default:'mean'
+            How the data in each bin are aggregated. Missing values are
+            ignored and ``'count'`` gives the number of values in each bin.
+        silence_errors : `bool`, optional
+            If set, ignore files which cause an exception.
+        cache : `bool`, `str` or `~sunpy.timeseries.cache.TimeSeriesCache`, optional
+            As for the `~sunpy.timeseries.TimeSeries` factory.
+
+        Returns
+        -------
+        `~sunpy.timeseries.GenericTimeSeries`
+            The aggregated numeric columns, indexed by the start of each bin
+            containing data, with the metadata of all the time series. This
+            is of the source class if all the time series are from one source.
+
+        Notes
+        -----
+        Rows repeated in consecutive time series, such as where files
+        overlap, are only counted once.
+
+        Examples
+        --------
+        >>> import astropy.units as u
+        >>> import sunpy.timeseries
+        >>> goes = sunpy.timeseries.TimeSeries.resample('goes/*.fits', source='XRS',
+        ...                                             cadence=1*u.min,
+        ...                                             method='max')  # doctest: +SKIP
+        """
+        if method not in _RESAMPLE_METHODS:
+            raise ValueError("method must be one of {}".format(', '.join(_RESAMPLE_METHODS)))
+        bin_width = int(round(cadence.to(u.ns).value))
+        if bin_width <= 0:
+            raise ValueError("cadence must be positive")
+
+        silence_errors = kwargs.pop('silence_errors', False)
+        kwargs.pop('concatenate', None)
+        kwargs.pop('parallel', None)
+        cache = kwargs.pop('cache', False)
+        if cache and not isinstance(cache, TimeSeriesCache):
+            cache = TimeSeriesCache(None if cache is True else cache)
+
+        (data_header_unit_tuples, _,
+         already_timeseries, filepaths) = self._parse_args(*args, read_files=False, **kwargs)
+
+        def all_timeseries():
+            for filepath in sorted(filepaths):
+                try:
+                    yield self._from_parsed_file(*_parse_file(self, filepath, kwargs,
+                                                              cache=cache or None),
+                                                 **kwargs)
+                except (NoMatchError, MultipleMatchError, ValidationFunctionError):
+                    if not silence_errors:
+                        raise
+            for data, header, units in data_header_unit_tuples:
+                yield self._check_registered_widgets(data=data, meta=_to_metadict(header),
+                                                     units=units, **kwargs)
+            yield from already_timeseries
+
+        partials = []
+        metas = []
+        units = OrderedDict()
+        classes = set()
+        previous = None
+        for timeseries in all_timeseries():
+            metas.append(timeseries.meta)
+            units.update(timeseries.units)
+            classes.add(timeseries.__class__)
+            data = timeseries.data.select_dtypes(include=['number', 'bool'])
+            if previous is not None:
+                data = _drop_repeated_rows(previous, data)
+                partials.append(_aggregate(previous, bin_width, method))
+            previous = data
+        if previous is None:
+            raise NoMatchError("No time series found to resample.")
+        partials.append(_aggregate(previous, bin_width, method))
+
+        data = _combine_aggregates(partials, method)
+        data.index = pd.DatetimeIndex(data.index.values.astype('datetime64[ns]'))
+        if method == 'count':
+            units = OrderedDict((column, u.dimensionless_unscaled) for column in data.columns)
+
+        meta = metas[0].concatenate(metas[1:])
+        cls = classes.pop() if len(classes) == 1 else GenericTimeSeries
+        timeseries = cls(data, meta, units)
+        # The bins are labelled by their start so the metadata, which covers
+        # the data in the bins, isn't truncated to the index.
+        timeseries.meta._remove_columns(list(set(meta.columns) - set(timeseries.columns)))
+        timeseries._sanitize_units()
+        return timeseries
+
+    def _from_parsed_file(self, kind, cls, triple, **kwargs):
+        """
+        Make a TimeSeries from the output of `_parse_file`.
+        """
+        data, header, units = triple
+        if kind == 'hdus':
+            return self._check_registered_widgets(data=data, meta=_to_metadict(header),
+                                                  units=units, **kwargs)
+        elif kind == 'generic':
+            return cls(data, header)
+        return cls(data, header, units, **kwargs)
+
     def _get_matching_widget(self, **kwargs):
         candidate_widget_types = list()
 
@@ -508,6 +661,37 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         # Only one suitable source class is found
         return candidate_widget_types[0]
 
+    def _get_matching_hdus_widget(self, pairs, **kwargs):
+        """
+        Find the source class which can parse the HDUs read from one file.
+        `~sunpy.timeseries.GenericTimeSeries` is returned if no source matches
+        a file with a single HDU.
+        """
+        # Pairs may be x long where x is the number of HDUs in the file.
+        headers = [pair.header for pair in pairs]
+
+        types = []
+        for header in headers:
+            try:
+                match = self._get_matching_widget(meta=header, **kwargs)
+                if not match == GenericTimeSeries:
+                    types.append(match)
+            except (MultipleMatchError, NoMatchError):
+                continue
+
+        if not types:
+            # If no specific classes have been found we can read the data
+            # if we only have one data header pair:
+            if len(pairs) == 1:
+                return GenericTimeSeries
+            else:
+                raise NoMatchError("Input read by sunpy.io can not find a "
+                                   "matching class for reading multiple HDUs")
+        if len(set(types)) > 1:
+            raise MultipleMatchError("Multiple HDUs return multiple matching classes.")
+
+        return types[0]
+
     def _check_registered_widgets(self, **kwargs):
         """
         Checks the (instrument) source/s that are compatible with this given
@@ -531,6 +715,107 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         return WidgetType(data, meta, units, **kwargs)
 
 
+def _to_metadict(header):
+    """
+    Make a MetaDict from the various input header types.
+    """
+    if isinstance(header, astropy.io.fits.header.Header):
+        header = sunpy.io.header.FileHeader(header)
+    return MetaDict(header)
+
+
+def _parse_file(factory, filepath, kwargs, cache=None):
+    """
+    Read and parse a single file, as done when the factory is called with
+    ``parallel`` or ``cache``.
+
+    Returns
+    -------
+    kind : `str`
+        ``'hdus'`` if the file was read by sunpy.io and parsed by a source,
+        ``'generic'`` if it was read by sunpy.io but matched no source and
+        ``'file'`` if it was parsed by the source's ``_parse_file``.
+    cls : `type`
+        The TimeSeries class matching the file.
+    triple : `tuple`
+        The (data, header, units) parsed from the file.
+    """
+    source = kwargs.get('source')
+    if cache is not None:
+        parsed = cache.load(filepath, source)
+        if parsed is not None:
+            return parsed
+
+    read, result = factory._read_file(filepath, **kwargs)
+    if read:
+        cls = factory._get_matching_hdus_widget(result, **kwargs)
+        if cls is GenericTimeSeries:
+            parsed = 'generic', cls, (result[0].data, result[0].header, None)
+        else:
+            parsed = 'hdus', cls, cls._parse_hdus(result)
+    else:
+        WidgetType = factory._get_matching_widget(filepath=filepath, **kwargs)
+        parsed = 'file', WidgetType, WidgetType._parse_file(filepath)
+
+    if cache is not None:
+        cache.save(filepath, parsed, source)
+    return parsed
+
+
+_RESAMPLE_METHODS = ('mean', 'sum', 'min', 'max', 'count')
+
+
+def _drop_repeated_rows(previous, data):
+    """
+    Drop the rows of ``data`` with the same time and values as a row of the
+    preceding ``previous`` data.
+    """
+    if data.empty or previous.empty:
+        return data
+    overlap = previous[previous.index >= data.index.min()]
+    candidates = data.index <= previous.index.max()
+    if overlap.empty or not candidates.any():
+        return data
+
+    both = pd.concat([overlap, data[candidates]], sort=False)
+    rows = both.reset_index(drop=True)
+    rows.insert(0, '__time__', both.index, allow_duplicates=True)
+    repeated = np.zeros(len(data), dtype=bool)
+    repeated[candidates] = rows.duplicated().values[len(overlap):]
+    return data[~repeated]
+
+
+def _aggregate(data, bin_width, method):
+    """
+    Aggregate data into bins ``bin_width`` nanoseconds wide, labelled by the
+    start of the bin in nanoseconds since 1970. The mean is aggregated as the
+    sum and the count, so aggregates can be combined.
+    """
+    bins = data.index.values.astype('datetime64[ns]').view(np.int64) // bin_width * bin_width
+    grouped = data.groupby(bins)
+    if method == 'mean':
+        return grouped.sum(), grouped.count()
+    elif method == 'sum':
+        return grouped.sum(min_count=1)
+    return getattr(grouped, method)()
+
+
+def _combine_aggregates(partials, method):
+    """
+    Combine the aggregates from `_aggregate` into one DataFrame.
+    """
+    if method == 'mean':
+        sums = pd.concat([partial[0] for partial in partials], sort=False)
+        counts = pd.concat([partial[1] for partial in partials], sort=False)
+        return sums.groupby(level=0).sum() / counts.groupby(level=0).sum()
+    combined = pd.concat(partials, sort=False).groupby(level=0)
+    if method == 'count':
+        return combined.sum().astype(np.int64)
+    elif method == 'sum':
+        return combined.sum(min_count=1)
+    return getattr(combined, method)()
+
+
 def _is_url(arg):
     try:
         urlopen(arg)
@@ -140,10 +140,23 @@ class GenericTimeSeries:
         object
         """
         if len(self.data)>0:
-            return TimeRange(self.data.index.min(), self.data.index.max())
+            index = self.data.index
+            if index.is_monotonic_increasing:
+                return TimeRange(index[0], index[-1])
+            return TimeRange(index.min(), index.max())
         else:
             return None
 
+    def _sorted_data(self):
+        """
+        The data in ascending chronological order. Pandas caches whether an
+        index is sorted, so data which is already sorted is returned without
+        being copied.
+        """
+        if self.data.index.is_monotonic_increasing:
+            return self.data
+        return self.data.sort_index()
+
 # #### Data Access, Selection and Organisation Methods #### #
 
     def quantity(self, colname, **kwargs):
@@ -247,37 +260,55 @@ class GenericTimeSeries:
         newts : `~sunpy.timeseries.TimeSeries`
             A new time series with only the selected times.
         """
-        # Evaluate inputs
-        # If given strings, then use to create a sunpy.time.timerange.TimeRange
-        # for the SunPy text date parser.
-        if isinstance(a, str) and isinstance(b, str):
-            a = TimeRange(a, b)
-        if isinstance(a, TimeRange):
-            # If we have a TimeRange, extract the values
-            start = a.start.datetime
-            end   = a.end.datetime
-        else:
-            # Otherwise we already have the values
-            start = a
-            end = b
+        start, end = _truncation_bounds(a, b)
 
         # If an interval integer was given then use in truncation.
-        truncated_data = self.data.sort_index()[start:end:int]
+        # Slicing data which is already sorted doesn't copy it.
+        truncated_data = self._sorted_data()[start:end:int]
+        if not truncated_data.index.is_monotonic_increasing:
+            truncated_data = truncated_data.sort_index()
 
         # Truncate the metadata
         # Check there is data still
         truncated_meta = TimeSeriesMetaData([])
         if len(truncated_data) > 0:
-            tr = TimeRange(truncated_data.index.min(), truncated_data.index.max())
-            truncated_meta = TimeSeriesMetaData(copy.deepcopy(self.meta.metadata))
+            tr = TimeRange(truncated_data.index[0], truncated_data.index[-1])
+            # The metadata entries are shared, TimeSeriesMetaData replaces
+            # rather than changes them.
+            truncated_meta = TimeSeriesMetaData(copy.copy(self.meta.metadata))
             truncated_meta._truncate(tr)
 
         # Build similar TimeSeries object and sanatise metadata and units.
-        object = self.__class__(truncated_data.sort_index(), truncated_meta, copy.copy(self.units))
+        object = self.__class__(truncated_data, truncated_meta, copy.copy(self.units))
         object._sanitize_metadata()
         object._sanitize_units()
         return object
 
+    def view(self, a=None, b=None, int=None):
+        """Returns a read-only view of part of the TimeSeries object. Unlike
+        `truncate` this doesn't copy sorted data or build new metadata until it
+        is needed, so is suited to moving a window along a long time series.
+
+        Parameters
+        ----------
+        a : `sunpy.time.TimeRange`, `str` or `int`, optional
+            Either a time range to view, or a start time in some format
+            recognised by pandas, or a index integer.
+
+        b : `str` or `int`, optional
+            If specified, the end time of the time range in some format
+            recognised by pandas, or a index integer.
+
+        int : `int`, optional
+            If specified, the integer indicating the slicing intervals.
+
+        Returns
+        -------
+        view : `~sunpy.timeseries.TimeSeriesView`
+            A view of the selected times.
+        """
+        return TimeSeriesView(self, a, b, int)
+
     def extract(self, column_name):
         """Returns a new time series with the chosen column.
 
@@ -298,26 +329,39 @@ class GenericTimeSeries:
         else:
             return GenericTimeSeries(self.data[column_name], TimeSeriesMetaData(self.meta.metadata.copy()))
         """
-        # Extract column and remove empty rows
-        data = self.data[[column_name]].dropna()
+        # Extract column and remove empty rows, a single unique column is
+        # sliced so the data is only copied if there are rows to remove.
+        column = self.data.columns.get_loc(column_name)
+        if isinstance(column, int):
+            data = self.data.iloc[:, column:column + 1]
+        else:
+            data = self.data[[column_name]]
+        if data.isnull().values.any():
+            data = data.dropna()
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
 
         # Build generic TimeSeries object and sanatise metadata and units.
-        object = GenericTimeSeries(data.sort_index(),
+        object = GenericTimeSeries(data,
                                    TimeSeriesMetaData(copy.copy(self.meta.metadata)),
                                    copy.copy(self.units))
         object._sanitize_metadata()
         object._sanitize_units()
         return object
 
-    def concatenate(self, otherts, **kwargs):
-        """Concatenate with another TimeSeries. This function will check and
-        remove any duplicate times. It will keep the column values from the
-        original time series to which the new time series is being added.
+    def concatenate(self, others, **kwargs):
+        """Concatenate with one or more other TimeSeries. This function will
+        check and remove any rows which are repeated, with identical times and
+        values, in more than one of the time series.
+
+        All the data is combined in a single `pandas.concat` and the metadata
+        in a single merge, so concatenating many time series at once is much
+        faster than concatenating them one at a time.
 
         Parameters
         ----------
-        otherts : `~sunpy.timeseries.TimeSeries`
-            Another time series.
+        others : `~sunpy.timeseries.TimeSeries` or `list`
+            Another time series, or a list of time series.
 
         same_source : `bool` Optional
             Set to true to check if the sources of the time series match.
@@ -326,31 +370,38 @@ class GenericTimeSeries:
         -------
         newts : `~sunpy.timeseries.TimeSeries`
             A new time series.
-
-        Debate: decide if we want to be able to concatenate multiple time series
-        at once.
         """
+        if isinstance(others, GenericTimeSeries):
+            others = [others]
 
         # check to see if nothing needs to be done
-        if self == otherts:
+        others = [otherts for otherts in others if otherts != self]
+        if not others:
             return self
 
         # Check the sources match if specified.
-        same_source = kwargs.get('same_source', False)
-        if same_source and not (isinstance(otherts, self.__class__)):
+        same_source = kwargs.pop('same_source', False)
+        if same_source and not all(isinstance(otherts, self.__class__) for otherts in others):
             raise TypeError("TimeSeries classes must match if specified.")
 
         # Concatenate the metadata and data
-        meta = self.meta.concatenate(otherts.meta)
-        data = pd.concat([self.data.copy(), otherts.data], **kwargs)
+        meta = self.meta.concatenate([otherts.meta for otherts in others])
+        data = pd.concat([self.data] + [otherts.data for otherts in others], **kwargs)
+
+        # Drop rows repeated in more than one time series (e.g. overlapping files).
+        if not data.index.is_unique:
+            rows = data.reset_index(drop=True)
+            rows.insert(0, '__time__', data.index, allow_duplicates=True)
+            data = data[~rows.duplicated().values]
 
         # Add all the new units to the dictionary.
         units = OrderedDict()
         units.update(self.units)
-        units.update(otherts.units)
+        for otherts in others:
+            units.update(otherts.units)
 
         # If sources match then build similar TimeSeries.
-        if self.__class__ == otherts.__class__:
+        if all(self.__class__ == otherts.__class__ for otherts in others):
             object = self.__class__(data.sort_index(), meta, units)
         else:
             # Build generic time series if the sources don't match.
@@ -616,3 +667,137 @@ class GenericTimeSeries:
     def _parse_file(cls, filepath):
         """Parses a file - to be implemented in any subclass that may use files"""
         return NotImplemented
+
+
+class TimeSeriesView:
+    """
+    A read-only window onto part of a TimeSeries.
+
+    The view slices the (sorted) data of the TimeSeries without copying it and
+    only truncates the metadata when it is first used, so views are cheap to
+    make when scrolling through a long time series. The data is shared with
+    the original TimeSeries and must not be modified, use `to_timeseries` to
+    get an independent TimeSeries.
+
+    Parameters
+    ----------
+    timeseries : `~sunpy.timeseries.GenericTimeSeries` or `~sunpy.timeseries.TimeSeriesView`
+        The time series to view. Viewing a view gives a window onto the same
+        underlying time series.
+    a, b, int
+        The start, end and slicing interval, as for
+        `~sunpy.timeseries.GenericTimeSeries.truncate`.
+
+    Attributes
+    ----------
+    timeseries : `~sunpy.timeseries.GenericTimeSeries`
+        The time series being viewed.
+    data : `~pandas.DataFrame`
+        The viewed rows of the time series data.
+    """
+
+    def __init__(self, timeseries, a=None, b=None, int=None):
+        if isinstance(timeseries, TimeSeriesView):
+            data = timeseries.data
+            timeseries = timeseries.timeseries
+        else:
+            data = timeseries._sorted_data()
+
+        start, end = _truncation_bounds(a, b)
+        self.timeseries = timeseries
+        self.data = data[start:end:int]
+        self._meta = None
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def source(self):
+        """The source of the viewed time series."""
+        return self.timeseries.source
+
+    @property
+    def units(self):
+        """The units of the viewed time series."""
+        return self.timeseries.units
+
+    @property
+    def columns(self):
+        """A list of all the names of the columns in the data."""
+        return list(self.data.columns.values)
+
+    @property
+    def index(self):
+        """The time index of the data."""
+        return self.data.index
+
+    time_range = GenericTimeSeries.time_range
+    quantity = GenericTimeSeries.quantity
+
+    @property
+    def meta(self):
+        """
+        The metadata of the viewed time series truncated to the view, sharing
+        the entries of the original where possible.
+        """
+        if self._meta is None:
+            meta = TimeSeriesMetaData([])
+            if len(self.data) > 0:
+                meta = TimeSeriesMetaData(copy.copy(self.timeseries.meta.metadata))
+                meta._truncate(self.time_range)
+            self._meta = meta
+        return self._meta
+
+    def truncate(self, a, b=None, int=None):
+        """Returns a view of part of this view, see
+        `~sunpy.timeseries.GenericTimeSeries.truncate` for the parameters."""
+        return TimeSeriesView(self, a, b, int)
+
+    view = truncate
+
+    def to_timeseries(self):
+        """
+        Return a new TimeSeries, of the same type as the viewed time series,
+        holding a copy of the viewed data.
+        """
+        object = self._as_timeseries(self.data.copy())
+        object._sanitize_units()
+        return object
+
+    def _as_timeseries(self, data=None):
+        """
+        Wrap the view in a TimeSeries of the viewed type, sharing the data.
+        """
+        data = self.data if data is None else data
+        return self.timeseries.__class__(data, TimeSeriesMetaData(copy.copy(self.meta.metadata)),
+                                         copy.copy(self.units))
+
+    def plot(self, axes=None, **plot_args):
+        """Plot the viewed data, as the viewed time series would be plotted."""
+        return self._as_timeseries().plot(axes=axes, **plot_args)
+
+    def peek(self, **kwargs):
+        """Displays the viewed data in a new figure, as the viewed time series
+        would be displayed."""
+        return self._as_timeseries().peek(**kwargs)
+
+    def __repr__(self):
+        return '<{0} of {1} rows of {2}>'.format(
+            self.__class__.__name__, len(self), self.timeseries.__class__.__name__)
+
+
+def _truncation_bounds(a, b):
+    """
+    Evaluate the start and end given to truncate, returning values which can be
+    used to slice the data.
+    """
+    # Evaluate inputs
+    # If given strings, then use to create a sunpy.time.timerange.TimeRange
+    # for the SunPy text date parser.
+    if isinstance(a, str) and isinstance(b, str):
+        a = TimeRange(a, b)
+    if isinstance(a, TimeRange):
+        # If we have a TimeRange, extract the values
+        return a.start.datetime, a.end.datetime
+    # Otherwise we already have the values
+    return a, b
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import abc
+import time
+from collections import deque
 from functools import partial
 
 import numpy as np
@@ -60,12 +62,25 @@ class BaseFuncAnimator:
     button_func: list
         List of functions to map to the buttons
 
+    blit: bool
+        Redraw only the image and the sliders when a slider changes, on top
+        of a cached copy of the rest of the figure. Changes the slider
+        functions make to other artists are shown on the next full redraw.
+
+    max_fps: float
+        Maximum number of slider updates per second, slider changes arriving
+        faster than this are dropped except for the latest one.
+
+    fps_callback: callable
+        Called with the current `frame_rate` after each slider update.
+
     Extra keywords are passed to imshow.
     """
 
     def __init__(self, data, slider_functions, slider_ranges, fig=None,
                  interval=200, colorbar=False, button_func=None, button_labels=None,
-                 start_image_func=None, **kwargs):
+                 start_image_func=None, blit=False, max_fps=None, fps_callback=None,
+                 **kwargs):
 
         # Allow the user to specify the button func:
         self.button_func = button_func if button_func else []
@@ -80,6 +95,13 @@ class BaseFuncAnimator:
         self.interval = interval
         self.if_colorbar = colorbar
         self.imshow_kwargs = kwargs
+        self.blit = blit
+        self.max_fps = max_fps
+        self.fps_callback = fps_callback
+        self._background = None
+        self._frame_times = deque(maxlen=20)
+        self._pending_update = None
+        self._throttle_timer = None
 
         if len(slider_functions) != len(slider_ranges):
             raise ValueError("You must specify the same number of functions "
@@ -108,6 +130,8 @@ class BaseFuncAnimator:
 
         # Connect fig events
         self._connect_fig_events()
+        if self.blit:
+            self._setup_blit()
 
     def label_slider(self, i, label):
         """
@@ -122,6 +146,16 @@ class BaseFuncAnimator:
         """
         self.sliders[i]._slider.label.set_text(label)
 
+    @property
+    def frame_rate(self):
+        """
+        The number of slider updates per second over the last 20 updates.
+        """
+        if len(self._frame_times) < 2:
+            return 0.
+        elapsed = self._frame_times[-1] - self._frame_times[0]
+        return (len(self._frame_times) - 1) / elapsed if elapsed > 0 else float('inf')
+
     def get_animation(self, axes=None, slider=0, startframe=0, endframe=None,
                       stepframe=1, **kwargs):
         """
@@ -190,6 +224,43 @@ class BaseFuncAnimator:
     def _add_colorbar(self, im):
         self.colorbar = plt.colorbar(im, self.cax)
 
+# =============================================================================
+#   Blitting
+# =============================================================================
+    def _animated_artists(self):
+        # The spines are drawn over the image
+        artists = [self.im] + list(self.im.axes.spines.values())
+        for ax in self.sliders:
+            artists += [getattr(ax._slider, name)
+                        for name in ('poly', 'vline', '_handle', 'valtext')
+                        if hasattr(ax._slider, name)]
+        return artists
+
+    def _setup_blit(self):
+        for artist in self._animated_artists():
+            artist.set_animated(True)
+        for ax in self.sliders:
+            ax._slider.drawon = False
+        # Every full draw, e.g. after a resize, refreshes the background
+        self.fig.canvas.mpl_connect('draw_event', self._cache_background)
+
+    def _cache_background(self, event):
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated_artists():
+            artist.axes.draw_artist(artist)
+
+    def _blit_draw(self):
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+            canvas.blit(self.fig.bbox)
+
 # =============================================================================
 #   Figure event callback functions
 # =============================================================================
@@ -331,7 +402,36 @@ class BaseFuncAnimator:
 #   Widget callbacks
 # =============================================================================
     def _slider_changed(self, val, slider):
+        if self.max_fps and self._frame_times:
+            wait = self._frame_times[-1] + 1. / self.max_fps - time.perf_counter()
+            if wait > 0:
+                self._pending_update = (val, slider)
+                if self._throttle_timer is None:
+                    self._throttle_timer = self.fig.canvas.new_timer(interval=int(wait * 1000) + 1)
+                    self._throttle_timer.single_shot = True
+                    self._throttle_timer.add_callback(self._update_pending)
+                    self._throttle_timer.start()
+                return
+        self._update_frame(val, slider)
+
+    def _update_pending(self):
+        self._throttle_timer = None
+        if self._pending_update is not None:
+            val, slider = self._pending_update
+            self._pending_update = None
+            self._update_frame(val, slider)
+            # The slider only asked for a redraw when it changed, before the
+            # frame was updated, so one is needed now unless blitting.
+            if not self.blit:
+                self.fig.canvas.draw_idle()
+
+    def _update_frame(self, val, slider):
         self.slider_functions[slider.slider_ind](val, self.im, slider)
+        if self.blit:
+            self._blit_draw()
+        self._frame_times.append(time.perf_counter())
+        if self.fps_callback is not None:
+            self.fps_callback(self.frame_rate)
 
     def _click_slider_button(self, event, button, slider):
         self._set_active_slider(slider.slider_ind)
@@ -363,7 +463,8 @@ class BaseFuncAnimator:
             s.set_val(s.valmin)
         else:
             s.set_val(s.val+1)
-        self.fig.canvas.draw()
+        if not self.blit:
+            self.fig.canvas.draw()
 
     def _previous(self, slider):
         s = slider
@@ -371,7 +472,8 @@ class BaseFuncAnimator:
             s.set_val(s.valmax)
         else:
             s.set_val(s.val-1)
-        self.fig.canvas.draw()
+        if not self.blit:
+            self.fig.canvas.draw()
 
 
 class ArrayAnimator(BaseFuncAnimator, metaclass=abc.ABCMeta):
@@ -422,6 +524,15 @@ class ArrayAnimator(BaseFuncAnimator, metaclass=abc.ABCMeta):
     button_func: list
         List of functions to map to the buttons
 
+    blit: bool
+        Redraw only the image and the sliders when a slider changes.
+
+    max_fps: float
+        Maximum number of slider updates per second.
+
+    fps_callback: callable
+        Called with the current `frame_rate` after each slider update.
+
     """
 
     def __init__(self, data, image_axes=[-2, -1], axis_ranges=None, **kwargs):
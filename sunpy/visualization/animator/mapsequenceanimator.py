@@ -1,7 +1,15 @@
 # -*- coding: utf-8 -*-
 
 from copy import deepcopy
+from threading import RLock, Thread
+from collections import OrderedDict, deque
+from concurrent.futures import Future
 
+import numpy as np
+
+import astropy.units as u
+
+from sunpy.image.rescale import resample as sunpy_image_resample
 from sunpy.visualization import animator as imageanimator
 from sunpy.visualization.wcsaxes_compat import _FORCE_NO_WCSAXES
 from sunpy.visualization import wcsaxes_compat, axis_labels_from_ctype
@@ -9,6 +17,114 @@ from sunpy.visualization import wcsaxes_compat, axis_labels_from_ctype
 __all__ = ['MapSequenceAnimator']
 
 
+class _MapFrameCache(object):
+    """
+    A least recently used cache of the image data and normalisation of the
+    frames of an animation of a sequence of maps.
+
+    Frames are computed when first used, and the frames after the current
+    one can be computed ahead in a background thread, which exits once there
+    are no more frames to compute.
+
+    Parameters
+    ----------
+    maps : `list` of `~sunpy.map.GenericMap`
+        The maps of the frames.
+    resample : `list`, optional
+        The fraction of the size of the maps to resample the frames to.
+    maxsize : `int`
+        The most frames to keep.
+    prefetch : `int`
+        The number of frames to compute ahead.
+    """
+    def __init__(self, maps, resample=None, maxsize=32, prefetch=4):
+        self.maps = maps
+        self.dimensions = None
+        if resample:
+            self.dimensions = u.Quantity(maps[0].dimensions) * np.array(resample)
+        self.maxsize = maxsize
+        self.prefetch_count = min(prefetch, maxsize)
+        self._frames = OrderedDict()
+        self._pending = {}
+        self._queue = deque()
+        self._lock = RLock()
+        self._worker = None
+
+    def _compute(self, i):
+        amap = self.maps[i]
+        data = amap.data
+        if self.dimensions is not None:
+            # As GenericMap.resample, without the new metadata
+            data = sunpy_image_resample(data.T, self.dimensions, 'linear', center=True).T
+        norm = deepcopy(amap.plot_settings['norm'])
+        # The following explicit call is for bugged versions of Astropy's ImageNormalize
+        norm.autoscale_None(data)
+        return data, norm
+
+    def _store(self, i, frame):
+        with self._lock:
+            self._frames[i] = frame
+            self._frames.move_to_end(i)
+            self._pending.pop(i, None)
+            while len(self._frames) > self.maxsize:
+                self._frames.popitem(last=False)
+        return frame
+
+    def __getitem__(self, i):
+        """
+        The image data and a copy of the normalisation of frame ``i``.
+        """
+        with self._lock:
+            frame = self._frames.get(i)
+            if frame is not None:
+                self._frames.move_to_end(i)
+            future = self._pending.pop(i, None)
+        if frame is None:
+            frame = self._store(i, future.result() if future else self._compute(i))
+        data, norm = frame
+        return data, deepcopy(norm)
+
+    def prefetch(self, i):
+        """
+        Compute the frames after frame ``i`` in a background thread.
+        """
+        if not self.prefetch_count:
+            return
+        with self._lock:
+            for j in range(i + 1, i + 1 + self.prefetch_count):
+                j %= len(self.maps)
+                if j not in self._frames and j not in self._pending:
+                    self._pending[j] = Future()
+                    self._queue.append((j, self._pending[j]))
+            if self._queue and self._worker is None:
+                self._worker = Thread(target=self._prefetch_queued, daemon=True)
+                self._worker.start()
+
+    def _prefetch_queued(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._worker = None
+                    return
+                i, future = self._queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self._store(i, self._compute(i)))
+            except Exception as e:
+                future.set_exception(e)
+
+    def close(self):
+        """
+        Drop the frames waiting to be computed in the background.
+        """
+        with self._lock:
+            while self._queue:
+                i, future = self._queue.popleft()
+                future.cancel()
+                self._pending.pop(i, None)
+
+
 class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
     """
     Create an interactive viewer for a MapSequence
@@ -45,16 +161,34 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
         Any objects returned from this function will have their `remove()` method
         called at the start of the next frame to clear them from the plot.
 
+    resample : `list`, optional
+        Draws the maps at a lower resolution to increase the speed of
+        animation. Specify a list as a fraction i.e. [0.25, 0.25] to
+        plot at 1/4 resolution. The maps must all be the same size.
+
+    cache_size : `int`
+        The number of frames to keep ready to draw.
+
+    prefetch : `int`
+        The number of frames after the current one to prepare in a background
+        thread.
+
     Notes
     -----
     Extra keywords are passed to `mapsequence[0].plot()` i.e. the `plot()` routine of
     the maps in the sequence.
     """
 
-    def __init__(self, mapsequence, annotate=True, **kwargs):
+    def __init__(self, mapsequence, annotate=True, resample=None, cache_size=32, prefetch=4,
+                 **kwargs):
+
+        if resample and not mapsequence.all_maps_same_shape():
+            raise ValueError('Maps in mapsequence do not all have the same shape.')
 
         self.mapsequence = mapsequence
         self.annotate = annotate
+        self.frames = _MapFrameCache(mapsequence.maps, resample=resample,
+                                     maxsize=cache_size, prefetch=prefetch)
         self.user_plot_function = kwargs.pop('plot_function',
                                              lambda fig, ax, smap: [])
         # List of object to remove at the start of each plot step
@@ -64,6 +198,7 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
 
         imageanimator.BaseFuncAnimator.__init__(
             self, mapsequence.maps, slider_functions, slider_ranges, **kwargs)
+        self.fig.canvas.mpl_connect('close_event', lambda event: self.frames.close())
 
         if annotate:
             self._annotate_plot(0)
@@ -75,12 +210,10 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
             self.remove_obj.pop(0).remove()
 
         i = int(val)
-        im.set_array(self.data[i].data)
+        data, norm = self.frames[i]
+        self.frames.prefetch(i)
+        im.set_data(data)
         im.set_cmap(self.mapsequence[i].plot_settings['cmap'])
-
-        norm = deepcopy(self.mapsequence[i].plot_settings['norm'])
-        # The following explicit call is for bugged versions of Astropy's ImageNormalize
-        norm.autoscale_None(self.data[i].data)
         im.set_norm(norm)
 
         if wcsaxes_compat.is_wcsaxes(im.axes):
@@ -125,6 +258,11 @@ class MapSequenceAnimator(imageanimator.BaseFuncAnimator):
     def plot_start_image(self, ax):
         im = self.mapsequence[0].plot(
             annotate=self.annotate, axes=ax, **self.imshow_kwargs)
+        if self.frames.dimensions is not None:
+            data, norm = self.frames[0]
+            im.set_data(data)
+            im.set_norm(norm)
+        self.frames.prefetch(0)
         self.remove_obj += list(
             self.user_plot_function(self.fig, self.axes, self.mapsequence[0]))
         return im
@@ -55,3 +55,64 @@ def funcanimator():
 def test_to_anim(funcanimator):
     ani = funcanimator.get_animation()
     assert isinstance(ani, mplanim.FuncAnimation)
+
+
+def _animator(**kwargs):
+    data = np.arange(300.).reshape((3, 10, 10))
+    func = partial(update_plotval, data=data)
+    return FuncAnimatorTest(data, [func], [(0, 3)], fig=plt.figure(), **kwargs)
+
+
+def test_blit_matches_full_draw():
+    full = _animator()
+    blitted = _animator(blit=True)
+    for animator in (full, blitted):
+        animator.fig.canvas.draw()
+
+    draws = []
+    blitted.fig.canvas.mpl_connect('draw_event', draws.append)
+    blitted._step(blitted.sliders[0]._slider)
+    full._step(full.sliders[0]._slider)
+    assert not draws
+    assert np.array_equal(blitted.im.get_array(), full.im.get_array())
+    assert np.array_equal(np.asarray(blitted.fig.canvas.buffer_rgba()),
+                          np.asarray(full.fig.canvas.buffer_rgba()))
+
+
+def test_frame_rate():
+    rates = []
+    animator = _animator(blit=True, fps_callback=rates.append)
+    assert animator.frame_rate == 0
+    for _ in range(3):
+        animator._step(animator.sliders[0]._slider)
+    assert len(rates) == 3
+    assert rates[-1] == animator.frame_rate > 0
+
+
+def test_max_fps():
+    animator = _animator(max_fps=1e-3)
+    slider = animator.sliders[0]._slider
+    slider.set_val(1)
+    slider.set_val(2)
+    slider.set_val(0)
+    # Only the latest of the throttled changes is applied
+    assert np.array_equal(animator.im.get_array(), animator.data[1])
+    assert animator._pending_update == (0, slider)
+    animator._update_pending()
+    assert np.array_equal(animator.im.get_array(), animator.data[0])
+    assert animator._pending_update is None
+
+
+@pytest.mark.parametrize('blit', (False, True))
+def test_max_fps_redraws(blit):
+    animator = _animator(max_fps=1e-3, blit=blit)
+    animator.fig.canvas.draw()
+    slider = animator.sliders[0]._slider
+    slider.set_val(1)
+    slider.set_val(2)
+    draws = []
+    animator.fig.canvas.mpl_connect('draw_event', draws.append)
+    animator._update_pending()
+    # The deferred frame is drawn, by a full redraw unless blitting
+    assert np.array_equal(animator.im.get_array(), animator.data[2])
+    assert len(draws) == (0 if blit else 1)
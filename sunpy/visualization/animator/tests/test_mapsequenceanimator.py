@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import os
+
+import numpy as np
+import pytest
+
+from matplotlib.backend_bases import CloseEvent
+
+import astropy.units as u
+
+import sunpy.map
+import sunpy.data.test
+from sunpy.visualization.animator import MapSequenceAnimator
+from sunpy.visualization.animator.mapsequenceanimator import _MapFrameCache
+
+
+@pytest.fixture
+def mapsequence():
+    aia_map = sunpy.map.Map(os.path.join(sunpy.data.test.rootdir, "aia_171_level1.fits"))
+    return sunpy.map.Map([sunpy.map.Map(aia_map.data * (i + 1), aia_map.meta) for i in range(4)],
+                         sequence=True)
+
+
+def test_frame_cache(mapsequence):
+    frames = _MapFrameCache(mapsequence.maps, maxsize=2, prefetch=1)
+    for i in range(3):
+        data, norm = frames[i]
+        assert data is mapsequence[i].data
+        assert norm.vmin == data.min() and norm.vmax == data.max()
+        assert norm is not mapsequence[i].plot_settings['norm']
+    assert list(frames._frames) == [1, 2]
+
+    frames.prefetch(2)
+    worker = frames._worker
+    if worker is not None:
+        worker.join()
+    assert list(frames._frames) == [2, 3]
+    assert not frames._pending
+    # The background thread exits once there is nothing left to compute
+    assert frames._worker is None
+
+
+def test_frame_cache_close(mapsequence):
+    frames = _MapFrameCache(mapsequence.maps, prefetch=2)
+    # Hold the lock so the background thread can't start on the frames
+    with frames._lock:
+        frames.prefetch(0)
+        assert list(frames._pending) == [1, 2]
+        frames.close()
+        assert not frames._pending
+        worker = frames._worker
+    worker.join()
+    assert frames._worker is None
+    assert not frames._frames
+
+
+def test_mapsequence_animator_close(mapsequence, monkeypatch):
+    animator = mapsequence.peek()
+    closed = []
+    monkeypatch.setattr(animator.frames, 'close', lambda: closed.append(True))
+    animator.fig.canvas.callbacks.process(
+        'close_event', CloseEvent('close_event', animator.fig.canvas))
+    assert closed
+
+
+def test_frame_cache_resample(mapsequence):
+    frames = _MapFrameCache(mapsequence.maps, resample=[0.5, 0.5])
+    dimensions = u.Quantity(mapsequence[1].dimensions) * 0.5
+    assert np.array_equal(frames[1][0], mapsequence[1].resample(dimensions).data)
+
+
+@pytest.mark.parametrize('resample', [None, [0.5, 0.5]])
+def test_mapsequence_animator_frames(mapsequence, resample):
+    animator = mapsequence.peek(resample=resample)
+    assert isinstance(animator, MapSequenceAnimator)
+    im = animator.im
+    extent = im.get_extent()
+    animator.updatefig(2, im, animator.sliders[0]._slider)
+    data, norm = animator.frames[2]
+    assert np.array_equal(im.get_array(), data)
+    assert im.norm.vmax == norm.vmax
+    assert im.get_extent() == extent
+    if resample:
+        assert im.get_array().shape == tuple(np.array(mapsequence[0].data.shape) // 2)